@@ -4,15 +4,22 @@ Oracle Autonomous Database Connection Module
 This module provides a Database class for connecting to Oracle Autonomous Database
 using wallet-based authentication. It handles wallet extraction, connection management,
 and provides methods for executing queries and managing transactions.
+
+An AsyncDatabase counterpart built on the oracledb asyncio API is provided for
+the async FastAPI routes, backed by a process-wide AsyncDatabasePool.
 """
 
 import os
+import re
+import time
 import zipfile
 import tempfile
 import shutil
-from typing import Optional, List, Dict, Any, Union
+import threading
+import weakref
+from typing import Optional, List, Dict, Any, Union, Iterator, AsyncIterator
 import logging
-from contextlib import contextmanager
+from contextlib import contextmanager, asynccontextmanager
 
 try:
     import oracledb
@@ -23,14 +30,369 @@ except ImportError:
 
 from dotenv import load_dotenv
 
+from .query_metrics import record_statement
+
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _load_credentials() -> Dict[str, Any]:
+    """
+    Read database credentials and connection settings from the environment.
+    
+    Returns:
+        Dict[str, Any]: Credentials and service settings
+        
+    Raises:
+        ValueError: If a required credential is missing
+    """
+    credentials = {
+        'db_user': os.getenv('DB_USER'),
+        'db_password': os.getenv('DB_PASSWORD'),
+        'wallet_password': os.getenv('WALLET_PASSWORD'),
+        'db_service_name': os.getenv('DB_SERVICE_NAME', 'high'),
+        'db_host': os.getenv('DB_HOST', 'localhost'),
+        'db_port': int(os.getenv('DB_PORT', '1522')),
+        # Database Resident Connection Pooling: DB_SERVER_TYPE=pooled shares
+        # server processes between the pools of every worker and node
+        'db_server_type': os.getenv('DB_SERVER_TYPE', 'dedicated').lower(),
+        'db_connection_class': os.getenv('DB_CONNECTION_CLASS', 'ORO_BACKEND'),
+        'db_purity': os.getenv('DB_PURITY', 'self').lower(),
+        'db_session_settings': os.getenv('DB_SESSION_SETTINGS', ''),
+        # Statements kept open per connection; should exceed the number of
+        # statement shapes the application runs (see services/query_builder.py)
+        'db_stmt_cache_size': int(os.getenv('DB_STMT_CACHE_SIZE', '64')),
+    }
+    
+    # Validate required credentials
+    if not all([credentials['db_user'], credentials['db_password'], credentials['wallet_password']]):
+        raise ValueError(
+            "Missing required environment variables: DB_USER, DB_PASSWORD, WALLET_PASSWORD"
+        )
+    
+    return credentials
+
+
+DB_PURITIES = {
+    'default': oracledb.PURITY_DEFAULT,
+    'new': oracledb.PURITY_NEW,
+    'self': oracledb.PURITY_SELF
+}
+
+_SESSION_PARAMETER = re.compile(r"^[A-Z][A-Z0-9_]*$")
+
+
+def drcp_params(credentials: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the connect/create_pool arguments selecting the server type.
+    
+    Args:
+        credentials (Dict[str, Any]): Settings returned by _load_credentials
+        
+    Returns:
+        Dict[str, Any]: server_type, cclass and purity for DRCP, or an empty
+        dictionary for dedicated servers
+        
+    Raises:
+        ValueError: If the server type or purity is unknown
+    """
+    server_type = credentials['db_server_type']
+    if server_type == 'dedicated':
+        return {}
+    if server_type != 'pooled':
+        raise ValueError(f"Invalid DB_SERVER_TYPE: {server_type}. Must be one of dedicated, pooled")
+    if credentials['db_purity'] not in DB_PURITIES:
+        raise ValueError(f"Invalid DB_PURITY: {credentials['db_purity']}. Must be one of {', '.join(DB_PURITIES)}")
+    
+    return {
+        'server_type': 'pooled',
+        'cclass': credentials['db_connection_class'],
+        'purity': DB_PURITIES[credentials['db_purity']]
+    }
+
+
+def pooled_dsn(dsn: str) -> str:
+    """
+    Request a DRCP pooled server in a connect descriptor.
+    
+    The descriptors read from the wallet's tnsnames.ora do not name a server
+    type, so (SERVER=POOLED) is added to their CONNECT_DATA.
+    
+    Args:
+        dsn (str): Connect descriptor or alias
+        
+    Returns:
+        str: Descriptor requesting a pooled server (unchanged if it already
+        names a server type or has no CONNECT_DATA)
+    """
+    if re.search(r"\(\s*SERVER\s*=", dsn, re.IGNORECASE):
+        return dsn
+    return re.sub(r"\(\s*CONNECT_DATA\s*=", "(CONNECT_DATA=(SERVER=POOLED)", dsn, count=1, flags=re.IGNORECASE)
+
+
+def session_tag(settings: str) -> Optional[str]:
+    """
+    Normalize DB_SESSION_SETTINGS into a connection tag.
+    
+    Args:
+        settings (str): Semicolon-separated session parameters,
+            e.g. "TIME_ZONE=UTC;NLS_SORT=BINARY"
+            
+    Returns:
+        Optional[str]: Tag in the form "NAME=value;NAME=value" with the names
+        uppercased and sorted, or None if no settings are configured
+        
+    Raises:
+        ValueError: If a setting is not NAME=value with a valid parameter name
+    """
+    parameters = {}
+    for setting in filter(None, (part.strip() for part in settings.split(';'))):
+        name, separator, value = setting.partition('=')
+        name = name.strip().upper()
+        if not separator or not _SESSION_PARAMETER.match(name):
+            raise ValueError(f"Invalid DB_SESSION_SETTINGS entry: {setting}")
+        parameters[name] = value.strip()
+    
+    if not parameters:
+        return None
+    return ";".join(f"{name}={parameters[name]}" for name in sorted(parameters))
+
+
+def session_statements(tag: Optional[str]) -> List[str]:
+    """
+    Build the ALTER SESSION statements that establish the state a tag names.
+    
+    Args:
+        tag (Optional[str]): Tag returned by session_tag
+        
+    Returns:
+        List[str]: One statement per session parameter
+    """
+    statements = []
+    for setting in filter(None, (tag or "").split(';')):
+        name, _, value = setting.partition('=')
+        escaped = value.replace("'", "''")
+        statements.append(f"ALTER SESSION SET {name} = '{escaped}'")
+    return statements
+
+
+def init_session(connection, requested_tag: str) -> None:
+    """
+    Pool session callback: set the session state named by the requested tag.
+    
+    Called by the pool only when the acquired session does not carry the tag
+    yet (a new session, or a DRCP server last used with other settings), so
+    sessions already in that state are handed out without any ALTER SESSION.
+    
+    Args:
+        connection: Connection being acquired
+        requested_tag (str): Tag passed to acquire()
+    """
+    with connection.cursor() as cursor:
+        for statement in session_statements(requested_tag):
+            cursor.execute(statement)
+    connection.tag = requested_tag
+
+
+async def init_session_async(connection, requested_tag: str) -> None:
+    """
+    Async pool session callback; see init_session.
+    
+    Args:
+        connection: Connection being acquired
+        requested_tag (str): Tag passed to acquire()
+    """
+    with connection.cursor() as cursor:
+        for statement in session_statements(requested_tag):
+            await cursor.execute(statement)
+    connection.tag = requested_tag
+
+# Parse and execute counters of the current session (needs SELECT on V$MYSTAT
+# and V$STATNAME, which Autonomous Database grants to database users)
+SESSION_PARSE_STATS_QUERY = """
+    SELECT sn.name, ms.value
+    FROM V$MYSTAT ms
+    JOIN V$STATNAME sn ON sn.statistic# = ms.statistic#
+    WHERE sn.name IN ('parse count (total)', 'parse count (hard)', 'execute count',
+                      'session cursor cache hits')
+"""
+
+
+def parse_stats(rows: List[tuple]) -> Dict[str, Any]:
+    """
+    Summarize the rows of SESSION_PARSE_STATS_QUERY.
+    
+    Args:
+        rows (List[tuple]): (statistic name, value) rows
+        
+    Returns:
+        Dict[str, Any]: Counters plus parse/execute and hard/total parse ratios;
+        with a working statement cache, parses stay well below executions
+    """
+    values = {name: int(value) for name, value in rows}
+    executions = values.get('execute count', 0)
+    parses = values.get('parse count (total)', 0)
+    hard_parses = values.get('parse count (hard)', 0)
+    
+    return {
+        "executions": executions,
+        "parses": parses,
+        "hard_parses": hard_parses,
+        "session_cursor_cache_hits": values.get('session cursor cache hits', 0),
+        "parse_execute_ratio": round(parses / executions, 4) if executions else None,
+        "hard_parse_ratio": round(hard_parses / parses, 4) if parses else None
+    }
+
+
+def extract_wallet(wallet_path: str) -> str:
+    """
+    Extract an Oracle wallet zip file to a new temporary directory.
+    
+    Args:
+        wallet_path (str): Path to the Oracle wallet zip file
+        
+    Returns:
+        str: Path of the directory the wallet was extracted to
+    """
+    if not os.path.exists(wallet_path):
+        raise FileNotFoundError(f"Wallet file not found: {wallet_path}")
+    
+    # Create temporary directory for wallet extraction
+    wallet_dir = tempfile.mkdtemp(prefix="oracle_wallet_")
+    
+    try:
+        with zipfile.ZipFile(wallet_path, 'r') as zip_ref:
+            zip_ref.extractall(wallet_dir)
+        logger.info("Wallet extracted to: %s", wallet_dir)
+    except Exception as e:
+        logger.error("Failed to extract wallet: %s", e)
+        shutil.rmtree(wallet_dir, ignore_errors=True)
+        raise
+    
+    return wallet_dir
+
+
+def resolve_dsn(wallet_dir: str, db_service_name: str) -> str:
+    """
+    Resolve the connection descriptor for a service from the wallet's tnsnames.ora.
+    
+    Args:
+        wallet_dir (str): Directory containing the extracted wallet
+        db_service_name (str): Service name (or suffix such as 'high')
+        
+    Returns:
+        str: Oracle connection string (DSN)
+    """
+    # Find the tnsnames.ora file in the extracted wallet
+    tnsnames_path = os.path.join(wallet_dir, 'tnsnames.ora')
+    
+    if not os.path.exists(tnsnames_path):
+        raise FileNotFoundError("tnsnames.ora not found in wallet")
+    
+    # Read tnsnames.ora to get the connection string
+    with open(tnsnames_path, 'r') as f:
+        tnsnames_content = f.read()
+    
+    # Try to find the specific service name first, then fall back to _high
+    target_service = db_service_name
+    if not target_service or target_service == 'high':
+        target_service = '_high'
+    
+    # Look for service entries that end with the target service name
+    pattern = rf'(\w+{re.escape(target_service)})\s*=\s*\((.*?)\)\s*$'
+    service_match = re.search(pattern, tnsnames_content, re.DOTALL | re.MULTILINE)
+    
+    if not service_match:
+        # Fallback: look for any service ending with _high
+        pattern = r'(\w+_high)\s*=\s*\((.*?)\)\s*$'
+        service_match = re.search(pattern, tnsnames_content, re.DOTALL | re.MULTILINE)
+    
+    if not service_match:
+        # Fallback: get the first service found
+        pattern = r'(\w+)\s*=\s*\((.*?)\)\s*$'
+        service_match = re.search(pattern, tnsnames_content, re.DOTALL | re.MULTILINE)
+    
+    if service_match:
+        service_name = service_match.group(1)
+        description = service_match.group(2)
+        logger.info("Using service: %s", service_name)
+        # Return the full DSN string
+        return f"({description})"
+    else:
+        # Fallback to service name only
+        return db_service_name
+
+
+# Database object types (e.g. MDSYS.SDO_GEOMETRY) looked up per connection
+_type_cache: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _first_returned_value(var) -> Any:
+    """
+    Get the value a DML RETURNING bind variable received for the first row.
+    
+    Args:
+        var: oracledb bind variable used in a RETURNING ... INTO clause
+        
+    Returns:
+        Any: Returned value, or None if no row was affected
+    """
+    value = var.getvalue()
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+# Rows fetched per round trip by iter_query unless overridden
+DEFAULT_FETCH_BATCH_SIZE = 1000
+
+# Batch formats yielded by iter_query
+ROW_FORMATS = ('dict', 'tuple', 'columnar')
+
+
+def _format_batch(columns: List[str], rows: List[tuple], row_format: str) -> Union[List[Any], Dict[str, List[Any]]]:
+    """
+    Shape a fetched batch of rows for iter_query.
+    
+    Args:
+        columns: Column names from the cursor description
+        rows: Row tuples returned by fetchmany()
+        row_format: 'dict' (list of dictionaries), 'tuple' (list of row tuples)
+            or 'columnar' (dictionary of column name to list of values, ready
+            for numpy.asarray)
+        
+    Returns:
+        The formatted batch
+    """
+    if row_format == 'tuple':
+        return rows
+    if row_format == 'columnar':
+        return dict(zip(columns, map(list, zip(*rows))))
+    return [dict(zip(columns, row)) for row in rows]
+
+
+def _prepare_stream_cursor(cursor, batch_size: int, prefetch_rows: Optional[int], row_format: str) -> None:
+    """
+    Tune a cursor for iter_query before the statement is executed.
+    
+    Args:
+        cursor: oracledb cursor
+        batch_size: Rows fetched per round trip (cursor.arraysize)
+        prefetch_rows: Rows returned with the execute round trip (default: batch_size)
+        row_format: Requested batch format
+        
+    Raises:
+        ValueError: If the batch format is unknown
+    """
+    if row_format not in ROW_FORMATS:
+        raise ValueError(f"Unknown row format '{row_format}'. Use one of: {', '.join(ROW_FORMATS)}")
+    
+    cursor.arraysize = batch_size
+    cursor.prefetchrows = prefetch_rows if prefetch_rows is not None else batch_size
+
+
 class Database:
     """
     Oracle Autonomous Database connection manager using wallet authentication.
@@ -39,30 +401,35 @@ class Database:
     methods for executing SQL queries and managing database transactions.
     """
     
-    def __init__(self, wallet_path: str = "db/wallet_oro.zip"):
+    def __init__(self, wallet_path: str = "db/wallet_oro.zip", pool: Optional["DatabasePool"] = None):
         """
         Initialize the Database instance.
         
         Args:
             wallet_path (str): Path to the Oracle wallet zip file
+            pool (DatabasePool, optional): Connection pool to borrow connections from.
+                When given, the wallet and credentials are owned by the pool and
+                connect()/disconnect() acquire and release a pooled connection.
         """
         self.wallet_path = wallet_path
         self.wallet_dir = None
         self.connection = None
+        self.pool = pool
+        
+        if self.pool is not None:
+            return
         
         # Load database credentials from environment
-        self.db_user = os.getenv('DB_USER')
-        self.db_password = os.getenv('DB_PASSWORD')
-        self.wallet_password = os.getenv('WALLET_PASSWORD')
-        self.db_service_name = os.getenv('DB_SERVICE_NAME', 'high')
-        self.db_host = os.getenv('DB_HOST', 'localhost')
-        self.db_port = int(os.getenv('DB_PORT', '1522'))
-        
-        # Validate required credentials
-        if not all([self.db_user, self.db_password, self.wallet_password]):
-            raise ValueError(
-                "Missing required environment variables: DB_USER, DB_PASSWORD, WALLET_PASSWORD"
-            )
+        credentials = _load_credentials()
+        self.db_user = credentials['db_user']
+        self.db_password = credentials['db_password']
+        self.wallet_password = credentials['wallet_password']
+        self.db_service_name = credentials['db_service_name']
+        self.db_host = credentials['db_host']
+        self.db_port = credentials['db_port']
+        self.drcp_params = drcp_params(credentials)
+        self.session_tag = session_tag(credentials['db_session_settings'])
+        self.stmt_cache_size = credentials['db_stmt_cache_size']
         
         # Extract wallet if needed
         self._extract_wallet()
@@ -71,19 +438,7 @@ class Database:
         """
         Extract the Oracle wallet zip file to a temporary directory.
         """
-        if not os.path.exists(self.wallet_path):
-            raise FileNotFoundError(f"Wallet file not found: {self.wallet_path}")
-        
-        # Create temporary directory for wallet extraction
-        self.wallet_dir = tempfile.mkdtemp(prefix="oracle_wallet_")
-        
-        try:
-            with zipfile.ZipFile(self.wallet_path, 'r') as zip_ref:
-                zip_ref.extractall(self.wallet_dir)
-            logger.info(f"Wallet extracted to: {self.wallet_dir}")
-        except Exception as e:
-            logger.error(f"Failed to extract wallet: {e}")
-            raise
+        self.wallet_dir = extract_wallet(self.wallet_path)
     
     def _get_connection_string(self) -> str:
         """
@@ -92,80 +447,55 @@ class Database:
         Returns:
             str: Oracle connection string (DSN)
         """
-        # Find the tnsnames.ora file in the extracted wallet
-        tnsnames_path = os.path.join(self.wallet_dir, 'tnsnames.ora')
-        
-        if not os.path.exists(tnsnames_path):
-            raise FileNotFoundError("tnsnames.ora not found in wallet")
-        
-        # Read tnsnames.ora to get the connection string
-        with open(tnsnames_path, 'r') as f:
-            tnsnames_content = f.read()
-        
-        # Extract the full connection string from tnsnames.ora
-        # Look for the service name and its description
-        import re
-        
-        # Try to find the specific service name first, then fall back to _high
-        target_service = self.db_service_name
-        if not target_service or target_service == 'high':
-            target_service = '_high'
-        
-        # Look for service entries that end with the target service name
-        pattern = rf'(\w+{re.escape(target_service)})\s*=\s*\((.*?)\)\s*$'
-        service_match = re.search(pattern, tnsnames_content, re.DOTALL | re.MULTILINE)
-        
-        if not service_match:
-            # Fallback: look for any service ending with _high
-            pattern = r'(\w+_high)\s*=\s*\((.*?)\)\s*$'
-            service_match = re.search(pattern, tnsnames_content, re.DOTALL | re.MULTILINE)
-        
-        if not service_match:
-            # Fallback: get the first service found
-            pattern = r'(\w+)\s*=\s*\((.*?)\)\s*$'
-            service_match = re.search(pattern, tnsnames_content, re.DOTALL | re.MULTILINE)
-        
-        if service_match:
-            service_name = service_match.group(1)
-            description = service_match.group(2)
-            logger.info(f"Using service: {service_name}")
-            # Return the full DSN string
-            return f"({description})"
-        else:
-            # Fallback to service name only
-            return self.db_service_name
+        return resolve_dsn(self.wallet_dir, self.db_service_name)
     
     def connect(self) -> None:
         """
         Establish connection to the Oracle Autonomous Database.
+        
+        If the instance was created with a pool, a connection is acquired
+        from the pool instead of opening a new session.
         """
+        if self.pool is not None:
+            self.connection = self.pool.acquire()
+            return
+        
         try:
             # Get connection string (DSN)
             dsn = self._get_connection_string()
+            if self.drcp_params:
+                dsn = pooled_dsn(dsn)
             
             # Establish connection using thin mode with wallet
             self.connection = oracledb.connect(
                 user=self.db_user,
                 password=self.db_password,
                 dsn=dsn,
-                config_dir=self.wallet_dir
+                config_dir=self.wallet_dir,
+                stmtcachesize=self.stmt_cache_size,
+                **self.drcp_params
             )
+            if self.session_tag:
+                init_session(self.connection, self.session_tag)
             logger.info("Successfully connected to Oracle Autonomous Database using thin mode with wallet")
             
         except Exception as e:
-            logger.error(f"Failed to connect to database: {e}")
+            logger.error("Failed to connect to database: %s", e)
             raise
     
     def disconnect(self) -> None:
         """
-        Close the database connection.
+        Close the database connection, or release it back to the pool.
         """
         if self.connection:
             try:
-                self.connection.close()
-                logger.info("Database connection closed")
+                if self.pool is not None:
+                    self.pool.release(self.connection)
+                else:
+                    self.connection.close()
+                    logger.info("Database connection closed")
             except Exception as e:
-                logger.error(f"Error closing connection: {e}")
+                logger.error("Error closing connection: %s", e)
             finally:
                 self.connection = None
     
@@ -184,6 +514,7 @@ class Database:
             raise RuntimeError("Database not connected. Call connect() first.")
         
         try:
+            start = time.perf_counter()
             cursor = self.connection.cursor()
             
             if params:
@@ -201,21 +532,80 @@ class Database:
             results = [dict(zip(columns, row)) for row in rows]
             
             cursor.close()
-            logger.info(f"Query executed successfully, returned {len(results)} rows")
+            record_statement(query, time.perf_counter() - start, len(results))
             
             return results
             
         except Exception as e:
-            logger.error(f"Error executing query: {e}")
+            logger.error("Error executing query: %s", e)
+            raise
+    
+    def iter_query(self, query: str, params: Optional[Dict[str, Any]] = None,
+                   batch_size: int = DEFAULT_FETCH_BATCH_SIZE, prefetch_rows: Optional[int] = None,
+                   row_format: str = 'dict') -> Iterator[Union[List[Any], Dict[str, List[Any]]]]:
+        """
+        Execute a SELECT query and yield its results batch by batch.
+        
+        Unlike execute_query, only one batch is held in memory at a time, so
+        large result sets (e.g. every detection of a report) can be streamed.
+        The connection must stay open until the generator is exhausted or closed.
+        
+        Args:
+            query (str): SQL SELECT query
+            params (Dict[str, Any], optional): Query parameters
+            batch_size (int): Rows fetched per round trip (cursor.arraysize)
+            prefetch_rows (int, optional): Rows returned with the execute round trip
+                (cursor.prefetchrows, default: batch_size)
+            row_format (str): 'dict', 'tuple' or 'columnar' (see _format_batch)
+            
+        Yields:
+            One formatted batch of at most batch_size rows per round trip
+        """
+        if not self.connection:
+            raise RuntimeError("Database not connected. Call connect() first.")
+        
+        cursor = self.connection.cursor()
+        try:
+            _prepare_stream_cursor(cursor, batch_size, prefetch_rows, row_format)
+            
+            # Only time spent in the database counts, not time spent by the consumer
+            start = time.perf_counter()
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            db_seconds = time.perf_counter() - start
+            
+            columns = [desc[0] for desc in cursor.description] if cursor.description else []
+            
+            total_rows = 0
+            while True:
+                start = time.perf_counter()
+                rows = cursor.fetchmany()
+                db_seconds += time.perf_counter() - start
+                if not rows:
+                    break
+                total_rows += len(rows)
+                yield _format_batch(columns, rows, row_format)
+            
+            record_statement(query, db_seconds, total_rows)
+            
+        except Exception as e:
+            logger.error("Error executing streaming query: %s", e)
             raise
+        finally:
+            cursor.close()
     
-    def execute_update(self, query: str, params: Optional[Dict[str, Any]] = None) -> int:
+    def execute_update(self, query: str, params: Optional[Dict[str, Any]] = None,
+                       input_sizes: Optional[Dict[str, Any]] = None) -> int:
         """
         Execute an INSERT, UPDATE, or DELETE query.
         
         Args:
             query (str): SQL query
             params (Dict[str, Any], optional): Query parameters
+            input_sizes (Dict[str, Any], optional): Bind names mapped to their oracledb type,
+                e.g. DB_TYPE_JSON to bind Python objects as native JSON
             
         Returns:
             int: Number of affected rows
@@ -224,7 +614,10 @@ class Database:
             raise RuntimeError("Database not connected. Call connect() first.")
         
         try:
+            start = time.perf_counter()
             cursor = self.connection.cursor()
+            if input_sizes:
+                cursor.setinputsizes(**input_sizes)
             
             if params:
                 cursor.execute(query, params)
@@ -235,12 +628,12 @@ class Database:
             self.connection.commit()
             
             cursor.close()
-            logger.info(f"Update query executed successfully, affected {affected_rows} rows")
+            record_statement(query, time.perf_counter() - start, affected_rows)
             
             return affected_rows
             
         except Exception as e:
-            logger.error(f"Error executing update query: {e}")
+            logger.error("Error executing update query: %s", e)
             self.connection.rollback()
             raise
     
@@ -259,6 +652,7 @@ class Database:
             raise RuntimeError("Database not connected. Call connect() first.")
         
         try:
+            start = time.perf_counter()
             cursor = self.connection.cursor()
             cursor.executemany(query, params_list)
             
@@ -266,15 +660,137 @@ class Database:
             self.connection.commit()
             
             cursor.close()
-            logger.info(f"Batch query executed successfully, affected {affected_rows} rows")
+            record_statement(query, time.perf_counter() - start, affected_rows)
             
             return affected_rows
             
         except Exception as e:
-            logger.error(f"Error executing batch query: {e}")
+            logger.error("Error executing batch query: %s", e)
+            self.connection.rollback()
+            raise
+    
+    def execute_batch(self, query: str, params_list: List[Dict[str, Any]],
+                      returning: Optional[Dict[str, Any]] = None,
+                      input_sizes: Optional[Dict[str, Any]] = None,
+                      batch_errors: bool = False, commit: bool = True) -> Dict[str, Any]:
+        """
+        Execute a DML statement once per parameter set in a single round trip.
+        
+        With batch_errors, rows that fail (e.g. constraint violations) are
+        reported instead of aborting the whole batch. With returning, the
+        values of a RETURNING ... INTO clause are collected for every row.
+        
+        Args:
+            query (str): SQL query, optionally ending in RETURNING ... INTO :name, ...
+            params_list (List[Dict[str, Any]]): List of parameter dictionaries
+            returning (Dict[str, Any], optional): Output bind names mapped to their oracledb type
+            input_sizes (Dict[str, Any], optional): Input bind names mapped to their oracledb type
+            batch_errors (bool): Collect per-row errors instead of failing the batch
+            commit (bool): Commit after the batch
+            
+        Returns:
+            Dict[str, Any]: 'rowcount', 'returned' (output bind name mapped to one
+            value per input row, None for failed rows) and 'errors' (list of
+            (row offset, message) tuples)
+        """
+        if not self.connection:
+            raise RuntimeError("Database not connected. Call connect() first.")
+        
+        try:
+            start = time.perf_counter()
+            cursor = self.connection.cursor()
+            out_vars = {
+                name: cursor.var(bind_type, arraysize=len(params_list))
+                for name, bind_type in (returning or {}).items()
+            }
+            if input_sizes or out_vars:
+                cursor.setinputsizes(**(input_sizes or {}), **out_vars)
+            
+            cursor.executemany(query, params_list, batcherrors=batch_errors)
+            
+            errors = [(error.offset, error.message) for error in cursor.getbatcherrors()] if batch_errors else []
+            affected_rows = cursor.rowcount
+            returned = {
+                name: [next(iter(var.getvalue(i)), None) for i in range(len(params_list))]
+                for name, var in out_vars.items()
+            }
+            
+            if commit:
+                self.connection.commit()
+            
+            cursor.close()
+            record_statement(query, time.perf_counter() - start, affected_rows)
+            if errors:
+                logger.warning("Batch query rejected %s of %s rows", len(errors), len(params_list))
+            
+            return {'rowcount': affected_rows, 'returned': returned, 'errors': errors}
+            
+        except Exception as e:
+            logger.error("Error executing batch query: %s", e)
+            self.connection.rollback()
+            raise
+    
+    def execute_returning(self, query: str, params: Dict[str, Any], returning: Dict[str, Any],
+                          input_sizes: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Execute an INSERT or UPDATE with a RETURNING ... INTO clause and commit it.
+        
+        The commit is piggybacked on the execute call, so the statement and the
+        values it generates (e.g. identity columns) cost a single round trip.
+        
+        Args:
+            query (str): SQL query ending in RETURNING ... INTO :name, ...
+            params (Dict[str, Any]): Input bind parameters
+            returning (Dict[str, Any]): Output bind names mapped to their oracledb type
+            input_sizes (Dict[str, Any], optional): Input bind names mapped to their oracledb type
+            
+        Returns:
+            Dict[str, Any]: Output bind names mapped to the value returned for the first row
+        """
+        if not self.connection:
+            raise RuntimeError("Database not connected. Call connect() first.")
+        
+        try:
+            start = time.perf_counter()
+            cursor = self.connection.cursor()
+            if input_sizes:
+                cursor.setinputsizes(**input_sizes)
+            out_vars = {name: cursor.var(bind_type) for name, bind_type in returning.items()}
+            
+            self.connection.autocommit = True
+            try:
+                cursor.execute(query, {**params, **out_vars})
+            finally:
+                self.connection.autocommit = False
+            
+            cursor.close()
+            record_statement(query, time.perf_counter() - start, 1)
+            
+            return {name: _first_returned_value(var) for name, var in out_vars.items()}
+            
+        except Exception as e:
+            logger.error("Error executing returning query: %s", e)
             self.connection.rollback()
             raise
     
+    def get_type(self, name: str):
+        """
+        Get a database object type by name, cached for the connection.
+        
+        Args:
+            name (str): Fully qualified type name, e.g. MDSYS.SDO_GEOMETRY
+            
+        Returns:
+            oracledb.DbObjectType: Type object usable in binds on this connection
+        """
+        if not self.connection:
+            raise RuntimeError("Database not connected. Call connect() first.")
+        
+        types = _type_cache.setdefault(self.connection, {})
+        if name not in types:
+            types[name] = self.connection.gettype(name)
+        return types[name]
+    
     @contextmanager
     def transaction(self):
         """
@@ -294,7 +810,7 @@ class Database:
             logger.info("Transaction committed successfully")
         except Exception as e:
             self.connection.rollback()
-            logger.error(f"Transaction rolled back due to error: {e}")
+            logger.error("Transaction rolled back due to error: %s", e)
             raise
     
     def test_connection(self) -> bool:
@@ -308,7 +824,7 @@ class Database:
             result = self.execute_query("SELECT 1 as test FROM DUAL")
             return len(result) > 0 and result[0]['TEST'] == 1
         except Exception as e:
-            logger.error(f"Connection test failed: {e}")
+            logger.error("Connection test failed: %s", e)
             return False
     
     def get_table_info(self, table_name: str) -> List[Dict[str, Any]]:
@@ -354,7 +870,7 @@ class Database:
                 shutil.rmtree(self.wallet_dir)
                 logger.info("Wallet cleanup completed")
             except Exception as e:
-                logger.error(f"Error cleaning up wallet directory: {e}")
+                logger.error("Error cleaning up wallet directory: %s", e)
     
     def __del__(self):
         """Destructor to ensure cleanup."""
@@ -362,14 +878,775 @@ class Database:
         self._cleanup_wallet()
 
 
-# FastAPI dependency function
-def get_database():
+class DatabasePool:
     """
-    FastAPI dependency function to get a database connection.
+    Process-wide Oracle connection pool.
     
-    Returns:
-        Database: Database instance for dependency injection
+    The wallet is extracted and the DSN resolved once when the pool is opened;
+    requests then borrow pooled sessions instead of opening a new TLS session
+    each time. Pool sizing is read from DB_POOL_MIN, DB_POOL_MAX,
+    DB_POOL_INCREMENT and DB_POOL_WAIT_TIMEOUT (milliseconds).
+    
+    With DB_SERVER_TYPE=pooled the pooled sessions are DRCP sessions, so
+    every worker's pool shares the database's server processes (connection
+    class DB_CONNECTION_CLASS, purity DB_PURITY). With DB_SESSION_SETTINGS
+    the sessions are tagged with that state and set up by init_session only
+    when a session does not carry the tag yet.
     """
-    db = Database()
-    db.connect()
-    return db
+    
+    def __init__(self, wallet_path: str = "db/wallet_oro.zip", min_size: Optional[int] = None,
+                 max_size: Optional[int] = None, increment: Optional[int] = None,
+                 wait_timeout: Optional[int] = None):
+        """
+        Initialize the pool configuration. Call open() to create the pool.
+        
+        Args:
+            wallet_path (str): Path to the Oracle wallet zip file
+            min_size (int, optional): Minimum number of pooled connections
+            max_size (int, optional): Maximum number of pooled connections
+            increment (int, optional): Connections opened when the pool grows
+            wait_timeout (int, optional): Milliseconds to wait for a free connection
+        """
+        self.wallet_path = wallet_path
+        self.wallet_dir = None
+        self.dsn = None
+        self.pool = None
+        
+        credentials = _load_credentials()
+        self.db_user = credentials['db_user']
+        self.db_password = credentials['db_password']
+        self.wallet_password = credentials['wallet_password']
+        self.db_service_name = credentials['db_service_name']
+        self.drcp_params = drcp_params(credentials)
+        self.session_tag = session_tag(credentials['db_session_settings'])
+        self.stmt_cache_size = credentials['db_stmt_cache_size']
+        
+        self.min_size = min_size if min_size is not None else int(os.getenv('DB_POOL_MIN', '2'))
+        self.max_size = max_size if max_size is not None else int(os.getenv('DB_POOL_MAX', '10'))
+        self.increment = increment if increment is not None else int(os.getenv('DB_POOL_INCREMENT', '1'))
+        self.wait_timeout = (
+            wait_timeout if wait_timeout is not None else int(os.getenv('DB_POOL_WAIT_TIMEOUT', '10000'))
+        )
+    
+    def open(self) -> None:
+        """
+        Extract the wallet, resolve the DSN and create the connection pool.
+        """
+        self.wallet_dir = extract_wallet(self.wallet_path)
+        
+        try:
+            self.dsn = resolve_dsn(self.wallet_dir, self.db_service_name)
+            if self.drcp_params:
+                self.dsn = pooled_dsn(self.dsn)
+            self.pool = oracledb.create_pool(
+                user=self.db_user,
+                password=self.db_password,
+                dsn=self.dsn,
+                config_dir=self.wallet_dir,
+                min=self.min_size,
+                max=self.max_size,
+                increment=self.increment,
+                getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+                wait_timeout=self.wait_timeout,
+                stmtcachesize=self.stmt_cache_size,
+                session_callback=init_session if self.session_tag else None,
+                **self.drcp_params
+            )
+            logger.info(
+                "Connection pool created (min=%s, max=%s, increment=%s, "
+                "server=%s)",
+                self.min_size, self.max_size, self.increment, self.drcp_params.get('server_type', 'dedicated')
+            )
+        except Exception as e:
+            logger.error("Failed to create connection pool: %s", e)
+            self._cleanup_wallet()
+            raise
+    
+    def acquire(self):
+        """
+        Acquire a connection from the pool.
+        
+        Returns:
+            oracledb.Connection: Pooled connection
+        """
+        if not self.pool:
+            raise RuntimeError("Connection pool not open. Call open() first.")
+        if self.session_tag:
+            return self.pool.acquire(tag=self.session_tag)
+        return self.pool.acquire()
+    
+    def release(self, connection) -> None:
+        """
+        Return a connection to the pool, rolling back any uncommitted work.
+        
+        Args:
+            connection: Connection previously returned by acquire()
+        """
+        if self.pool:
+            self.pool.release(connection)
+    
+    def ping(self) -> None:
+        """
+        Check that the database answers on a pooled connection.
+        
+        Uses a lightweight ping round trip instead of executing a statement.
+        
+        Raises:
+            Exception: If no connection can be acquired or the ping fails
+        """
+        connection = self.acquire()
+        try:
+            connection.ping()
+        finally:
+            self.release(connection)
+    
+    def get_parse_stats(self) -> Dict[str, Any]:
+        """
+        Get the parse and execute counters of one pooled session.
+        
+        Returns:
+            Dict[str, Any]: See parse_stats
+        """
+        connection = self.acquire()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(SESSION_PARSE_STATS_QUERY)
+                return parse_stats(cursor.fetchall())
+        finally:
+            self.release(connection)
+    
+    def close(self) -> None:
+        """
+        Close the pool and remove the extracted wallet.
+        """
+        if self.pool:
+            try:
+                self.pool.close(force=True)
+                logger.info("Connection pool closed")
+            except Exception as e:
+                logger.error("Error closing connection pool: %s", e)
+            finally:
+                self.pool = None
+        self._cleanup_wallet()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics for monitoring.
+        
+        Returns:
+            Dict[str, Any]: Pool sizing and usage counters
+        """
+        if not self.pool:
+            return {"open": False}
+        
+        return {
+            "open": True,
+            "min": self.pool.min,
+            "max": self.pool.max,
+            "increment": self.pool.increment,
+            "opened": self.pool.opened,
+            "busy": self.pool.busy,
+            "available": self.pool.opened - self.pool.busy,
+            "wait_timeout_ms": self.pool.wait_timeout,
+            "server_type": self.drcp_params.get('server_type', 'dedicated'),
+            "connection_class": self.drcp_params.get('cclass'),
+            "session_tag": self.session_tag,
+            "stmt_cache_size": self.pool.stmtcachesize
+        }
+    
+    def _cleanup_wallet(self) -> None:
+        """
+        Clean up the temporary wallet directory.
+        """
+        if self.wallet_dir and os.path.exists(self.wallet_dir):
+            try:
+                shutil.rmtree(self.wallet_dir)
+                logger.info("Wallet cleanup completed")
+            except Exception as e:
+                logger.error("Error cleaning up wallet directory: %s", e)
+        self.wallet_dir = None
+
+
+# Process-wide pool shared by all requests
+_pool: Optional[DatabasePool] = None
+_pool_lock = threading.Lock()
+
+
+def init_pool(wallet_path: str = "db/wallet_oro.zip") -> DatabasePool:
+    """
+    Create the process-wide connection pool if it does not exist yet.
+    
+    Args:
+        wallet_path (str): Path to the Oracle wallet zip file
+        
+    Returns:
+        DatabasePool: The shared pool
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            pool = DatabasePool(wallet_path=wallet_path)
+            pool.open()
+            _pool = pool
+    return _pool
+
+
+def get_pool() -> DatabasePool:
+    """
+    Get the process-wide connection pool, creating it on first use.
+    
+    Returns:
+        DatabasePool: The shared pool
+    """
+    if _pool is None:
+        return init_pool()
+    return _pool
+
+
+def close_pool() -> None:
+    """
+    Close the process-wide connection pool.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+# FastAPI dependency function
+def get_database():
+    """
+    FastAPI dependency function to get a pooled database connection.
+    
+    The connection is acquired from the shared pool for the duration of the
+    request and released back to it once the response has been produced.
+    
+    Yields:
+        Database: Database instance for dependency injection
+    """
+    db = Database(pool=get_pool())
+    db.connect()
+    try:
+        yield db
+    finally:
+        db.disconnect()
+
+
+class AsyncDatabasePool(DatabasePool):
+    """
+    Process-wide Oracle connection pool built on the oracledb asyncio API.
+    
+    Shares configuration with DatabasePool but creates the pool with
+    oracledb.create_pool_async so that acquiring, querying and releasing
+    connections never blocks the event loop.
+    """
+    
+    def open(self) -> None:
+        """
+        Extract the wallet, resolve the DSN and create the async connection pool.
+        """
+        self.wallet_dir = extract_wallet(self.wallet_path)
+        
+        try:
+            self.dsn = resolve_dsn(self.wallet_dir, self.db_service_name)
+            if self.drcp_params:
+                self.dsn = pooled_dsn(self.dsn)
+            self.pool = oracledb.create_pool_async(
+                user=self.db_user,
+                password=self.db_password,
+                dsn=self.dsn,
+                config_dir=self.wallet_dir,
+                min=self.min_size,
+                max=self.max_size,
+                increment=self.increment,
+                getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+                wait_timeout=self.wait_timeout,
+                stmtcachesize=self.stmt_cache_size,
+                session_callback=init_session_async if self.session_tag else None,
+                **self.drcp_params
+            )
+            logger.info(
+                "Async connection pool created (min=%s, max=%s, increment=%s, "
+                "server=%s)",
+                self.min_size, self.max_size, self.increment, self.drcp_params.get('server_type', 'dedicated')
+            )
+        except Exception as e:
+            logger.error("Failed to create async connection pool: %s", e)
+            self._cleanup_wallet()
+            raise
+    
+    async def acquire(self):
+        """
+        Acquire a connection from the pool.
+        
+        Returns:
+            oracledb.AsyncConnection: Pooled connection
+        """
+        if not self.pool:
+            raise RuntimeError("Connection pool not open. Call open() first.")
+        if self.session_tag:
+            return await self.pool.acquire(tag=self.session_tag)
+        return await self.pool.acquire()
+    
+    async def release(self, connection) -> None:
+        """
+        Return a connection to the pool, rolling back any uncommitted work.
+        
+        Args:
+            connection: Connection previously returned by acquire()
+        """
+        if self.pool:
+            await self.pool.release(connection)
+    
+    async def ping(self) -> None:
+        """
+        Check that the database answers on a pooled connection.
+        
+        Raises:
+            Exception: If no connection can be acquired or the ping fails
+        """
+        connection = await self.acquire()
+        try:
+            await connection.ping()
+        finally:
+            await self.release(connection)
+    
+    async def get_parse_stats(self) -> Dict[str, Any]:
+        """
+        Get the parse and execute counters of one pooled session.
+        
+        Returns:
+            Dict[str, Any]: See parse_stats
+        """
+        connection = await self.acquire()
+        try:
+            with connection.cursor() as cursor:
+                await cursor.execute(SESSION_PARSE_STATS_QUERY)
+                return parse_stats(await cursor.fetchall())
+        finally:
+            await self.release(connection)
+    
+    async def close(self) -> None:
+        """
+        Close the pool and remove the extracted wallet.
+        """
+        if self.pool:
+            try:
+                await self.pool.close(force=True)
+                logger.info("Async connection pool closed")
+            except Exception as e:
+                logger.error("Error closing async connection pool: %s", e)
+            finally:
+                self.pool = None
+        self._cleanup_wallet()
+
+
+class AsyncDatabase:
+    """
+    Asyncio counterpart of Database for use from async FastAPI routes.
+    
+    Connections are always borrowed from an AsyncDatabasePool; every database
+    call is awaited so the event loop keeps serving other requests while
+    Oracle works.
+    """
+    
+    def __init__(self, pool: AsyncDatabasePool):
+        """
+        Initialize the AsyncDatabase instance.
+        
+        Args:
+            pool (AsyncDatabasePool): Pool to borrow connections from
+        """
+        self.pool = pool
+        self.connection = None
+    
+    async def connect(self) -> None:
+        """
+        Acquire a connection from the pool.
+        """
+        self.connection = await self.pool.acquire()
+    
+    async def disconnect(self) -> None:
+        """
+        Release the connection back to the pool.
+        """
+        if self.connection:
+            try:
+                await self.pool.release(self.connection)
+            except Exception as e:
+                logger.error("Error releasing connection: %s", e)
+            finally:
+                self.connection = None
+    
+    async def execute_query(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Execute a SELECT query and return results as a list of dictionaries.
+        
+        Args:
+            query (str): SQL SELECT query
+            params (Dict[str, Any], optional): Query parameters
+            
+        Returns:
+            List[Dict[str, Any]]: Query results as list of dictionaries
+        """
+        if not self.connection:
+            raise RuntimeError("Database not connected. Call connect() first.")
+        
+        try:
+            start = time.perf_counter()
+            with self.connection.cursor() as cursor:
+                if params:
+                    await cursor.execute(query, params)
+                else:
+                    await cursor.execute(query)
+                
+                # Get column names
+                columns = [desc[0] for desc in cursor.description] if cursor.description else []
+                
+                # Convert rows to dictionaries as they arrive
+                results = [dict(zip(columns, row)) async for row in cursor]
+            
+            record_statement(query, time.perf_counter() - start, len(results))
+            
+            return results
+            
+        except Exception as e:
+            logger.error("Error executing query: %s", e)
+            raise
+    
+    async def iter_query(self, query: str, params: Optional[Dict[str, Any]] = None,
+                         batch_size: int = DEFAULT_FETCH_BATCH_SIZE, prefetch_rows: Optional[int] = None,
+                         row_format: str = 'dict') -> AsyncIterator[Union[List[Any], Dict[str, List[Any]]]]:
+        """
+        Execute a SELECT query and yield its results batch by batch.
+        
+        Args:
+            query (str): SQL SELECT query
+            params (Dict[str, Any], optional): Query parameters
+            batch_size (int): Rows fetched per round trip (cursor.arraysize)
+            prefetch_rows (int, optional): Rows returned with the execute round trip
+                (cursor.prefetchrows, default: batch_size)
+            row_format (str): 'dict', 'tuple' or 'columnar' (see _format_batch)
+            
+        Yields:
+            One formatted batch of at most batch_size rows per round trip
+        """
+        if not self.connection:
+            raise RuntimeError("Database not connected. Call connect() first.")
+        
+        try:
+            with self.connection.cursor() as cursor:
+                _prepare_stream_cursor(cursor, batch_size, prefetch_rows, row_format)
+                
+                # Only time spent in the database counts, not time spent by the consumer
+                start = time.perf_counter()
+                if params:
+                    await cursor.execute(query, params)
+                else:
+                    await cursor.execute(query)
+                db_seconds = time.perf_counter() - start
+                
+                columns = [desc[0] for desc in cursor.description] if cursor.description else []
+                
+                total_rows = 0
+                while True:
+                    start = time.perf_counter()
+                    rows = await cursor.fetchmany()
+                    db_seconds += time.perf_counter() - start
+                    if not rows:
+                        break
+                    total_rows += len(rows)
+                    yield _format_batch(columns, rows, row_format)
+            
+            record_statement(query, db_seconds, total_rows)
+            
+        except Exception as e:
+            logger.error("Error executing streaming query: %s", e)
+            raise
+    
+    async def execute_update(self, query: str, params: Optional[Dict[str, Any]] = None,
+                             input_sizes: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Execute an INSERT, UPDATE, or DELETE query.
+        
+        Args:
+            query (str): SQL query
+            params (Dict[str, Any], optional): Query parameters
+            input_sizes (Dict[str, Any], optional): Bind names mapped to their oracledb type,
+                e.g. DB_TYPE_JSON to bind Python objects as native JSON
+            
+        Returns:
+            int: Number of affected rows
+        """
+        if not self.connection:
+            raise RuntimeError("Database not connected. Call connect() first.")
+        
+        try:
+            start = time.perf_counter()
+            with self.connection.cursor() as cursor:
+                if input_sizes:
+                    cursor.setinputsizes(**input_sizes)
+                
+                if params:
+                    await cursor.execute(query, params)
+                else:
+                    await cursor.execute(query)
+                
+                affected_rows = cursor.rowcount
+            
+            await self.connection.commit()
+            record_statement(query, time.perf_counter() - start, affected_rows)
+            
+            return affected_rows
+            
+        except Exception as e:
+            logger.error("Error executing update query: %s", e)
+            await self.connection.rollback()
+            raise
+    
+    async def execute_many(self, query: str, params_list: List[Dict[str, Any]]) -> int:
+        """
+        Execute a query multiple times with different parameters.
+        
+        Args:
+            query (str): SQL query
+            params_list (List[Dict[str, Any]]): List of parameter dictionaries
+            
+        Returns:
+            int: Number of affected rows
+        """
+        if not self.connection:
+            raise RuntimeError("Database not connected. Call connect() first.")
+        
+        try:
+            start = time.perf_counter()
+            with self.connection.cursor() as cursor:
+                await cursor.executemany(query, params_list)
+                affected_rows = cursor.rowcount
+            
+            await self.connection.commit()
+            record_statement(query, time.perf_counter() - start, affected_rows)
+            
+            return affected_rows
+            
+        except Exception as e:
+            logger.error("Error executing batch query: %s", e)
+            await self.connection.rollback()
+            raise
+    
+    async def execute_batch(self, query: str, params_list: List[Dict[str, Any]],
+                            returning: Optional[Dict[str, Any]] = None,
+                            input_sizes: Optional[Dict[str, Any]] = None,
+                            batch_errors: bool = False, commit: bool = True) -> Dict[str, Any]:
+        """
+        Execute a DML statement once per parameter set in a single round trip.
+        
+        Args:
+            query (str): SQL query, optionally ending in RETURNING ... INTO :name, ...
+            params_list (List[Dict[str, Any]]): List of parameter dictionaries
+            returning (Dict[str, Any], optional): Output bind names mapped to their oracledb type
+            input_sizes (Dict[str, Any], optional): Input bind names mapped to their oracledb type
+            batch_errors (bool): Collect per-row errors instead of failing the batch
+            commit (bool): Commit after the batch
+            
+        Returns:
+            Dict[str, Any]: 'rowcount', 'returned' and 'errors' (see Database.execute_batch)
+        """
+        if not self.connection:
+            raise RuntimeError("Database not connected. Call connect() first.")
+        
+        try:
+            start = time.perf_counter()
+            with self.connection.cursor() as cursor:
+                out_vars = {
+                    name: cursor.var(bind_type, arraysize=len(params_list))
+                    for name, bind_type in (returning or {}).items()
+                }
+                if input_sizes or out_vars:
+                    cursor.setinputsizes(**(input_sizes or {}), **out_vars)
+                
+                await cursor.executemany(query, params_list, batcherrors=batch_errors)
+                
+                errors = [(error.offset, error.message) for error in cursor.getbatcherrors()] if batch_errors else []
+                affected_rows = cursor.rowcount
+                returned = {
+                    name: [next(iter(var.getvalue(i)), None) for i in range(len(params_list))]
+                    for name, var in out_vars.items()
+                }
+            
+            if commit:
+                await self.connection.commit()
+            record_statement(query, time.perf_counter() - start, affected_rows)
+            if errors:
+                logger.warning("Batch query rejected %s of %s rows", len(errors), len(params_list))
+            
+            return {'rowcount': affected_rows, 'returned': returned, 'errors': errors}
+            
+        except Exception as e:
+            logger.error("Error executing batch query: %s", e)
+            await self.connection.rollback()
+            raise
+    
+    async def execute_returning(self, query: str, params: Dict[str, Any], returning: Dict[str, Any],
+                                input_sizes: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Execute an INSERT or UPDATE with a RETURNING ... INTO clause and commit it.
+        
+        Args:
+            query (str): SQL query ending in RETURNING ... INTO :name, ...
+            params (Dict[str, Any]): Input bind parameters
+            returning (Dict[str, Any]): Output bind names mapped to their oracledb type
+            input_sizes (Dict[str, Any], optional): Input bind names mapped to their oracledb type
+            
+        Returns:
+            Dict[str, Any]: Output bind names mapped to the value returned for the first row
+        """
+        if not self.connection:
+            raise RuntimeError("Database not connected. Call connect() first.")
+        
+        try:
+            start = time.perf_counter()
+            with self.connection.cursor() as cursor:
+                if input_sizes:
+                    cursor.setinputsizes(**input_sizes)
+                out_vars = {name: cursor.var(bind_type) for name, bind_type in returning.items()}
+                
+                self.connection.autocommit = True
+                try:
+                    await cursor.execute(query, {**params, **out_vars})
+                finally:
+                    self.connection.autocommit = False
+            
+            record_statement(query, time.perf_counter() - start, 1)
+            
+            return {name: _first_returned_value(var) for name, var in out_vars.items()}
+            
+        except Exception as e:
+            logger.error("Error executing returning query: %s", e)
+            await self.connection.rollback()
+            raise
+    
+    async def get_type(self, name: str):
+        """
+        Get a database object type by name, cached for the connection.
+        
+        Args:
+            name (str): Fully qualified type name, e.g. MDSYS.SDO_GEOMETRY
+            
+        Returns:
+            oracledb.DbObjectType: Type object usable in binds on this connection
+        """
+        if not self.connection:
+            raise RuntimeError("Database not connected. Call connect() first.")
+        
+        types = _type_cache.setdefault(self.connection, {})
+        if name not in types:
+            types[name] = await self.connection.gettype(name)
+        return types[name]
+    
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Async context manager for database transactions.
+        
+        Usage:
+            async with db.transaction():
+                await db.execute_update("INSERT INTO table ...")
+        """
+        if not self.connection:
+            raise RuntimeError("Database not connected. Call connect() first.")
+        
+        try:
+            yield self
+            await self.connection.commit()
+            logger.info("Transaction committed successfully")
+        except Exception as e:
+            await self.connection.rollback()
+            logger.error("Transaction rolled back due to error: %s", e)
+            raise
+    
+    async def test_connection(self) -> bool:
+        """
+        Test the database connection by executing a simple query.
+        
+        Returns:
+            bool: True if connection is successful, False otherwise
+        """
+        try:
+            result = await self.execute_query("SELECT 1 as test FROM DUAL")
+            return len(result) > 0 and result[0]['TEST'] == 1
+        except Exception as e:
+            logger.error("Connection test failed: %s", e)
+            return False
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.disconnect()
+
+
+# Process-wide async pool shared by the async routes
+_async_pool: Optional[AsyncDatabasePool] = None
+
+
+def init_async_pool(wallet_path: str = "db/wallet_oro.zip") -> AsyncDatabasePool:
+    """
+    Create the process-wide async connection pool if it does not exist yet.
+    
+    Args:
+        wallet_path (str): Path to the Oracle wallet zip file
+        
+    Returns:
+        AsyncDatabasePool: The shared async pool
+    """
+    global _async_pool
+    with _pool_lock:
+        if _async_pool is None:
+            pool = AsyncDatabasePool(wallet_path=wallet_path)
+            pool.open()
+            _async_pool = pool
+    return _async_pool
+
+
+def get_async_pool() -> AsyncDatabasePool:
+    """
+    Get the process-wide async connection pool, creating it on first use.
+    
+    Returns:
+        AsyncDatabasePool: The shared async pool
+    """
+    if _async_pool is None:
+        return init_async_pool()
+    return _async_pool
+
+
+async def close_async_pool() -> None:
+    """
+    Close the process-wide async connection pool.
+    """
+    global _async_pool
+    pool = _async_pool
+    _async_pool = None
+    if pool is not None:
+        await pool.close()
+
+
+# FastAPI dependency function for async routes
+async def get_async_database():
+    """
+    FastAPI dependency function to get a pooled async database connection.
+    
+    Yields:
+        AsyncDatabase: AsyncDatabase instance for dependency injection
+    """
+    db = AsyncDatabase(get_async_pool())
+    await db.connect()
+    try:
+        yield db
+    finally:
+        await db.disconnect()
@@ -0,0 +1,251 @@
+"""
+Non-blocking, structured logging setup.
+
+Application threads only put log records on an in-memory queue; a single
+QueueListener thread formats them and writes them to stdout, so a slow
+terminal or journal never blocks a request. Records are emitted as one JSON
+object per line carrying the id of the request that produced them, and
+message arguments are only interpolated on the listener thread. Records
+below WARNING from busy loggers can be sampled with LOG_SAMPLING.
+
+configure_logging() is idempotent and is called by run_server.py and when
+app.main is imported, so every worker process configures logging once.
+"""
+
+import os
+import sys
+import json
+import queue
+import atexit
+import random
+import logging
+import threading
+import traceback
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+
+# Default sampling: per-statement debug records of the query metrics hot path
+DEFAULT_SAMPLING = "app.query_metrics=0.1"
+
+# Attributes every LogRecord has; anything else was passed through extra=
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "request_id"}
+
+_request_id: ContextVar[Optional[str]] = ContextVar('request_id', default=None)
+
+_listener: Optional[QueueListener] = None
+_configure_lock = threading.Lock()
+
+
+def set_request_id(request_id: Optional[str]):
+    """
+    Set the request id attached to records logged by the current context.
+
+    Args:
+        request_id: Request id, or None
+
+    Returns:
+        Token to pass to reset_request_id
+    """
+    return _request_id.set(request_id)
+
+
+def reset_request_id(token) -> None:
+    """
+    Restore the request id that was current before set_request_id.
+
+    Args:
+        token: Token returned by set_request_id
+    """
+    _request_id.reset(token)
+
+
+def get_request_id() -> Optional[str]:
+    """Get the request id of the current context, if any."""
+    return _request_id.get()
+
+
+def parse_sampling(value: str) -> Dict[str, float]:
+    """
+    Parse LOG_SAMPLING ("logger=rate,logger=rate").
+
+    Args:
+        value: Comma-separated logger names and keep rates between 0 and 1
+
+    Returns:
+        Keep rate by logger name
+
+    Raises:
+        ValueError: If an entry is malformed or a rate is out of range
+    """
+    rates = {}
+    for entry in filter(None, (part.strip() for part in value.split(','))):
+        name, separator, rate = entry.partition('=')
+        if not separator:
+            raise ValueError(f"Invalid LOG_SAMPLING entry: {entry}")
+        rates[name.strip()] = float(rate)
+        if not 0.0 <= rates[name.strip()] <= 1.0:
+            raise ValueError(f"LOG_SAMPLING rate must be between 0 and 1: {entry}")
+    return rates
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps a fraction of the records below WARNING from selected loggers.
+
+    A rate configured for a logger also applies to its children. Warnings
+    and errors are never dropped.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        """
+        Initialize the filter.
+
+        Args:
+            rates: Keep rate by logger name
+        """
+        super().__init__()
+        self.rates = rates
+        self._resolved: Dict[str, float] = {}
+
+    def _rate(self, name: str) -> float:
+        """Get the keep rate of a logger, inherited from its closest configured parent."""
+        rate = self._resolved.get(name)
+        if rate is None:
+            rate = 1.0
+            candidate = name
+            while candidate:
+                if candidate in self.rates:
+                    rate = self.rates[candidate]
+                    break
+                candidate = candidate.rpartition('.')[0]
+            self._resolved[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Decide whether a record is kept."""
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+class ContextQueueHandler(QueueHandler):
+    """
+    QueueHandler that defers formatting to the listener thread.
+
+    The standard QueueHandler renders the message in the calling thread so
+    the record can be pickled; records here stay in process, so only the
+    request id (a context variable, unavailable on the listener thread) is
+    captured before the record is queued.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Attach the current request id to the record."""
+        record.request_id = _request_id.get()
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record.
+
+        Args:
+            record: Log record
+
+        Returns:
+            JSON object with timestamp, level, logger, message, request_id,
+            thread, any extra= fields and the exception, if any
+        """
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, 'request_id', None),
+            "thread": record.threadName
+        }
+
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+
+        if record.exc_info:
+            entry["exception"] = "".join(traceback.format_exception(*record.exc_info)).rstrip()
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Plain text format including the request id, for local development."""
+
+    def __init__(self):
+        """Initialize the formatter."""
+        super().__init__("%(asctime)s %(levelname)s [%(name)s] [%(request_id)s] %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record, tolerating records without a request id."""
+        if not hasattr(record, 'request_id'):
+            record.request_id = None
+        return super().format(record)
+
+
+def configure_logging(level: Optional[str] = None, log_format: Optional[str] = None,
+                      sampling: Optional[str] = None, stream=None) -> QueueListener:
+    """
+    Route all logging through a queue to a background writer thread.
+
+    Only the first call in a process has an effect.
+
+    Args:
+        level: Root log level (default: LOG_LEVEL or info)
+        log_format: 'json' or 'text' (default: LOG_FORMAT or json)
+        sampling: Per-logger keep rates (default: LOG_SAMPLING or DEFAULT_SAMPLING)
+        stream: Output stream (default: sys.stdout)
+
+    Returns:
+        The running QueueListener
+    """
+    global _listener
+
+    with _configure_lock:
+        if _listener is not None:
+            return _listener
+
+        level = (level or os.getenv('LOG_LEVEL', 'info')).upper()
+        log_format = (log_format or os.getenv('LOG_FORMAT', 'json')).lower()
+        sampling = sampling if sampling is not None else os.getenv('LOG_SAMPLING', DEFAULT_SAMPLING)
+
+        output = logging.StreamHandler(stream or sys.stdout)
+        output.setFormatter(JsonFormatter() if log_format == 'json' else TextFormatter())
+
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        handler = ContextQueueHandler(log_queue)
+        rates = parse_sampling(sampling)
+        if rates:
+            handler.addFilter(SamplingFilter(rates))
+
+        root = logging.getLogger()
+        for existing in list(root.handlers):
+            root.removeHandler(existing)
+        root.addHandler(handler)
+        root.setLevel(level)
+
+        # Let the server's loggers propagate to the queue instead of writing directly
+        for name in ('uvicorn', 'uvicorn.error', 'uvicorn.access'):
+            server_logger = logging.getLogger(name)
+            server_logger.handlers.clear()
+            server_logger.propagate = True
+
+        _listener = QueueListener(log_queue, output, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+
+        return _listener
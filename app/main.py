@@ -5,7 +5,11 @@ This is the main FastAPI application that serves the ORO backend API.
 It includes all the routes, middleware, and configuration.
 """
 
-from fastapi import FastAPI, HTTPException
+import time
+import uuid
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import logging
@@ -14,20 +18,57 @@ from .routes.ruleset_routes import router as ruleset_router
 from .routes.report_routes import router as report_router
 from .routes.model_routes import router as model_router
 from .routes.image_routes import router as image_router
-from .database import Database
+from .database import (
+    init_pool,
+    close_pool,
+    get_pool,
+    init_async_pool,
+    close_async_pool,
+    get_async_pool
+)
+from .services.ruleset_cache import get_ruleset_cache
+from .services.health_service import get_health_monitor
+from .services.model_cache import get_model_cache, get_model_warmup
+from .services.validation_service import get_lookup_cache_stats
+from .services.report_service import get_report_stats_cache
+from .query_metrics import start_request, end_request, get_statement_stats
+from .logging_config import configure_logging, set_request_id, reset_request_id
 import uvicorn
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging (no-op if run_server.py already did)
+configure_logging()
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared resources on startup and release them on shutdown."""
+    try:
+        # The API routes are async and share the async pool; the sync pool
+        # serves blocking callers such as background processing.
+        init_async_pool()
+        init_pool()
+    except Exception as e:
+        # The pools are created lazily on first use if startup fails
+        logger.error("Failed to create database connection pool: %s", e)
+    get_health_monitor().start()
+    # Readiness stays 503 until the MODEL_WARMUP models are loaded
+    get_model_warmup().start()
+    yield
+    await get_model_warmup().stop()
+    await get_health_monitor().stop()
+    await close_async_pool()
+    close_pool()
+
+
 # Create FastAPI application
 app = FastAPI(
     title="ORO Backend API",
     description="Oracle Spatial-based Object Recognition and Operations API",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -39,6 +80,46 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+
+@app.middleware("http")
+async def database_timing(request: Request, call_next):
+    """
+    Report the request's database statements in a Server-Timing header.
+    
+    Statements executed while the response body is streamed are not included.
+    """
+    stats, token = start_request()
+    start = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        end_request(token)
+    
+    total_ms = (time.perf_counter() - start) * 1000
+    response.headers["Server-Timing"] = f"{stats.server_timing()}, app;dur={total_ms:.1f}"
+    return response
+
+
+@app.middleware("http")
+async def request_context(request: Request, call_next):
+    """
+    Tag the request's log records with a request id.
+    
+    The id is taken from the X-Request-ID header when the caller sends one
+    and echoed in the response.
+    """
+    request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    token = set_request_id(request_id)
+    try:
+        response = await call_next(request)
+    finally:
+        reset_request_id(token)
+    
+    response.headers["X-Request-ID"] = request_id
+    return response
+
+
 # Include routers
 app.include_router(ruleset_router, prefix="/api/v1")
 app.include_router(report_router, prefix="/api/v1")
@@ -57,39 +138,125 @@ async def root():
     }
 
 
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe: the process is serving requests. Does no I/O."""
+    return {"status": "alive"}
+
+
 @app.get("/health")
-async def health_check():
-    """Health check endpoint."""
+@app.get("/health/ready")
+async def readiness_check():
+    """
+    Readiness probe: pings a pooled database connection.
+    
+    The node is not ready while the MODEL_WARMUP models are being loaded.
+    The results of the background deep checks (database query, object
+    storage, model registry) are reported from cache; a failing deep check
+    marks the node degraded but does not take it out of rotation.
+    """
+    monitor = get_health_monitor()
+    checks = monitor.get_results()
+    
+    warmup = get_model_warmup()
+    if not warmup.ready:
+        return JSONResponse(
+            status_code=503,
+            content={
+                "status": "warming_up",
+                "message": "Loading models listed in MODEL_WARMUP",
+                "warmup": warmup.get_status()
+            }
+        )
+    
     try:
-        # Test database connection
-        with Database() as db:
-            if db.test_connection():
-                return {
-                    "status": "healthy",
-                    "database": "connected",
-                    "message": "All systems operational"
-                }
-            else:
-                return JSONResponse(
-                    status_code=503,
-                    content={
-                        "status": "unhealthy",
-                        "database": "disconnected",
-                        "message": "Database connection failed"
-                    }
-                )
+        await asyncio.wait_for(get_async_pool().ping(), timeout=monitor.timeout_seconds)
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Readiness check failed: %s", e)
         return JSONResponse(
             status_code=503,
             content={
                 "status": "unhealthy",
                 "database": "error",
-                "message": f"Health check failed: {str(e)}"
+                "message": f"Health check failed: {str(e) or type(e).__name__}",
+                "checks": checks
+            }
+        )
+    
+    healthy = monitor.is_healthy()
+    return {
+        "status": "healthy" if healthy else "degraded",
+        "database": "connected",
+        "message": "All systems operational" if healthy else "Some deep checks are failing or stale",
+        "checks": checks
+    }
+
+
+@app.get("/health/deep")
+async def deep_health_check():
+    """Cached results of the background deep checks. Does no I/O."""
+    monitor = get_health_monitor()
+    return {
+        "status": "healthy" if monitor.is_healthy() else "degraded",
+        "interval_seconds": monitor.interval_seconds,
+        "ttl_seconds": monitor.ttl_seconds,
+        "checks": monitor.get_results()
+    }
+
+
+@app.get("/health/pool")
+async def pool_stats():
+    """Database connection pool statistics for monitoring."""
+    try:
+        return {
+            "async": get_async_pool().get_stats(),
+            "sync": get_pool().get_stats()
+        }
+    except Exception as e:
+        logger.error("Failed to read pool statistics: %s", e)
+        return JSONResponse(
+            status_code=503,
+            content={
+                "open": False,
+                "message": f"Connection pool unavailable: {str(e)}"
             }
         )
 
 
+@app.get("/health/statements")
+async def statement_stats():
+    """
+    Statement text and parse statistics for monitoring.
+    
+    "process" counts this worker's executions and distinct statement texts;
+    "session" reads the database's parse and execute counters for one
+    pooled session. The statement cache size is reported by /health/pool.
+    """
+    try:
+        session = await asyncio.wait_for(
+            get_async_pool().get_parse_stats(), timeout=get_health_monitor().timeout_seconds
+        )
+    except Exception as e:
+        logger.warning("Failed to read session parse statistics: %s", e)
+        session = {"error": str(e) or type(e).__name__}
+    
+    return {
+        "process": get_statement_stats(),
+        "session": session
+    }
+
+
+@app.get("/health/cache")
+async def cache_stats():
+    """In-process cache statistics for monitoring."""
+    return {
+        "rulesets": get_ruleset_cache().get_stats(),
+        "report_stats": get_report_stats_cache().get_stats(),
+        "models": get_model_cache().get_stats(),
+        **get_lookup_cache_stats()
+    }
+
+
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     """Custom HTTP exception handler."""
@@ -105,7 +272,7 @@ async def http_exception_handler(request, exc):
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
     """General exception handler."""
-    logger.error(f"Unhandled exception: {exc}")
+    logger.error("Unhandled exception: %s", exc)
     return JSONResponse(
         status_code=500,
         content={
@@ -121,5 +288,6 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        log_config=None
     )
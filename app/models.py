@@ -178,9 +178,10 @@ class RulesetResponse(BaseModel):
 class RulesetListResponse(BaseModel):
     """Model for ruleset list API responses."""
     rulesets: List[RulesetResponse] = Field(..., description="List of rulesets")
-    total: int = Field(..., description="Total number of rulesets")
+    total: Optional[int] = Field(None, description="Total number of rulesets (not computed for keyset pagination)")
     page: int = Field(..., description="Current page number")
     per_page: int = Field(..., description="Number of items per page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next keyset page, if any")
     
     class Config:
         json_schema_extra = {
@@ -350,12 +351,58 @@ class ReportResponse(BaseModel):
         }
 
 
+class ReportSummaryResponse(BaseModel):
+    """Model for report list entries restricted to a sparse fieldset."""
+    id: int = Field(..., description="Report ID")
+    name: Optional[str] = Field(None, description="Report name")
+    status: Optional[str] = Field(None, description="Processing status")
+    timestamp: Optional[datetime] = Field(None, description="Processing timestamp")
+    bucket_img_path: Optional[str] = Field(None, description="Path to the image in the bucket")
+    image_footprint: Optional[GeometryBase] = Field(None, description="Full geographic extent of the entire GeoTIFF file")
+    area_of_interest: Optional[GeometryBase] = Field(None, description="Geographic area of interest")
+    author: Optional[str] = Field(None, description="Author name")
+    created_at: Optional[datetime] = Field(None, description="Creation timestamp")
+    updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
+
+
 class ReportListResponse(BaseModel):
     """Model for report list API responses."""
-    reports: List[ReportResponse] = Field(..., description="List of reports")
-    total: int = Field(..., description="Total number of reports")
+    reports: List[Union[ReportResponse, ReportSummaryResponse]] = Field(..., description="List of reports")
+    total: Optional[int] = Field(None, description="Total number of reports (not computed for keyset pagination)")
     page: int = Field(..., description="Current page number")
     per_page: int = Field(..., description="Number of items per page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next keyset page, if any")
+
+
+class ReportThroughput(BaseModel):
+    """Number of reports completed during one hour."""
+    hour: datetime = Field(..., description="Start of the hour (UTC)")
+    completed: int = Field(..., description="Reports completed during the hour")
+
+
+class ReportStatsResponse(BaseModel):
+    """Model for the report dashboard aggregates."""
+    total: int = Field(..., description="Total number of reports")
+    by_status: Dict[str, int] = Field(..., description="Number of reports per status")
+    by_author: Dict[str, int] = Field(..., description="Number of reports per author")
+    completed_per_hour: List[ReportThroughput] = Field(..., description="Reports completed per hour, oldest first")
+    window_hours: int = Field(..., description="Number of hours covered by completed_per_hour")
+    generated_at: datetime = Field(..., description="When the aggregates were computed (UTC)")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "total": 42,
+                "by_status": {"completed": 30, "processing": 2, "failed": 4, "initiating": 6},
+                "by_author": {"analyst@company.com": 25, "user_123": 17},
+                "completed_per_hour": [
+                    {"hour": "2024-01-15T09:00:00Z", "completed": 3},
+                    {"hour": "2024-01-15T10:00:00Z", "completed": 5}
+                ],
+                "window_hours": 2,
+                "generated_at": "2024-01-15T10:30:00Z"
+            }
+        }
 
 
 class ReportCreationResponse(BaseModel):
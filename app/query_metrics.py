@@ -0,0 +1,238 @@
+"""
+Per-request database statement instrumentation.
+
+Every statement run through Database/AsyncDatabase is reported to
+record_statement with its elapsed time and row count. Statements are grouped
+by SQL fingerprint (the text with literals and whitespace normalized) and
+rolled up per request; the HTTP middleware in main.py exposes the totals in a
+Server-Timing header. Statements slower than DB_SLOW_QUERY_MS are logged at
+WARNING instead of logging every statement at INFO; messages use lazy
+%-style arguments so they are only rendered by the logging writer thread.
+"""
+
+import os
+import re
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Statements at or above this many milliseconds are logged as slow
+SLOW_QUERY_MS = float(os.getenv('DB_SLOW_QUERY_MS', '500'))
+
+# Number of distinct SQL texts remembered to detect first executions
+SEEN_STATEMENTS_SIZE = 4096
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w:])\d+(?:\.\d+)?\b")
+_BIND_LIST = re.compile(r"\(\s*(?::\w+|\?)(?:\s*,\s*(?::\w+|\?))+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(sql: str) -> str:
+    """
+    Normalize a statement so that executions of the same shape group together.
+
+    Literals become '?', IN lists of binds collapse to (...), and whitespace
+    is collapsed.
+
+    Args:
+        sql: SQL statement text
+
+    Returns:
+        Normalized statement text
+    """
+    normalized = _STRING_LITERAL.sub("?", sql)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _BIND_LIST.sub("(...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def fingerprint_id(sql_fingerprint: str) -> str:
+    """Short stable identifier of a fingerprint, for compact log lines."""
+    return hashlib.sha1(sql_fingerprint.encode()).hexdigest()[:12]
+
+
+class RequestQueryStats:
+    """Statement totals for one request, grouped by SQL fingerprint."""
+
+    def __init__(self):
+        """Initialize empty totals."""
+        self.statements = 0
+        self.total_ms = 0.0
+        self.rows = 0
+        self.new_statement_texts = 0
+        self.by_fingerprint: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, sql_fingerprint: str, elapsed_ms: float, rows: int, new_text: bool) -> None:
+        """
+        Add one statement execution to the totals.
+
+        Args:
+            sql_fingerprint: Statement fingerprint
+            elapsed_ms: Elapsed time in milliseconds
+            rows: Rows returned or affected
+            new_text: Whether this process had not sent the statement text before
+        """
+        self.statements += 1
+        self.total_ms += elapsed_ms
+        self.rows += rows
+        self.new_statement_texts += int(new_text)
+
+        entry = self.by_fingerprint.setdefault(sql_fingerprint, {'count': 0, 'total_ms': 0.0, 'rows': 0})
+        entry['count'] += 1
+        entry['total_ms'] += elapsed_ms
+        entry['rows'] += rows
+
+    def server_timing(self) -> str:
+        """
+        Format the totals as a Server-Timing header value.
+
+        Returns:
+            Header value with the database time, statement, row and new
+            statement text counts
+        """
+        return (
+            f'db;dur={self.total_ms:.1f};desc="{self.statements} statements", '
+            f'db-rows;desc="{self.rows} rows", '
+            f'db-new-sql;desc="{self.new_statement_texts} new statement texts", '
+            f'db-shapes;desc="{len(self.by_fingerprint)} statement shapes"'
+        )
+
+
+_current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar('request_query_stats', default=None)
+
+# SQL texts already executed by this process, least recently used first
+_seen_statements: "OrderedDict[str, None]" = OrderedDict()
+_seen_lock = threading.Lock()
+
+# Process totals: executions, first executions and distinct texts per fingerprint
+_executions = 0
+_first_executions = 0
+_texts_by_fingerprint: Dict[str, int] = {}
+
+
+def _first_execution(sql: str, sql_fingerprint: str) -> bool:
+    """
+    Check whether a SQL text is executed for the first time by this process.
+
+    This is not the server's hard parse count: after a restart or in a new
+    worker a new text may already be in the shared pool (a soft parse), and a
+    known text is hard parsed again after an invalidation or when it ages out
+    of the shared pool. Actual parse counts come from SESSION_PARSE_STATS_QUERY
+    (/health/statements); new texts only point at statements built with
+    varying text.
+
+    Args:
+        sql: SQL statement text
+        sql_fingerprint: Fingerprint of the text
+
+    Returns:
+        True if the text was not seen recently
+    """
+    global _executions, _first_executions
+
+    with _seen_lock:
+        _executions += 1
+        if sql in _seen_statements:
+            _seen_statements.move_to_end(sql)
+            return False
+
+        _first_executions += 1
+        _seen_statements[sql] = None
+        if len(_seen_statements) > SEEN_STATEMENTS_SIZE:
+            _seen_statements.popitem(last=False)
+        if sql_fingerprint in _texts_by_fingerprint or len(_texts_by_fingerprint) < SEEN_STATEMENTS_SIZE:
+            _texts_by_fingerprint[sql_fingerprint] = _texts_by_fingerprint.get(sql_fingerprint, 0) + 1
+        return True
+
+
+def get_statement_stats(top: int = 10) -> Dict[str, Any]:
+    """
+    Get this process's statement text statistics for monitoring.
+
+    A first-execution ratio that keeps growing, or fingerprints with many
+    distinct texts, point at statements built with varying text (literals or
+    unbucketed IN lists) that churn the statement cache and shared pool.
+
+    Args:
+        top: Number of fingerprints with the most distinct texts to list
+
+    Returns:
+        Dictionary with execution counts, the first-execution ratio and the
+        fingerprints with the most texts
+    """
+    with _seen_lock:
+        executions = _executions
+        first_executions = _first_executions
+        texts = sorted(_texts_by_fingerprint.items(), key=lambda item: item[1], reverse=True)
+        cached_texts = len(_seen_statements)
+
+    return {
+        "executions": executions,
+        "first_executions": first_executions,
+        "first_execution_ratio": round(first_executions / executions, 4) if executions else None,
+        "distinct_texts": cached_texts,
+        "fingerprints": len(texts),
+        "most_texts": [
+            {"fingerprint": fingerprint_id(sql_fingerprint), "texts": count, "sql": sql_fingerprint[:200]}
+            for sql_fingerprint, count in texts[:top]
+        ]
+    }
+
+
+def record_statement(sql: str, elapsed_seconds: float, rows: int) -> None:
+    """
+    Record a statement execution for the current request and the slow-query log.
+
+    Args:
+        sql: SQL statement text
+        elapsed_seconds: Time spent in the database call
+        rows: Rows returned or affected
+    """
+    elapsed_ms = elapsed_seconds * 1000
+    sql_fingerprint = fingerprint(sql)
+    new_text = _first_execution(sql, sql_fingerprint)
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.add(sql_fingerprint, elapsed_ms, rows, new_text)
+
+    if elapsed_ms >= SLOW_QUERY_MS:
+        logger.warning(
+            "Slow query [%s] %.1f ms, %d rows%s: %.500s",
+            fingerprint_id(sql_fingerprint), elapsed_ms, rows, ', new text' if new_text else '', sql_fingerprint
+        )
+    elif logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Query [%s] %.1f ms, %d rows", fingerprint_id(sql_fingerprint), elapsed_ms, rows)
+
+
+def start_request():
+    """
+    Start collecting statement totals for the current request.
+
+    Returns:
+        Tuple of (stats, token); pass the token to end_request
+    """
+    stats = RequestQueryStats()
+    return stats, _current_stats.set(stats)
+
+
+def end_request(token) -> None:
+    """
+    Stop collecting statement totals for the current request.
+
+    Args:
+        token: Token returned by start_request
+    """
+    _current_stats.reset(token)
+
+
+def get_request_stats() -> Optional[RequestQueryStats]:
+    """Get the statement totals of the current request, if any."""
+    return _current_stats.get()
@@ -5,11 +5,10 @@ This module defines the REST API endpoints for model operations,
 including listing available models and their metadata.
 """
 
-from typing import Optional, List
-from fastapi import APIRouter, HTTPException, Query, Depends
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query
 
-from ..database import get_database
-from ..services.validation_service import ValidationService
+from ..services.model_registry import get_model_registry
 
 router = APIRouter(prefix="/models", tags=["models"])
 
@@ -20,8 +19,7 @@ async def get_available_models(
     name: Optional[str] = Query(None, description="Filter by model name (case-insensitive, partial match)"),
     class_name: Optional[str] = Query(None, description="Filter models that can detect this class"),
     type: Optional[str] = Query(None, description="Filter by model type (yolo, mm)"),
-    dataset: Optional[str] = Query(None, description="Filter by dataset (coco, dota)"),
-    db=Depends(get_database)
+    dataset: Optional[str] = Query(None, description="Filter by dataset (coco, dota)")
 ):
     """
     Get list of available ML models with optional filtering.
@@ -32,7 +30,6 @@ async def get_available_models(
         class_name: Filter models that can detect this class
         type: Filter by model type (yolo, mm)
         dataset: Filter by dataset (coco, dota)
-        db: Database dependency
         
     Returns:
         Dictionary with:
@@ -53,28 +50,26 @@ async def get_available_models(
         /models?type=yolo&class_name=car
     """
     try:
-        validation_service = ValidationService(db)
-        models = validation_service.get_available_models()
+        registry = get_model_registry()
         
-        # Filter models based on query parameters
+        # Narrow the candidates with the registry indexes before filtering
+        if model_id is not None:
+            model = registry.get(model_id)
+            models = [model] if model is not None else []
+        else:
+            models = registry.list_models()
+        
+        if class_name is not None:
+            class_model_ids = registry.model_ids_with_class(class_name)
+            models = [model for model in models if model['id'] in class_model_ids]
+        
+        # Filter models based on the remaining query parameters
         filtered_models = []
         for model in models:
-            # Skip if doesn't match model_id filter
-            if model_id is not None:
-                try:
-                    if int(model['id']) != int(model_id):
-                        continue
-                except (ValueError, TypeError):
-                    continue
-                
             # Skip if doesn't match name filter
             if name is not None and name.lower() not in model['name'].lower():
                 continue
                 
-            # Skip if doesn't match class filter
-            if class_name is not None and class_name.lower() not in [c.lower() for c in model['classes']]:
-                continue
-                
             # Skip if doesn't match type filter
             if type is not None:
                 if type.lower() == 'yolo' and 'yolo' not in model['name'].lower():
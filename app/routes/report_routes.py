@@ -5,42 +5,73 @@ This module defines the REST API endpoints for report operations,
 including CRUD operations and status management.
 """
 
-from typing import Optional
+import json
+from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Query, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from ..database import get_database
+from ..database import AsyncDatabase, get_async_database, get_async_pool
 from ..models import (
     ReportCreate, 
     ReportUpdate, 
     ReportResponse, 
     ReportListResponse,
     ReportCreationResponse,
+    ReportStatsResponse,
     ErrorResponse,
     SuccessResponse
 )
-from ..services.report_service import ReportService
-from ..services.validation_service import ValidationService
+from ..services.report_service import AsyncReportService, DETECTION_EXPORT_BATCH_SIZE
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
 
-@router.get("/", response_model=ReportListResponse)
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated fields query parameter.
+    
+    Args:
+        fields: Comma-separated field names (optional)
+        
+    Returns:
+        List of field names, or None to return every field
+    """
+    if fields is None:
+        return None
+    return [field.strip().lower() for field in fields.split(",") if field.strip()]
+
+
+@router.get("/", response_model=ReportListResponse, response_model_exclude_unset=True)
 async def get_reports(
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     per_page: int = Query(10, ge=1, le=100, description="Number of items per page"),
     author: Optional[str] = Query(None, description="Filter by author"),
     status: Optional[str] = Query(None, description="Filter by status"),
-    db=Depends(get_database)
+    pagination: str = Query("offset", pattern="^(offset|keyset)$", description="Pagination mode (offset, keyset)"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the previous page's next_cursor"),
+    fields: Optional[str] = Query(None, description="Comma-separated report fields to return (e.g. id,name,status)"),
+    include_geometry: bool = Query(True, description="Whether to return image_footprint and area_of_interest"),
+    db=Depends(get_async_database)
 ):
     """
     Get a list of reports with pagination and optional filtering.
     
+    Offset pagination returns the total alongside the page. Keyset pagination
+    (pagination=keyset, or any cursor) orders on (created_at, id) and returns
+    a next_cursor instead, so deep pages cost the same as the first one.
+    
+    A fields list or include_geometry=false narrows the SELECT list, and only
+    the selected fields are returned for each report.
+    
     Args:
-        page: Page number (1-based)
+        page: Page number (1-based, offset pagination only)
         per_page: Number of items per page (1-100)
         author: Filter by author name (optional)
         status: Filter by status (optional)
+        pagination: Pagination mode (offset, keyset)
+        cursor: Keyset cursor from the previous page (optional)
+        fields: Comma-separated report fields to return (optional)
+        include_geometry: Whether to return the geometry fields
         db: Database dependency
         
     Returns:
@@ -50,26 +81,72 @@ async def get_reports(
         HTTPException: If there's an error retrieving reports
     """
     try:
-        service = ReportService(db)
-        result = service.get_reports(page=page, per_page=per_page, author=author, status=status)
+        service = AsyncReportService(db)
+        result = await service.get_reports(
+            page=page,
+            per_page=per_page,
+            author=author,
+            status=status,
+            keyset=pagination == "keyset" or cursor is not None,
+            cursor=cursor,
+            fields=_parse_fields(fields),
+            include_geometry=include_geometry
+        )
         
         return ReportListResponse(
             reports=result['reports'],
             total=result['total'],
             page=result['page'],
-            per_page=result['per_page']
+            per_page=result['per_page'],
+            next_cursor=result['next_cursor']
         )
     except Exception as e:
+        if "invalid pagination cursor" in str(e).lower() or "invalid fields" in str(e).lower():
+            raise HTTPException(
+                status_code=400,
+                detail=str(e)
+            )
         raise HTTPException(
             status_code=500,
             detail=f"Error retrieving reports: {str(e)}"
         )
 
 
+@router.get("/stats", response_model=ReportStatsResponse)
+async def get_report_stats(
+    hours: int = Query(24, ge=1, le=168, description="Hours of completion throughput to return"),
+    db=Depends(get_async_database)
+):
+    """
+    Get report counts by status and author, and reports completed per hour.
+    
+    One aggregate query replaces a filtered list call per status. Results are
+    cached for a few seconds and refreshed when this worker changes a report.
+    
+    Args:
+        hours: Hours of completion throughput to return (1-168)
+        db: Database dependency
+        
+    Returns:
+        Report dashboard aggregates
+        
+    Raises:
+        HTTPException: If there's an error computing the aggregates
+    """
+    try:
+        service = AsyncReportService(db)
+        return await service.get_report_stats(hours)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error retrieving report statistics: {str(e)}"
+        )
+
+
 @router.get("/{report_id}", response_model=ReportResponse)
 async def get_report(
     report_id: int,
-    db=Depends(get_database)
+    db=Depends(get_async_database)
 ):
     """
     Get a specific report by ID.
@@ -85,8 +162,8 @@ async def get_report(
         HTTPException: If report not found or error occurs
     """
     try:
-        service = ReportService(db)
-        report = service.get_report(report_id)
+        service = AsyncReportService(db)
+        report = await service.get_report(report_id)
         return report
     except Exception as e:
         if "not found" in str(e).lower():
@@ -100,10 +177,12 @@ async def get_report(
         )
 
 
-@router.get("/{report_id}/overlapping", response_model=ReportListResponse)
+@router.get("/{report_id}/overlapping", response_model=ReportListResponse, response_model_exclude_unset=True)
 async def get_overlapping_reports(
     report_id: int,
-    db=Depends(get_database)
+    fields: Optional[str] = Query(None, description="Comma-separated report fields to return (e.g. id,name,status)"),
+    include_geometry: bool = Query(True, description="Whether to return image_footprint and area_of_interest"),
+    db=Depends(get_async_database)
 ):
     """
     Get all reports whose area_of_interest overlaps with the specified report.
@@ -114,6 +193,8 @@ async def get_overlapping_reports(
     
     Args:
         report_id: Report ID to find overlaps with
+        fields: Comma-separated report fields to return (optional)
+        include_geometry: Whether to return the geometry fields
         db: Database dependency
         
     Returns:
@@ -123,14 +204,19 @@ async def get_overlapping_reports(
         HTTPException: If report not found, has no area_of_interest, or error occurs
     """
     try:
-        service = ReportService(db)
-        overlapping_reports = service.get_overlapping_reports(report_id)
+        service = AsyncReportService(db)
+        overlapping_reports = await service.get_overlapping_reports(
+            report_id,
+            fields=_parse_fields(fields),
+            include_geometry=include_geometry
+        )
         
         return ReportListResponse(
             reports=overlapping_reports,
             total=len(overlapping_reports),
             page=1,
-            per_page=len(overlapping_reports)
+            per_page=len(overlapping_reports),
+            next_cursor=None
         )
     except Exception as e:
         if "not found" in str(e).lower():
@@ -138,7 +224,7 @@ async def get_overlapping_reports(
                 status_code=404,
                 detail=f"Report with ID {report_id} not found"
             )
-        elif "does not have an area_of_interest" in str(e):
+        elif "does not have an area_of_interest" in str(e) or "invalid fields" in str(e).lower():
             raise HTTPException(
                 status_code=400,
                 detail=str(e)
@@ -149,10 +235,59 @@ async def get_overlapping_reports(
         )
 
 
+@router.get("/{report_id}/detections/export")
+async def export_detections(
+    report_id: int,
+    include_geometry: bool = Query(True, description="Whether to return each detection's footprint"),
+    batch_size: int = Query(DETECTION_EXPORT_BATCH_SIZE, ge=100, le=50000, description="Detections fetched per database round trip"),
+    db=Depends(get_async_database)
+):
+    """
+    Export every detection of a report as newline-delimited JSON.
+    
+    Detections are fetched and written batch by batch, so the export never
+    holds the whole result set in memory.
+    
+    Args:
+        report_id: Report ID
+        include_geometry: Whether to return the footprint geometries
+        batch_size: Detections fetched per database round trip
+        db: Database dependency
+        
+    Returns:
+        Streaming application/x-ndjson response, one detection per line
+        
+    Raises:
+        HTTPException: If report not found or error occurs
+    """
+    try:
+        if not await AsyncReportService(db).report_exists(report_id):
+            raise Exception(f"Report with ID {report_id} not found")
+    except Exception as e:
+        if "not found" in str(e).lower():
+            raise HTTPException(
+                status_code=404,
+                detail=f"Report with ID {report_id} not found"
+            )
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error exporting detections: {str(e)}"
+        )
+    
+    async def ndjson_lines():
+        # The stream outlives the request dependency, so it holds its own connection
+        async with AsyncDatabase(get_async_pool()) as stream_db:
+            service = AsyncReportService(stream_db)
+            async for detections in service.iter_detections(report_id, batch_size, include_geometry):
+                yield "".join(json.dumps(detection, default=str) + "\n" for detection in detections)
+    
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 @router.post("/", response_model=ReportCreationResponse, status_code=202)
 async def create_report(
     report_data: ReportCreate,
-    db=Depends(get_database)
+    db=Depends(get_async_database)
 ):
     """
     Create a new report and trigger background processing.
@@ -174,8 +309,8 @@ async def create_report(
         HTTPException: If validation fails or creation fails
     """
     try:
-        service = ReportService(db)
-        result = service.create_report_with_processing(report_data)
+        service = AsyncReportService(db)
+        result = await service.create_report_with_processing(report_data)
         return result
     except Exception as e:
         # Determine appropriate status code based on error type
@@ -196,7 +331,7 @@ async def create_report(
 async def update_report(
     report_id: int,
     report_data: ReportUpdate,
-    db=Depends(get_database)
+    db=Depends(get_async_database)
 ):
     """
     Update an existing report.
@@ -213,8 +348,8 @@ async def update_report(
         HTTPException: If report not found or update fails
     """
     try:
-        service = ReportService(db)
-        report = service.update_report(report_id, report_data)
+        service = AsyncReportService(db)
+        report = await service.update_report(report_id, report_data)
         return report
     except Exception as e:
         if "not found" in str(e).lower():
@@ -231,7 +366,7 @@ async def update_report(
 @router.delete("/{report_id}", response_model=SuccessResponse)
 async def delete_report(
     report_id: int,
-    db=Depends(get_database)
+    db=Depends(get_async_database)
 ):
     """
     Delete a report.
@@ -247,8 +382,8 @@ async def delete_report(
         HTTPException: If report not found or deletion fails
     """
     try:
-        service = ReportService(db)
-        success = service.delete_report(report_id)
+        service = AsyncReportService(db)
+        success = await service.delete_report(report_id)
         
         if success:
             return SuccessResponse(
@@ -276,7 +411,7 @@ async def delete_report(
 async def update_report_status(
     report_id: int,
     status: str = Query(..., description="New status"),
-    db=Depends(get_database)
+    db=Depends(get_async_database)
 ):
     """
     Update the status of a report.
@@ -293,9 +428,9 @@ async def update_report_status(
         HTTPException: If report not found or status update fails
     """
     try:
-        service = ReportService(db)
+        service = AsyncReportService(db)
         report_data = ReportUpdate(status=status)
-        report = service.update_report(report_id, report_data)
+        report = await service.update_report(report_id, report_data)
         return report
     except Exception as e:
         if "not found" in str(e).lower():
@@ -9,8 +9,8 @@ from typing import Optional
 from fastapi import APIRouter, HTTPException, Query, Depends, status
 from fastapi.responses import JSONResponse
 
-from ..database import Database
-from ..services.ruleset_service import RulesetService
+from ..database import AsyncDatabase, get_async_database
+from ..services.ruleset_service import AsyncRulesetService
 from ..models import (
     RulesetCreate, 
     RulesetUpdate, 
@@ -21,16 +21,9 @@ from ..models import (
 )
 
 
-def get_database() -> Database:
-    """Dependency to get database connection."""
-    db = Database()
-    db.connect()
-    return db
-
-
-def get_ruleset_service(db: Database = Depends(get_database)) -> RulesetService:
+def get_ruleset_service(db: AsyncDatabase = Depends(get_async_database)) -> AsyncRulesetService:
     """Dependency to get ruleset service."""
-    return RulesetService(db)
+    return AsyncRulesetService(db)
 
 
 router = APIRouter(prefix="/rulesets", tags=["rulesets"])
@@ -45,7 +38,7 @@ router = APIRouter(prefix="/rulesets", tags=["rulesets"])
 )
 async def create_ruleset(
     ruleset_data: RulesetCreate,
-    service: RulesetService = Depends(get_ruleset_service)
+    service: AsyncRulesetService = Depends(get_ruleset_service)
 ):
     """
     Create a new ruleset.
@@ -58,8 +51,7 @@ async def create_ruleset(
     - **author**: Author name (required)
     """
     try:
-        with service.db:
-            return service.create_ruleset(ruleset_data)
+        return await service.create_ruleset(ruleset_data)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -77,20 +69,34 @@ async def get_rulesets(
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     per_page: int = Query(10, ge=1, le=100, description="Number of items per page"),
     author: Optional[str] = Query(None, description="Filter by author name"),
-    service: RulesetService = Depends(get_ruleset_service)
+    pagination: str = Query("offset", pattern="^(offset|keyset)$", description="Pagination mode (offset, keyset)"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the previous page's next_cursor"),
+    service: AsyncRulesetService = Depends(get_ruleset_service)
 ):
     """
     Get a paginated list of rulesets.
     
-    - **page**: Page number (default: 1)
+    - **page**: Page number (default: 1, offset pagination only)
     - **per_page**: Number of items per page (default: 10, max: 100)
     - **author**: Filter by author name (optional)
+    - **pagination**: `offset` (default, includes total) or `keyset` (ordered on created_at, id; returns next_cursor)
+    - **cursor**: Keyset cursor from the previous page (optional, implies keyset pagination)
     """
     try:
-        with service.db:
-            result = service.get_rulesets(page=page, per_page=per_page, author=author)
-            return RulesetListResponse(**result)
+        result = await service.get_rulesets(
+            page=page,
+            per_page=per_page,
+            author=author,
+            keyset=pagination == "keyset" or cursor is not None,
+            cursor=cursor
+        )
+        return RulesetListResponse(**result)
     except Exception as e:
+        if "invalid pagination cursor" in str(e).lower():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve rulesets: {str(e)}"
@@ -105,7 +111,7 @@ async def get_rulesets(
 )
 async def get_ruleset(
     ruleset_id: int,
-    service: RulesetService = Depends(get_ruleset_service)
+    service: AsyncRulesetService = Depends(get_ruleset_service)
 ):
     """
     Get a ruleset by ID.
@@ -113,8 +119,7 @@ async def get_ruleset(
     - **ruleset_id**: ID of the ruleset to retrieve
     """
     try:
-        with service.db:
-            return service.get_ruleset(ruleset_id)
+        return await service.get_ruleset(ruleset_id)
     except Exception as e:
         if "not found" in str(e).lower():
             raise HTTPException(
@@ -136,7 +141,7 @@ async def get_ruleset(
 async def update_ruleset(
     ruleset_id: int,
     ruleset_data: RulesetUpdate,
-    service: RulesetService = Depends(get_ruleset_service)
+    service: AsyncRulesetService = Depends(get_ruleset_service)
 ):
     """
     Update a ruleset.
@@ -150,8 +155,7 @@ async def update_ruleset(
     - **author**: New author name (optional)
     """
     try:
-        with service.db:
-            return service.update_ruleset(ruleset_id, ruleset_data)
+        return await service.update_ruleset(ruleset_id, ruleset_data)
     except Exception as e:
         if "not found" in str(e).lower():
             raise HTTPException(
@@ -172,7 +176,7 @@ async def update_ruleset(
 )
 async def delete_ruleset(
     ruleset_id: int,
-    service: RulesetService = Depends(get_ruleset_service)
+    service: AsyncRulesetService = Depends(get_ruleset_service)
 ):
     """
     Delete a ruleset.
@@ -180,18 +184,17 @@ async def delete_ruleset(
     - **ruleset_id**: ID of the ruleset to delete
     """
     try:
-        with service.db:
-            success = service.delete_ruleset(ruleset_id)
-            if success:
-                return SuccessResponse(
-                    message="Ruleset deleted successfully",
-                    data={"id": ruleset_id}
-                )
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to delete ruleset"
-                )
+        success = await service.delete_ruleset(ruleset_id)
+        if success:
+            return SuccessResponse(
+                message="Ruleset deleted successfully",
+                data={"id": ruleset_id}
+            )
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to delete ruleset"
+            )
     except Exception as e:
         if "not found" in str(e).lower():
             raise HTTPException(
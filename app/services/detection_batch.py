@@ -0,0 +1,176 @@
+"""
+Columnar container for the detections of one image.
+
+Model outputs are converted to NumPy once per image and kept as parallel
+arrays (one row per detection) instead of one dictionary per detection, so
+dense scenes with thousands of boxes do not pay for per-box tensor copies
+and small allocations. The list-of-dictionaries format returned by
+ModelInferenceService.predict is built from the arrays only when asked for.
+
+Rotations are kept in radians, the unit both Ultralytics (xywhr) and
+MMRotate (all angle versions: oc, le90, le135) produce; the 'angle' of the
+dictionary format is in degrees.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+
+# Corner offsets from the box center in box widths and heights, in drawing
+# order: top-left, top-right, bottom-right, bottom-left before rotation
+CORNER_OFFSETS = np.array([[-0.5, -0.5], [0.5, -0.5], [0.5, 0.5], [-0.5, 0.5]])
+
+
+def rotated_box_corners(boxes: np.ndarray) -> np.ndarray:
+    """
+    Compute the corners of rotated boxes.
+
+    All boxes are rotated with one batched matrix product instead of a
+    cos/sin evaluation per corner.
+
+    Args:
+        boxes: (N, 5) boxes as [cx, cy, w, h, angle], angle in radians
+
+    Returns:
+        (N, 8) corners as [x1, y1, x2, y2, x3, y3, x4, y4]
+    """
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 5)
+    cos = np.cos(boxes[:, 4])
+    sin = np.sin(boxes[:, 4])
+
+    # (N, 2, 2) rotation matrices, applied to (N, 4, 2) corner offsets
+    rotations = np.stack([np.stack([cos, -sin], axis=1), np.stack([sin, cos], axis=1)], axis=1)
+    offsets = CORNER_OFFSETS[np.newaxis] * boxes[:, np.newaxis, 2:4]
+    corners = boxes[:, np.newaxis, :2] + offsets @ rotations.transpose(0, 2, 1)
+    return corners.reshape(-1, 8)
+
+
+class DetectionBatch:
+    """
+    Detections of one image as parallel arrays.
+
+    Attributes:
+        class_ids: (N,) class indexes
+        confidences: (N,) scores
+        boxes: (N, 4) boxes laid out as described by bbox_type
+        bbox_type: 'xyxy', 'xywh', 'xywha' (boxes are x, y, w, h and angles
+            holds the rotation) or 'obb' (boxes are the enclosing xyxy and
+            obb holds the corners)
+        class_names: Class names by class index (list or dict)
+        obb: (N, 8) corners [x1, y1, ..., x4, y4] of oriented boxes, or None
+        angles: (N,) box rotations in radians, or None
+
+    Usage:
+        batch = service.predict(model_id, image_path, columnar=True)['detections']
+        batch.confidences.mean()
+        batch.to_dicts()        # same format as predict(columnar=False)
+    """
+
+    def __init__(
+        self,
+        class_ids: np.ndarray,
+        confidences: np.ndarray,
+        boxes: np.ndarray,
+        bbox_type: str,
+        class_names: Union[Sequence[str], Mapping[int, str], None] = None,
+        obb: Optional[np.ndarray] = None,
+        angles: Optional[np.ndarray] = None
+    ):
+        """
+        Initialize the batch.
+
+        Args:
+            class_ids: Class index of each detection
+            confidences: Score of each detection
+            boxes: Box of each detection, (N, 4)
+            bbox_type: Layout of boxes (see the class attributes)
+            class_names: Class names by class index; ids are used as names when missing
+            obb: Corners of each oriented box, (N, 8)
+            angles: Rotation of each box in radians
+        """
+        self.class_ids = np.asarray(class_ids).astype(np.int64, copy=False).reshape(-1)
+        self.confidences = np.asarray(confidences).reshape(-1)
+        self.boxes = np.asarray(boxes).reshape(-1, 4)
+        self.bbox_type = bbox_type
+        self.class_names = class_names
+        self.obb = np.asarray(obb).reshape(-1, 8) if obb is not None else None
+        self.angles = np.asarray(angles).reshape(-1) if angles is not None else None
+
+        self._dicts: Optional[List[Dict[str, Any]]] = None
+
+    @classmethod
+    def empty(cls, bbox_type: str = 'xyxy', class_names=None) -> "DetectionBatch":
+        """Create a batch without detections."""
+        return cls(np.empty(0), np.empty(0), np.empty((0, 4)), bbox_type, class_names)
+
+    def __len__(self) -> int:
+        return len(self.class_ids)
+
+    def select(self, mask: np.ndarray) -> "DetectionBatch":
+        """
+        Keep the detections selected by a boolean mask or index array.
+
+        Args:
+            mask: Boolean mask or indexes over the detections
+
+        Returns:
+            New batch with the selected rows
+        """
+        return DetectionBatch(
+            self.class_ids[mask],
+            self.confidences[mask],
+            self.boxes[mask],
+            self.bbox_type,
+            self.class_names,
+            obb=self.obb[mask] if self.obb is not None else None,
+            angles=self.angles[mask] if self.angles is not None else None
+        )
+
+    def class_name(self, class_id: int) -> str:
+        """Get the name of a class index."""
+        if self.class_names is None:
+            return str(class_id)
+        try:
+            return self.class_names[class_id]
+        except (IndexError, KeyError):
+            return str(class_id)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """
+        Convert to one dictionary per detection, built on first call.
+
+        Returns:
+            Detections with class_id, class_name, confidence, bbox and
+            bbox_type, plus obb (8 corner values) for oriented boxes and angle
+            (degrees) for 'xywha' boxes
+        """
+        if self._dicts is not None:
+            return self._dicts
+
+        # One tolist() per column converts to Python scalars in C
+        class_ids = self.class_ids.tolist()
+        names = {class_id: self.class_name(class_id) for class_id in set(class_ids)}
+        columns = [class_ids, self.confidences.tolist(), self.boxes.tolist()]
+        if self.obb is not None:
+            columns.append(self.obb.tolist())
+        if self.bbox_type == 'xywha' and self.angles is not None:
+            columns.append(np.degrees(self.angles).tolist())
+
+        detections = []
+        for row in zip(*columns):
+            detection = {
+                'class_id': row[0],
+                'class_name': names[row[0]],
+                'confidence': row[1],
+                'bbox': row[2],
+                'bbox_type': self.bbox_type
+            }
+            if self.bbox_type == 'xywha' and self.angles is not None:
+                detection['angle'] = row[-1]
+            if self.obb is not None:
+                detection['obb'] = row[3]
+            detections.append(detection)
+
+        self._dicts = detections
+        return detections
@@ -0,0 +1,264 @@
+"""
+Bulk writer for the DETECTIONS table.
+
+A dense scene produces tens of thousands of detections. Instead of one INSERT
+round trip per detection, the writer buffers detections and flushes them with
+a single executemany call per batch. Footprints are bound as SDO_GEOMETRY
+objects, generated IDs come back through an array RETURNING INTO, and rows
+that fail are reported through batch errors instead of aborting the report.
+"""
+
+import os
+import time
+import logging
+from typing import List, Dict, Any, Optional, Tuple
+
+import oracledb
+
+from ..database import Database
+from .sdo_geometry import SDO_GEOMETRY_TYPE_NAME, SdoGeometryConverter
+
+logger = logging.getLogger(__name__)
+
+
+DETECTION_INSERT_QUERY = """
+    INSERT INTO DETECTIONS (
+        report_id, class_name, confidence, model_id,
+        pixel_bbox_x1, pixel_bbox_y1, pixel_bbox_x2, pixel_bbox_y2, footprint
+    )
+    VALUES (
+        :report_id, :class_name, :confidence, :model_id,
+        :pixel_bbox_x1, :pixel_bbox_y1, :pixel_bbox_x2, :pixel_bbox_y2, :footprint
+    )
+    RETURNING id INTO :new_id
+"""
+
+DETECTION_RETURNING = {'new_id': oracledb.DB_TYPE_NUMBER}
+
+# Creates the (empty) DETECTIONS partition of a report unless it exists
+# (ORA-14312). DETECTIONS is not AUTOMATIC list-partitioned (see db/init.sql),
+# so every writer runs this before its first insert, while it has nothing
+# uncommitted. The DDL retries for up to a minute while concurrent writers
+# hold their short locks (ORA-00054). It does not set DDL_LOCK_TIMEOUT,
+# which would stay set on the pooled session for every later borrower.
+ADD_DETECTIONS_PARTITION_BLOCK = """
+    DECLARE
+        partition_exists EXCEPTION;
+        resource_busy EXCEPTION;
+        PRAGMA EXCEPTION_INIT(partition_exists, -14312);
+        PRAGMA EXCEPTION_INIT(resource_busy, -54);
+    BEGIN
+        FOR attempt IN 1 .. 60 LOOP
+            BEGIN
+                EXECUTE IMMEDIATE 'ALTER TABLE DETECTIONS ADD PARTITION VALUES ('
+                    || TO_CHAR(TRUNC(:report_id)) || ')';
+                RETURN;
+            EXCEPTION
+                WHEN partition_exists THEN
+                    RETURN;
+                WHEN resource_busy THEN
+                    IF attempt = 60 THEN
+                        RAISE;
+                    END IF;
+                    DBMS_SESSION.SLEEP(1);
+            END;
+        END LOOP;
+    END;
+"""
+
+# Keep at most this many batch error messages for the writer statistics
+MAX_REPORTED_ERRORS = 100
+
+
+class DetectionBulkWriter:
+    """
+    Buffers detections of one report and inserts them with array DML.
+
+    Usage:
+        with DetectionBulkWriter(db, report_id, model_id) as writer:
+            for detection in detections:
+                writer.add(detection)
+        logger.info(writer.get_stats())
+    """
+
+    def __init__(self, db: Database, report_id: int, model_id: Optional[str] = None,
+                 batch_size: Optional[int] = None, commit_interval: Optional[int] = None):
+        """
+        Initialize the writer.
+
+        Args:
+            db: Connected database instance
+            report_id: ID of the report the detections belong to
+            model_id: Model identifier stored with detections that do not carry one
+            batch_size: Detections per executemany call
+                (default: DETECTION_INSERT_BATCH_SIZE or 1000)
+            commit_interval: Rows written between commits
+                (default: DETECTION_COMMIT_INTERVAL or 10000)
+        """
+        self.db = db
+        self.report_id = report_id
+        self.model_id = model_id
+        self.batch_size = batch_size if batch_size is not None else int(os.getenv('DETECTION_INSERT_BATCH_SIZE', '1000'))
+        self.commit_interval = (
+            commit_interval if commit_interval is not None else int(os.getenv('DETECTION_COMMIT_INTERVAL', '10000'))
+        )
+
+        self._buffer: List[Dict[str, Any]] = []
+        self._converter: Optional[SdoGeometryConverter] = None
+        self._uncommitted = 0
+        self._partition_ready = False
+
+        self.detection_ids: List[int] = []
+        self.rows_written = 0
+        self.rows_failed = 0
+        self.batches = 0
+        self.elapsed_seconds = 0.0
+        self.errors: List[Tuple[int, str]] = []
+
+    def add(self, detection: Dict[str, Any]) -> None:
+        """
+        Buffer a detection, flushing when the batch is full.
+
+        Args:
+            detection: Detection with class_name, confidence, a pixel bounding
+                box ('pixel_bbox' or 'bbox' as [x1, y1, x2, y2]), and optionally
+                model_id and a GeoJSON 'footprint'
+        """
+        self._buffer.append(detection)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def add_many(self, detections: List[Dict[str, Any]]) -> None:
+        """
+        Buffer several detections.
+
+        Args:
+            detections: Detections (see add)
+        """
+        for detection in detections:
+            self.add(detection)
+
+    def flush(self, commit: bool = False) -> None:
+        """
+        Insert the buffered detections in one round trip.
+
+        Args:
+            commit: Commit even if the commit interval has not been reached
+        """
+        if not self._buffer:
+            if commit and self._uncommitted:
+                self.db.connection.commit()
+                self._uncommitted = 0
+            return
+
+        batch, self._buffer = self._buffer, []
+        params_list = [self._detection_params(detection) for detection in batch]
+
+        if not self._partition_ready:
+            self._add_partition()
+            self._partition_ready = True
+
+        self._uncommitted += len(batch)
+        commit = commit or self._uncommitted >= self.commit_interval
+
+        start = time.perf_counter()
+        result = self.db.execute_batch(
+            DETECTION_INSERT_QUERY,
+            params_list,
+            returning=DETECTION_RETURNING,
+            input_sizes={'footprint': self._geometry_converter().geometry_type},
+            batch_errors=True,
+            commit=commit
+        )
+        self.elapsed_seconds += time.perf_counter() - start
+
+        if commit:
+            self._uncommitted = 0
+
+        # Batch error offsets are relative to the batch; report them per writer
+        first_offset = self.rows_written + self.rows_failed
+        for offset, message in result['errors']:
+            if len(self.errors) < MAX_REPORTED_ERRORS:
+                self.errors.append((first_offset + offset, message))
+            logger.warning("Detection insert failed for report_id %s: %s", self.report_id, message)
+
+        self.batches += 1
+        self.rows_failed += len(result['errors'])
+        self.rows_written += len(batch) - len(result['errors'])
+        self.detection_ids.extend(int(new_id) for new_id in result['returned']['new_id'] if new_id is not None)
+
+    def close(self) -> None:
+        """Flush the remaining detections, commit and log throughput."""
+        self.flush(commit=True)
+
+        stats = self.get_stats()
+        logger.info(
+            "Stored %s detections for report_id %s "
+            "in %s batches (%s rows/s, %s failed)",
+            stats['rows_written'], self.report_id, stats['batches'], stats['rows_per_second'], stats['rows_failed']
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get write statistics.
+
+        Returns:
+            Dictionary with row counts, batches, database time, rows/second
+            and the first errors as (detection offset, message) tuples
+        """
+        rows_per_second = round(self.rows_written / self.elapsed_seconds, 1) if self.elapsed_seconds else None
+        return {
+            "rows_written": self.rows_written,
+            "rows_failed": self.rows_failed,
+            "batches": self.batches,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "rows_per_second": rows_per_second,
+            "errors": list(self.errors)
+        }
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit; flushes and commits unless an error occurred."""
+        if exc_type is None:
+            self.close()
+
+    def _add_partition(self) -> None:
+        """Create the report's DETECTIONS partition if it does not exist yet."""
+        self.db.execute_update(ADD_DETECTIONS_PARTITION_BLOCK, {'report_id': self.report_id})
+
+    def _geometry_converter(self) -> SdoGeometryConverter:
+        """Get the SDO_GEOMETRY converter, looking up the type once."""
+        if self._converter is None:
+            self._converter = SdoGeometryConverter(self.db.get_type(SDO_GEOMETRY_TYPE_NAME))
+        return self._converter
+
+    def _detection_params(self, detection: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the bind parameters of one detection.
+
+        Args:
+            detection: Detection (see add)
+
+        Returns:
+            Bind parameters for DETECTION_INSERT_QUERY
+        """
+        x1, y1, x2, y2 = detection.get('pixel_bbox', detection.get('bbox'))[:4]
+
+        footprint = None
+        if detection.get('footprint'):
+            footprint = self._geometry_converter().to_sdo(detection['footprint'])
+
+        return {
+            'report_id': self.report_id,
+            'class_name': detection.get('class_name'),
+            'confidence': detection.get('confidence'),
+            'model_id': detection.get('model_id', self.model_id),
+            'pixel_bbox_x1': int(round(x1)),
+            'pixel_bbox_y1': int(round(y1)),
+            'pixel_bbox_x2': int(round(x2)),
+            'pixel_bbox_y2': int(round(y2)),
+            'footprint': footprint
+        }
@@ -0,0 +1,242 @@
+"""
+Health checks for load balancer probes and monitoring.
+
+Probes arrive every few seconds per node, so they must not open connections
+or call other services. Liveness does no I/O at all, and readiness pings a
+connection borrowed from the pool. The expensive checks (a database query,
+an object storage HEAD, a scan of the model registry) run in a background
+task, and probes report their cached results, marked stale once older than
+the TTL.
+"""
+
+import asyncio
+import os
+import time
+import logging
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import requests
+
+from ..database import get_async_pool
+from .model_registry import get_model_registry
+
+logger = logging.getLogger(__name__)
+
+
+def _count_models() -> int:
+    """
+    Refresh the model registry and count the models with metadata.
+
+    Returns:
+        Number of registered models
+
+    Raises:
+        Exception: If the models directory does not exist
+    """
+    registry = get_model_registry()
+    if not os.path.isdir(registry.models_dir):
+        raise Exception(f"Models directory {registry.models_dir} not found")
+
+    registry.refresh(force=True)
+    return registry.get_stats()["models"]
+
+
+def _head_object_storage(timeout: float) -> int:
+    """
+    Send a HEAD request to the bucket's object endpoint.
+
+    Args:
+        timeout: Request timeout in seconds
+
+    Returns:
+        HTTP status code
+
+    Raises:
+        Exception: If object storage is unreachable or answers with a server error
+    """
+    from .object_storage_service import PAR_BASE_URL
+
+    response = requests.head(PAR_BASE_URL.rstrip("/") + "/o", timeout=timeout)
+    if response.status_code >= 500:
+        raise Exception(f"Object storage answered HTTP {response.status_code}")
+    return response.status_code
+
+
+class HealthMonitor:
+    """
+    Runs the deep health checks in the background and caches their results.
+
+    Usage:
+        monitor = get_health_monitor()
+        monitor.start()              # from the application lifespan
+        monitor.get_results()        # from a probe, no I/O
+        await monitor.stop()
+    """
+
+    def __init__(self, interval_seconds: Optional[float] = None, ttl_seconds: Optional[float] = None,
+                 timeout_seconds: Optional[float] = None):
+        """
+        Initialize the monitor.
+
+        Args:
+            interval_seconds: Seconds between deep check rounds (default: HEALTH_CHECK_INTERVAL or 30)
+            ttl_seconds: Age after which a result is reported as stale (default: HEALTH_CHECK_TTL or 90)
+            timeout_seconds: Timeout of each check (default: HEALTH_CHECK_TIMEOUT or 5)
+        """
+        self.interval_seconds = (
+            interval_seconds if interval_seconds is not None else float(os.getenv('HEALTH_CHECK_INTERVAL', '30'))
+        )
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(os.getenv('HEALTH_CHECK_TTL', '90'))
+        self.timeout_seconds = (
+            timeout_seconds if timeout_seconds is not None else float(os.getenv('HEALTH_CHECK_TIMEOUT', '5'))
+        )
+
+        self.checks: Dict[str, Callable[[], Awaitable[Any]]] = {
+            "database": self._check_database,
+            "object_storage": self._check_object_storage,
+            "model_registry": self._check_model_registry
+        }
+
+        # check name -> result dictionary plus its monotonic timestamp
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the background check loop on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background check loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def run_checks(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Run every deep check once, concurrently, and cache the results.
+
+        Returns:
+            Results by check name (see get_results)
+        """
+        names = list(self.checks)
+        outcomes = await asyncio.gather(*(self._run_check(name) for name in names))
+        for name, outcome in zip(names, outcomes):
+            self._results[name] = outcome
+        return self.get_results()
+
+    def get_results(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the cached deep check results without doing any I/O.
+
+        Returns:
+            Results by check name, each with 'status' ('ok', 'error', 'stale'
+            or 'pending'), 'checked_at', 'age_seconds', 'duration_ms' and a
+            'detail' or 'error'
+        """
+        now = time.monotonic()
+        results = {}
+        for name in self.checks:
+            cached = self._results.get(name)
+            if cached is None:
+                results[name] = {"status": "pending"}
+                continue
+
+            result = {key: value for key, value in cached.items() if key != 'monotonic'}
+            result["age_seconds"] = round(now - cached['monotonic'], 1)
+            if result["age_seconds"] > self.ttl_seconds:
+                result["status"] = "stale"
+            results[name] = result
+        return results
+
+    def is_healthy(self) -> bool:
+        """Whether every deep check has a fresh successful result."""
+        return all(result["status"] == "ok" for result in self.get_results().values())
+
+    async def _run(self) -> None:
+        """Run the checks every interval until cancelled."""
+        while True:
+            try:
+                await self.run_checks()
+            except Exception as e:
+                logger.error("Deep health checks failed: %s", e)
+            await asyncio.sleep(self.interval_seconds)
+
+    async def _run_check(self, name: str) -> Dict[str, Any]:
+        """
+        Run one check with a timeout.
+
+        Args:
+            name: Check name
+
+        Returns:
+            Result dictionary
+        """
+        start = time.perf_counter()
+        result: Dict[str, Any] = {"checked_at": datetime.now(timezone.utc).isoformat()}
+        try:
+            detail = await asyncio.wait_for(self.checks[name](), timeout=self.timeout_seconds)
+            result["status"] = "ok"
+            if detail is not None:
+                result["detail"] = detail
+        except asyncio.TimeoutError:
+            result["status"] = "error"
+            result["error"] = f"Timed out after {self.timeout_seconds}s"
+        except Exception as e:
+            result["status"] = "error"
+            result["error"] = str(e)
+
+        if result["status"] != "ok":
+            logger.warning("Health check %s failed: %s", name, result['error'])
+
+        result["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        result["monotonic"] = time.monotonic()
+        return result
+
+    async def _check_database(self) -> Dict[str, Any]:
+        """Run a query on a pooled connection."""
+        pool = get_async_pool()
+        connection = await pool.acquire()
+        try:
+            with connection.cursor() as cursor:
+                await cursor.execute("SELECT 1 FROM DUAL")
+                await cursor.fetchone()
+        finally:
+            await pool.release(connection)
+        return pool.get_stats()
+
+    async def _check_object_storage(self) -> Dict[str, Any]:
+        """HEAD the bucket's object endpoint."""
+        status_code = await asyncio.to_thread(_head_object_storage, self.timeout_seconds)
+        return {"http_status": status_code}
+
+    async def _check_model_registry(self) -> Dict[str, Any]:
+        """Count the models with metadata."""
+        models = await asyncio.to_thread(_count_models)
+        if not models:
+            raise Exception("No models with metadata.json found")
+        return {"models": models}
+
+
+# Process-wide monitor shared by the health endpoints
+_health_monitor: Optional[HealthMonitor] = None
+
+
+def get_health_monitor() -> HealthMonitor:
+    """
+    Get the process-wide health monitor, creating it on first use.
+
+    Returns:
+        Shared HealthMonitor instance
+    """
+    global _health_monitor
+
+    if _health_monitor is None:
+        _health_monitor = HealthMonitor()
+
+    return _health_monitor
@@ -0,0 +1,143 @@
+"""
+Small TTL cache for the results of existence lookups.
+
+Report creation checks that the image exists in object storage and that the
+model is available. Both answers change rarely, but each check costs an HTTP
+round trip or a scan of the models directory, so their results are cached
+for a short time.
+
+TTLCache is also the storage of the ruleset cache (see ruleset_cache.py)
+and of the report stats cache.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire after a fixed time.
+
+    Shared by request threads and the event loop, so every operation holds
+    a lock.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Seconds an entry is served after it was stored; with 0
+                entries are kept but never served by get (renew_if still sees them)
+            max_size: Maximum number of entries (0 disables the cache)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+
+        # key -> (expires_at, value), least recently used first
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up an entry that has not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (found, value)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                self.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store an entry, evicting the least recently used one if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def renew_if(self, key: Hashable, predicate: Callable[[Any], bool]) -> Tuple[bool, Any]:
+        """
+        Renew an entry, expired or not, if its value satisfies a predicate.
+
+        Lets a caller that has checked an entry is still current (e.g. by its
+        version) reuse it without storing it again.
+
+        Args:
+            key: Cache key
+            predicate: Called with the cached value under the cache lock
+
+        Returns:
+            Tuple of (renewed, value)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not predicate(entry[1]):
+                return False, None
+
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, entry[1])
+            self._entries.move_to_end(key)
+            return True, entry[1]
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Drop an entry.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics for monitoring.
+
+        Returns:
+            Dictionary with size, limits and hit/miss counters
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations
+            }
@@ -0,0 +1,407 @@
+"""
+Memory-budgeted cache of loaded detection models, and startup warm-up.
+
+Loaded models stay in memory between predictions, but the large detectors
+(YOLOv8x/11x, the MMRotate R50 models) take several hundred MB each, so the
+cache holds them within MODEL_CACHE_BUDGET_MB and evicts the least recently
+used unpinned model to make room. A model's size is estimated from its
+checkpoint size before loading and replaced by the resident memory it
+actually added once loaded.
+
+Models listed in MODEL_WARMUP are loaded, pinned and run once on a blank
+image in the background at startup; the readiness probe reports the node
+as not ready until that finishes.
+
+This module does not import torch, so the API can report cache state
+without loading the ML stack.
+"""
+
+import asyncio
+import gc
+import os
+import sys
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+MB = 1024 * 1024
+
+
+def current_rss_bytes() -> Optional[int]:
+    """
+    Get the resident set size of this process.
+
+    Returns:
+        Resident memory in bytes, or None where /proc is unavailable
+    """
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class ModelCache:
+    """
+    LRU cache of loaded models bounded by an estimated memory budget.
+
+    Entries are the dictionaries built by ModelInferenceService.load_model
+    ('model', 'type', 'metadata'), extended here with 'size_bytes',
+    'measured' and 'pinned'. Pinned models are never evicted.
+    """
+
+    def __init__(self, budget_mb: Optional[float] = None, memory_factor: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            budget_mb: Memory budget for loaded models (default: MODEL_CACHE_BUDGET_MB or 4096)
+            memory_factor: Resident memory per checkpoint byte assumed before a
+                model is measured (default: MODEL_MEMORY_FACTOR or 2.0)
+        """
+        self.budget_bytes = int(
+            (budget_mb if budget_mb is not None else float(os.getenv('MODEL_CACHE_BUDGET_MB', '4096'))) * MB
+        )
+        self.memory_factor = (
+            memory_factor if memory_factor is not None else float(os.getenv('MODEL_MEMORY_FACTOR', '2.0'))
+        )
+
+        self._entries: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        # Sizes measured at load time, reused as estimates when a model is reloaded
+        self._measured_bytes: Dict[int, int] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, model_id: int) -> bool:
+        with self._lock:
+            return model_id in self._entries
+
+    def get(self, model_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a loaded model and mark it as most recently used.
+
+        Args:
+            model_id: Model ID
+
+        Returns:
+            Cache entry, or None if the model is not loaded
+        """
+        with self._lock:
+            entry = self._entries.get(model_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(model_id)
+            self.hits += 1
+            return entry
+
+    def estimate_bytes(self, model_id: int, metadata: Dict[str, Any]) -> int:
+        """
+        Estimate the memory a model will take once loaded.
+
+        Args:
+            model_id: Model ID
+            metadata: Model metadata with checkpoint_size_mb
+
+        Returns:
+            The size measured when the model was last loaded, or the
+            checkpoint size times the memory factor
+        """
+        measured = self._measured_bytes.get(model_id)
+        if measured:
+            return measured
+        return int(float(metadata.get('checkpoint_size_mb') or 0) * MB * self.memory_factor)
+
+    def reserve(self, size_bytes: int) -> None:
+        """
+        Evict least recently used unpinned models until size_bytes fit.
+
+        Args:
+            size_bytes: Memory needed by a model about to be loaded
+
+        Raises:
+            Exception: If the model does not fit even after evicting every
+                unpinned model
+        """
+        with self._lock:
+            pinned_bytes = sum(entry['size_bytes'] for entry in self._entries.values() if entry['pinned'])
+            if pinned_bytes + size_bytes > self.budget_bytes:
+                raise Exception(
+                    f"Model needs about {size_bytes / MB:.0f} MB but only "
+                    f"{(self.budget_bytes - pinned_bytes) / MB:.0f} MB of the model cache budget "
+                    f"is not pinned (MODEL_CACHE_BUDGET_MB={self.budget_bytes / MB:.0f})"
+                )
+            self._evict_until(self.budget_bytes - size_bytes)
+
+    def put(self, model_id: int, entry: Dict[str, Any], size_bytes: int, measured: bool) -> None:
+        """
+        Add a loaded model, evicting others if it turned out larger than estimated.
+
+        Args:
+            model_id: Model ID
+            entry: Entry built by the loader
+            size_bytes: Memory attributed to the model
+            measured: Whether size_bytes was measured rather than estimated
+        """
+        with self._lock:
+            previous = self._entries.pop(model_id, None)
+            entry['size_bytes'] = size_bytes
+            entry['measured'] = measured
+            entry['pinned'] = previous['pinned'] if previous is not None else False
+            if measured:
+                self._measured_bytes[model_id] = size_bytes
+
+            self._evict_until(self.budget_bytes - size_bytes)
+            self._entries[model_id] = entry
+
+            used = sum(cached['size_bytes'] for cached in self._entries.values())
+            if used > self.budget_bytes:
+                logger.warning(
+                    "Model cache uses %.0f MB, over its %.0f MB budget: "
+                    "model %s took more memory than estimated and the rest is pinned",
+                    used / MB, self.budget_bytes / MB, model_id
+                )
+
+    def pin(self, model_id: int) -> bool:
+        """
+        Keep a loaded model from being evicted.
+
+        Args:
+            model_id: Model ID
+
+        Returns:
+            True if the model is loaded and now pinned
+        """
+        with self._lock:
+            entry = self._entries.get(model_id)
+            if entry is None:
+                return False
+            entry['pinned'] = True
+            return True
+
+    def unpin(self, model_id: int) -> bool:
+        """
+        Let a model be evicted again.
+
+        Args:
+            model_id: Model ID
+
+        Returns:
+            True if the model is loaded and was unpinned
+        """
+        with self._lock:
+            entry = self._entries.get(model_id)
+            if entry is None:
+                return False
+            entry['pinned'] = False
+            return True
+
+    def remove(self, model_id: int) -> bool:
+        """
+        Drop a model, pinned or not.
+
+        Args:
+            model_id: Model ID
+
+        Returns:
+            True if the model was loaded
+        """
+        with self._lock:
+            removed = self._entries.pop(model_id, None) is not None
+        if removed:
+            self._release_memory()
+        return removed
+
+    def clear(self) -> None:
+        """Drop every model."""
+        with self._lock:
+            self._entries.clear()
+        self._release_memory()
+
+    def keys(self) -> List[int]:
+        """IDs of the loaded models, least recently used first."""
+        with self._lock:
+            return list(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics for monitoring.
+
+        Returns:
+            Dictionary with the budget, usage, counters and loaded models
+        """
+        with self._lock:
+            used = sum(entry['size_bytes'] for entry in self._entries.values())
+            return {
+                "budget_mb": round(self.budget_bytes / MB, 1),
+                "used_mb": round(used / MB, 1),
+                "memory_factor": self.memory_factor,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "models": [
+                    {
+                        "id": model_id,
+                        "name": entry['metadata'].get('name'),
+                        "size_mb": round(entry['size_bytes'] / MB, 1),
+                        "measured": entry['measured'],
+                        "pinned": entry['pinned']
+                    }
+                    for model_id, entry in self._entries.items()
+                ]
+            }
+
+    def _evict_until(self, max_used_bytes: int) -> None:
+        """Evict least recently used unpinned models until usage is at most max_used_bytes."""
+        evicted = False
+        used = sum(entry['size_bytes'] for entry in self._entries.values())
+        for model_id in list(self._entries):
+            if used <= max_used_bytes:
+                break
+            entry = self._entries[model_id]
+            if entry['pinned']:
+                continue
+            del self._entries[model_id]
+            used -= entry['size_bytes']
+            self.evictions += 1
+            evicted = True
+            logger.info("Evicted model %s (%.0f MB) from the model cache", model_id, entry['size_bytes'] / MB)
+
+        if evicted:
+            self._release_memory()
+
+    def _release_memory(self) -> None:
+        """Collect dropped models and return cached GPU memory."""
+        gc.collect()
+        torch = sys.modules.get('torch')
+        if torch is not None and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+
+class ModelWarmup:
+    """
+    Loads, pins and exercises the MODEL_WARMUP models in the background.
+
+    Usage:
+        warmup = get_model_warmup()
+        warmup.start()          # from the application lifespan
+        warmup.ready            # checked by the readiness probe
+    """
+
+    def __init__(self, model_ids: Optional[List[int]] = None):
+        """
+        Initialize the warm-up.
+
+        Args:
+            model_ids: Models to warm up (default: comma-separated MODEL_WARMUP)
+        """
+        if model_ids is None:
+            model_ids = [int(value) for value in os.getenv('MODEL_WARMUP', '').split(',') if value.strip()]
+        self.model_ids = model_ids
+
+        self.state = "done" if not model_ids else "pending"
+        self.results: Dict[int, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether the warm-up has finished (successfully or not) or has nothing to do."""
+        return self.state == "done"
+
+    def start(self) -> None:
+        """Start the warm-up on the running event loop."""
+        if self.state == "pending" and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop waiting for the warm-up; a model being loaded finishes in its thread."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get the warm-up state for the readiness probe.
+
+        Returns:
+            Dictionary with the state and per-model results
+        """
+        return {"state": self.state, "models": self.model_ids, "results": self.results}
+
+    async def _run(self) -> None:
+        """Warm up each model in a worker thread."""
+        self.state = "running"
+        try:
+            # Imports the ML stack; unavailable where torch is not installed
+            from .model_inference_service import get_model_inference_service
+            service = get_model_inference_service()
+        except Exception as e:
+            logger.error("Model warm-up unavailable: %s", e)
+            self.results = {model_id: {"status": "error", "error": str(e)} for model_id in self.model_ids}
+            self.state = "done"
+            return
+
+        for model_id in self.model_ids:
+            start = time.perf_counter()
+            try:
+                await asyncio.to_thread(service.warm_up_model, model_id)
+                self.results[model_id] = {"status": "ok"}
+            except Exception as e:
+                logger.error("Warm-up of model %s failed: %s", model_id, e)
+                self.results[model_id] = {"status": "error", "error": str(e)}
+            self.results[model_id]["seconds"] = round(time.perf_counter() - start, 2)
+        self.state = "done"
+        logger.info("Model warm-up finished: %s", self.results)
+
+
+# Process-wide cache shared by every ModelInferenceService
+_model_cache: Optional[ModelCache] = None
+_model_warmup: Optional[ModelWarmup] = None
+_singleton_lock = threading.Lock()
+
+
+def get_model_cache() -> ModelCache:
+    """
+    Get the process-wide model cache, creating it on first use.
+
+    Returns:
+        Shared ModelCache instance
+    """
+    global _model_cache
+
+    if _model_cache is None:
+        with _singleton_lock:
+            if _model_cache is None:
+                _model_cache = ModelCache()
+
+    return _model_cache
+
+
+def get_model_warmup() -> ModelWarmup:
+    """
+    Get the process-wide model warm-up, creating it on first use.
+
+    Returns:
+        Shared ModelWarmup instance
+    """
+    global _model_warmup
+
+    if _model_warmup is None:
+        with _singleton_lock:
+            if _model_warmup is None:
+                _model_warmup = ModelWarmup()
+
+    return _model_warmup
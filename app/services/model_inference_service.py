@@ -6,8 +6,10 @@ model types (YOLO, MMRotate) with consistent output format.
 """
 
 import os
-import json
-import math
+import time
+import logging
+import importlib
+import threading
 import numpy as np
 import torch
 from pathlib import Path
@@ -15,6 +17,34 @@ from typing import List, Dict, Any, Optional, Union
 from PIL import Image
 import cv2
 
+from .model_registry import get_model_registry
+from .model_cache import ModelCache, get_model_cache, current_rss_bytes
+from .detection_batch import DetectionBatch, rotated_box_corners
+
+logger = logging.getLogger(__name__)
+
+
+# Framework modules imported before a load is measured, so their import cost
+# is not attributed to the first model of each type
+FRAMEWORK_MODULES = {
+    'yolo': ['ultralytics'],
+    'yolo-obb': ['ultralytics'],
+    'mmrotate': ['mmrotate', 'mmdet.apis']
+}
+
+# Blank image side used for warm-up forward passes
+WARMUP_IMAGE_SIZE = 640
+
+# Batch sizes tried by calibrate_batch_size, smallest first
+BATCH_SIZE_CANDIDATES = (1, 2, 4, 8, 16)
+
+# Minimum throughput gain for calibration to keep doubling the batch size
+BATCH_CALIBRATION_MIN_GAIN = 0.05
+
+# Loads are serialized: they are memory-bound, and concurrent loads would
+# blur the resident memory measured for each model
+_load_lock = threading.Lock()
+
 
 class ModelInferenceService:
     """
@@ -25,14 +55,25 @@ class ModelInferenceService:
     - MMRotate models (Oriented R-CNN, Rotated RetinaNet, etc.)
     """
     
-    def __init__(self):
-        """Initialize the model inference service."""
-        self.models_dir = Path(__file__).parent.parent.parent / "models"
-        self.loaded_models = {}  # Cache for loaded models
+    def __init__(self, cache: Optional[ModelCache] = None, batch_size: Optional[int] = None):
+        """
+        Initialize the model inference service.
+        
+        Args:
+            cache: Loaded model cache (default: the process-wide cache)
+            batch_size: Images per forward pass in predict_batch
+                (default: INFERENCE_BATCH_SIZE; 0 calibrates per model and image size)
+        """
+        self.registry = get_model_registry()
+        self.loaded_models = cache if cache is not None else get_model_cache()
+        self.batch_size = batch_size if batch_size is not None else int(os.getenv('INFERENCE_BATCH_SIZE', '0'))
+        
+        # Calibrated batch size by (model_id, image shape)
+        self._calibrated_batch_sizes: Dict[tuple, int] = {}
         
     def _get_model_metadata(self, model_id: int) -> Optional[Dict[str, Any]]:
         """
-        Get model metadata by ID.
+        Get model metadata by ID from the shared model registry.
         
         Args:
             model_id: Model ID to look up
@@ -40,25 +81,7 @@ class ModelInferenceService:
         Returns:
             Dictionary with model metadata or None if not found
         """
-        if not self.models_dir.exists():
-            return None
-            
-        for model_folder in self.models_dir.iterdir():
-            if model_folder.is_dir():
-                metadata_file = model_folder / "metadata.json"
-                if metadata_file.exists():
-                    try:
-                        with open(metadata_file, 'r') as f:
-                            metadata = json.load(f)
-                            if metadata.get('id') == model_id:
-                                metadata['folder'] = model_folder.name
-                                metadata['folder_path'] = str(model_folder)
-                                metadata['checkpoint_path'] = str(model_folder / "file.pt")
-                                return metadata
-                    except (json.JSONDecodeError, IOError):
-                        continue
-        
-        return None
+        return self.registry.get(model_id)
     
     def _determine_model_type(self, folder_name: str) -> str:
         """
@@ -158,33 +181,113 @@ class ModelInferenceService:
         
         # Determine model type
         model_type = self._determine_model_type(metadata['folder'])
+        if model_type not in FRAMEWORK_MODULES:
+            return False
         
-        try:
-            # Load model based on type
-            if model_type in ['yolo', 'yolo-obb']:
-                model = self._load_yolo_model(checkpoint_path)
-                self.loaded_models[model_id] = {
-                    'model': model,
-                    'type': model_type,
-                    'metadata': metadata
-                }
+        with _load_lock:
+            if model_id in self.loaded_models:
                 return True
-            elif model_type == 'mmrotate':
-                model = self._load_mmrotate_model(checkpoint_path, metadata['folder'])
-                self.loaded_models[model_id] = {
+            
+            try:
+                # Make room within the memory budget before loading
+                estimate = self.loaded_models.estimate_bytes(model_id, metadata)
+                self.loaded_models.reserve(estimate)
+                
+                for module in FRAMEWORK_MODULES[model_type]:
+                    importlib.import_module(module)
+                before = self._memory_in_use()
+                
+                # Load model based on type
+                if model_type == 'mmrotate':
+                    model = self._load_mmrotate_model(checkpoint_path, metadata['folder'])
+                else:
+                    model = self._load_yolo_model(checkpoint_path)
+                
+                after = self._memory_in_use()
+                measured = before is not None and after is not None and after > before
+                size_bytes = after - before if measured else estimate
+                
+                self.loaded_models.put(model_id, {
                     'model': model,
                     'type': model_type,
                     'metadata': metadata
-                }
+                }, size_bytes, measured)
+                logger.info(
+                    "Loaded model %s (%s, %.0f MB %s)", model_id, metadata.get('name'),
+                    size_bytes / 1024 / 1024, 'measured' if measured else 'estimated'
+                )
                 return True
-            else:
-                return False
                 
-        except Exception as e:
-            print(f"Error loading model {model_id}: {str(e)}")
+            except Exception as e:
+                logger.error("Error loading model %s: %s", model_id, e)
+                return False
+    
+    def _memory_in_use(self) -> Optional[int]:
+        """
+        Get the memory a model load adds to: process RSS plus allocated GPU memory.
+        
+        Returns:
+            Bytes in use, or None if the resident size is unavailable
+        """
+        rss = current_rss_bytes()
+        if rss is None:
+            return None
+        if torch.cuda.is_available():
+            rss += torch.cuda.memory_allocated()
+        return rss
+    
+    def pin_model(self, model_id: int, load: bool = True) -> bool:
+        """
+        Keep a model loaded regardless of the cache budget's LRU eviction.
+        
+        Args:
+            model_id: ID of the model to pin
+            load: Load the model first if it is not loaded (default: True)
+            
+        Returns:
+            True if the model is loaded and pinned
+        """
+        if load and not self.load_model(model_id):
             return False
+        return self.loaded_models.pin(model_id)
     
-    def _yolo_inference(self, model, image_path: str, confidence: float) -> List[Dict[str, Any]]:
+    def unpin_model(self, model_id: int) -> bool:
+        """
+        Let a pinned model be evicted again.
+        
+        Args:
+            model_id: ID of the model to unpin
+            
+        Returns:
+            True if the model was loaded
+        """
+        return self.loaded_models.unpin(model_id)
+    
+    def warm_up_model(self, model_id: int) -> None:
+        """
+        Load and pin a model, then run one forward pass on a blank image.
+        
+        The first forward pass initializes lazily built state (fused layers,
+        CUDA kernels, autotuning), which would otherwise slow the first request.
+        
+        Args:
+            model_id: ID of the model to warm up
+            
+        Raises:
+            Exception: If the model cannot be loaded or the forward pass fails
+        """
+        if not self.pin_model(model_id):
+            raise Exception(f"Failed to load model with ID {model_id}")
+        
+        model_info = self.loaded_models.get(model_id)
+        blank = np.zeros((WARMUP_IMAGE_SIZE, WARMUP_IMAGE_SIZE, 3), dtype=np.uint8)
+        if model_info['type'] == 'mmrotate':
+            from mmdet.apis import inference_detector
+            inference_detector(model_info['model'], blank)
+        else:
+            model_info['model'].predict(blank, verbose=False)
+    
+    def _yolo_inference(self, model, image_path: str, confidence: float) -> DetectionBatch:
         """
         Run inference with a YOLO model.
         
@@ -194,56 +297,55 @@ class ModelInferenceService:
             confidence: Confidence threshold
             
         Returns:
-            List of detections in unified format
+            Detections of the image
         """
         results = model.predict(image_path, conf=confidence, verbose=False)
-        detections = []
+        return self._yolo_result_to_batch(results[0])
+    
+    def _yolo_result_to_batch(self, result) -> DetectionBatch:
+        """
+        Convert the result of one image of a YOLO prediction.
         
-        for result in results:
-            boxes = result.boxes
-            if boxes is None:
-                continue
+        Each tensor is copied to NumPy once for all boxes of the image.
+        OBB models report their boxes in result.obb (result.boxes is None);
+        their detections keep the enclosing xyxy box as bbox and the four
+        corners as obb.
+        
+        Args:
+            result: Ultralytics Results object
             
-            for idx in range(len(boxes)):
-                box = boxes[idx]
-                
-                # Get box coordinates
-                if hasattr(box, 'xyxy'):
-                    # Standard bounding box
-                    coords = box.xyxy[0].cpu().numpy().tolist()
-                    bbox_type = 'xyxy'
-                elif hasattr(box, 'xywh'):
-                    # Center format
-                    coords = box.xywh[0].cpu().numpy().tolist()
-                    bbox_type = 'xywh'
-                else:
-                    continue
-                
-                # Check for OBB (oriented bounding box)
-                obb_coords = None
-                if hasattr(result, 'obb') and result.obb is not None:
-                    obb = result.obb[idx]
-                    if hasattr(obb, 'xyxyxyxy'):
-                        obb_coords = obb.xyxyxyxy[0].cpu().numpy().tolist()
-                
-                detection = {
-                    'class_id': int(box.cls[0].cpu().numpy()),
-                    'class_name': result.names[int(box.cls[0])],
-                    'confidence': float(box.conf[0].cpu().numpy()),
-                    'bbox': coords,
-                    'bbox_type': bbox_type,
-                }
-                
-                # Add OBB if available
-                if obb_coords:
-                    detection['obb'] = obb_coords
-                    detection['bbox_type'] = 'obb'
-                
-                detections.append(detection)
+        Returns:
+            Detections of the image
+        """
+        obb = getattr(result, 'obb', None)
+        if obb is not None:
+            # data: [cx, cy, w, h, rotation, conf, cls]
+            data = obb.data.cpu().numpy()
+            return DetectionBatch(
+                class_ids=data[:, -1],
+                confidences=data[:, -2],
+                boxes=obb.xyxy.cpu().numpy(),
+                bbox_type='obb',
+                class_names=result.names,
+                obb=obb.xyxyxyxy.cpu().numpy().reshape(-1, 8),
+                angles=data[:, 4]
+            )
         
-        return detections
+        boxes = result.boxes
+        if boxes is None:
+            return DetectionBatch.empty('xyxy', result.names)
+        
+        # data: [x1, y1, x2, y2, (track id,) conf, cls]
+        data = boxes.data.cpu().numpy()
+        return DetectionBatch(
+            class_ids=data[:, -1],
+            confidences=data[:, -2],
+            boxes=data[:, :4],
+            bbox_type='xyxy',
+            class_names=result.names
+        )
     
-    def _mmrotate_inference(self, model, image_path: str, confidence: float) -> List[Dict[str, Any]]:
+    def _mmrotate_inference(self, model, image_path: str, confidence: float) -> DetectionBatch:
         """
         Run inference with an MMRotate model.
         
@@ -253,7 +355,7 @@ class ModelInferenceService:
             confidence: Confidence threshold
             
         Returns:
-            List of detections in unified format
+            Detections of the image
         """
         try:
             from mmdet.apis import inference_detector
@@ -265,8 +367,27 @@ class ModelInferenceService:
         # Run inference
         result = inference_detector(model, image_path)
         
-        # Parse results
-        detections = []
+        return self._mmrotate_result_to_batch(model, result, confidence)
+    
+    def _mmrotate_result_to_batch(self, model, result, confidence: float) -> DetectionBatch:
+        """
+        Convert the result of one image of an MMRotate prediction.
+        
+        The per-class arrays are stacked and thresholded with one mask, and
+        the corners of all rotated boxes are computed in one batched
+        operation. MMRotate angles are radians in every angle version
+        (oc, le90, le135).
+        
+        Args:
+            model: Loaded MMRotate model (for class names)
+            result: Per-class detection arrays returned by inference_detector
+            confidence: Confidence threshold
+            
+        Returns:
+            Detections of the image ('xywha' with corners for rotated boxes,
+            'xywh' for regular boxes)
+        """
+        class_names = getattr(model, 'CLASSES', None)
         
         # MMRotate returns results as tuple or list of arrays
         # Each array contains detections for one class
@@ -275,82 +396,76 @@ class ModelInferenceService:
         else:
             bbox_result = result
         
-        # Process each class
-        for class_id, class_detections in enumerate(bbox_result):
-            # MMRotate detections format: [cx, cy, w, h, angle, score] for rotated boxes
-            # or [x1, y1, x2, y2, score] for regular boxes
-            for detection in class_detections:
-                if len(detection) < 5:
-                    continue
-                
-                # Extract detection info
-                if len(detection) == 6:  # [cx, cy, w, h, angle, score] - rotated box
-                    cx, cy, w, h, angle, score = detection
-                    # cx, cy are center coordinates
-                    x = float(cx - w/2)  # Convert center to top-left
-                    y = float(cy - h/2)
-                    w = float(w)
-                    h = float(h)
-                    angle = float(angle)
-                    has_angle = True
-                elif len(detection) == 5:  # [x1, y1, x2, y2, score] - regular box
-                    x1, y1, x2, y2, score = detection
-                    # Convert to xywh format
-                    x = float(x1)
-                    y = float(y1)
-                    w = float(x2 - x1)
-                    h = float(y2 - y1)
-                    angle = 0.0
-                    has_angle = False
-                else:
-                    continue
-                
-                # Filter by confidence
-                if float(score) < confidence:
-                    continue
-                
-                # Create detection dict
-                det = {
-                    'class_id': int(class_id),
-                    'class_name': model.CLASSES[class_id] if hasattr(model, 'CLASSES') else str(class_id),
-                    'confidence': float(score),
-                    'bbox': [float(x), float(y), float(w), float(h)],
-                    'bbox_type': 'xywha' if has_angle else 'xywh'
-                }
-                
-                # Add angle if available
-                if has_angle:
-                    det['angle'] = float(angle)
-                    
-                    # Calculate 4 corners from center, width, height, angle
-                    cx, cy = x + w/2, y + h/2
-                    angle_rad = math.radians(angle)
-                    
-                    # Calculate corners
-                    cos_a = math.cos(angle_rad)
-                    sin_a = math.sin(angle_rad)
-                    
-                    dx = w / 2
-                    dy = h / 2
-                    
-                    corners = []
-                    for dx_sign, dy_sign in [(-1, -1), (1, -1), (1, 1), (-1, 1)]:
-                        px = cx + dx_sign * dx * cos_a - dy_sign * dy * sin_a
-                        py = cy + dx_sign * dx * sin_a + dy_sign * dy * cos_a
-                        corners.extend([float(px), float(py)])
-                    
-                    det['obb'] = corners  # 8 values: [x1,y1, x2,y2, x3,y3, x4,y4]
-                
-                detections.append(det)
+        # MMRotate detections format: [cx, cy, w, h, angle, score] for rotated boxes
+        # or [x1, y1, x2, y2, score] for regular boxes
+        arrays = [np.asarray(class_detections) for class_detections in bbox_result]
+        widths = [array.shape[1] for array in arrays if array.ndim == 2 and array.shape[1] in (5, 6)]
+        if not widths:
+            return DetectionBatch.empty('xywha', class_names)
+        width = widths[0]
+        
+        class_ids = np.concatenate([
+            np.full(len(array), class_id)
+            for class_id, array in enumerate(arrays)
+            if array.ndim == 2 and array.shape[1] == width
+        ])
+        rows = np.concatenate([array for array in arrays if array.ndim == 2 and array.shape[1] == width])
+        
+        # Filter by confidence
+        keep = rows[:, -1] >= confidence
+        rows = rows[keep].astype(np.float64)
+        class_ids = class_ids[keep]
+        scores = rows[:, -1]
+        
+        if width == 5:
+            # [x1, y1, x2, y2] -> [x, y, w, h]
+            boxes = np.column_stack([rows[:, :2], rows[:, 2:4] - rows[:, :2]])
+            return DetectionBatch(class_ids, scores, boxes, 'xywh', class_names)
+        
+        # [cx, cy, w, h] -> [x, y, w, h] with x, y the top-left corner before rotation
+        boxes = np.column_stack([rows[:, :2] - rows[:, 2:4] / 2, rows[:, 2:4]])
+        return DetectionBatch(
+            class_ids,
+            scores,
+            boxes,
+            'xywha',
+            class_names,
+            obb=rotated_box_corners(rows[:, :5]),
+            angles=rows[:, 4]
+        )
+    
+    def _get_model_info(self, model_id: int, auto_load: bool):
+        """
+        Get a loaded model, loading it first if allowed.
         
-        return detections
+        Args:
+            model_id: ID of the model
+            auto_load: Load the model if it is not loaded
+            
+        Returns:
+            Tuple of (cache entry, None), or (None, error message)
+        """
+        model_info = self.loaded_models.get(model_id)
+        if model_info is not None:
+            return model_info, None
+        
+        if not auto_load:
+            return None, f'Model {model_id} not loaded. Call load_model() first.'
+        
+        # The model can be evicted again by a concurrent load before it is used
+        if self.load_model(model_id):
+            model_info = self.loaded_models.get(model_id)
+        if model_info is None:
+            return None, f'Failed to load model with ID {model_id}'
+        return model_info, None
     
     def predict(
         self,
         model_id: int,
         image_path: str,
         confidence: float = 0.25,
-        auto_load: bool = True
+        auto_load: bool = True,
+        columnar: bool = False
     ) -> Dict[str, Any]:
         """
         Run inference on an image using the specified model.
@@ -360,6 +475,8 @@ class ModelInferenceService:
             image_path: Path to the input image
             confidence: Confidence threshold (default: 0.25)
             auto_load: Automatically load model if not loaded (default: True)
+            columnar: Return detections as a DetectionBatch of arrays instead
+                of a list of dictionaries (default: False)
             
         Returns:
             Dictionary with:
@@ -369,23 +486,17 @@ class ModelInferenceService:
             - model_type: Type of model (yolo, yolo-obb, mmrotate)
             - image_path: Path to the input image
             - image_size: [width, height] of the image
-            - detections: List of detections
+            - detections: List of detections (DetectionBatch if columnar)
             - detection_count: Number of detections
             - error: Error message if failed
         """
         # Load model if needed
-        if model_id not in self.loaded_models:
-            if auto_load:
-                if not self.load_model(model_id):
-                    return {
-                        'success': False,
-                        'error': f'Failed to load model with ID {model_id}'
-                    }
-            else:
-                return {
-                    'success': False,
-                    'error': f'Model {model_id} not loaded. Call load_model() first.'
-                }
+        model_info, error = self._get_model_info(model_id, auto_load)
+        if model_info is None:
+            return {
+                'success': False,
+                'error': error
+            }
         
         # Check if image exists
         if not os.path.exists(image_path):
@@ -405,7 +516,6 @@ class ModelInferenceService:
             }
         
         # Get model info
-        model_info = self.loaded_models[model_id]
         model = model_info['model']
         model_type = model_info['type']
         metadata = model_info['metadata']
@@ -429,7 +539,7 @@ class ModelInferenceService:
                 'model_type': model_type,
                 'image_path': image_path,
                 'image_size': image_size,
-                'detections': detections,
+                'detections': detections if columnar else detections.to_dicts(),
                 'detection_count': len(detections),
                 'confidence_threshold': confidence
             }
@@ -440,6 +550,219 @@ class ModelInferenceService:
                 'error': f'Inference failed: {str(e)}'
             }
     
+    def predict_batch(
+        self,
+        model_id: int,
+        images: List[Union[str, np.ndarray]],
+        confidence: float = 0.25,
+        batch_size: Optional[int] = None,
+        auto_load: bool = True,
+        columnar: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Run inference on several images (e.g. the tiles of a scene), several per forward pass.
+        
+        Images are passed to the framework as lists of arrays: Ultralytics
+        predicts a list as one batch, and mmdet's inference_detector accepts a
+        list of images. Results are in the same format as predict.
+        
+        Args:
+            model_id: ID of the model to use
+            images: Image paths or BGR arrays (H x W x 3, as read by cv2)
+            confidence: Confidence threshold (default: 0.25)
+            batch_size: Images per forward pass (default: the service batch
+                size, calibrated per model and image size when that is 0)
+            auto_load: Automatically load model if not loaded (default: True)
+            columnar: Return each image's detections as a DetectionBatch
+                (default: False)
+            
+        Returns:
+            Dictionary with:
+            - success: Boolean indicating success
+            - model_id, model_name, model_type: Model used
+            - batch_size: Images per forward pass used
+            - images_per_second: Inference throughput over the whole call
+            - confidence_threshold: Confidence threshold used
+            - results: One entry per input image, in order, with image
+              (path or index), image_size, detections and detection_count,
+              or success False and error if the image could not be read
+            - error: Error message if failed
+        """
+        model_info, error = self._get_model_info(model_id, auto_load)
+        if model_info is None:
+            return {
+                'success': False,
+                'error': error
+            }
+        
+        model_type = model_info['type']
+        if model_type not in FRAMEWORK_MODULES:
+            return {
+                'success': False,
+                'error': f'Unsupported model type: {model_type}'
+            }
+        
+        # Read the images; unreadable ones get an error entry and are skipped
+        results: List[Dict[str, Any]] = []
+        arrays: List[np.ndarray] = []
+        positions: List[int] = []
+        for index, image in enumerate(images):
+            label = image if isinstance(image, str) else index
+            array = self._load_image(image)
+            if array is None:
+                results.append({
+                    'success': False,
+                    'image': label,
+                    'error': f'Failed to read image: {label}'
+                })
+                continue
+            
+            results.append({
+                'success': True,
+                'image': label,
+                'image_size': [int(array.shape[1]), int(array.shape[0])]  # [width, height]
+            })
+            arrays.append(array)
+            positions.append(index)
+        
+        try:
+            if batch_size is None:
+                batch_size = self.batch_size
+            if not batch_size and arrays:
+                batch_size = self.calibrate_batch_size(model_id, arrays[0], confidence)
+            batch_size = max(1, batch_size or 1)
+            
+            start = time.perf_counter()
+            for offset in range(0, len(arrays), batch_size):
+                batch = arrays[offset:offset + batch_size]
+                batch_detections = self._run_batch(model_info, batch, confidence)
+                for position, detections in zip(positions[offset:offset + batch_size], batch_detections):
+                    results[position]['detections'] = detections if columnar else detections.to_dicts()
+                    results[position]['detection_count'] = len(detections)
+            elapsed = time.perf_counter() - start
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Inference failed: {str(e)}'
+            }
+        
+        return {
+            'success': True,
+            'model_id': model_id,
+            'model_name': model_info['metadata']['name'],
+            'model_type': model_type,
+            'batch_size': batch_size,
+            'images_per_second': round(len(arrays) / elapsed, 2) if elapsed > 0 else None,
+            'confidence_threshold': confidence,
+            'results': results
+        }
+    
+    def calibrate_batch_size(
+        self,
+        model_id: int,
+        sample: np.ndarray,
+        confidence: float = 0.25,
+        candidates: tuple = BATCH_SIZE_CANDIDATES
+    ) -> int:
+        """
+        Pick the batch size with the best throughput for a model and image size.
+        
+        Runs one untimed warm-up pass, then one timed pass per candidate batch
+        of copies of the sample, smallest first. Stops once a larger batch
+        improves images/s by less than BATCH_CALIBRATION_MIN_GAIN or runs out
+        of memory. The choice is cached per model and image shape.
+        
+        Args:
+            model_id: ID of a loaded model
+            sample: BGR image representative of the images to predict
+            confidence: Confidence threshold, which affects post-processing cost
+            candidates: Batch sizes to try, in increasing order
+            
+        Returns:
+            Chosen batch size
+            
+        Raises:
+            Exception: If the model is not loaded
+        """
+        key = (model_id, sample.shape)
+        cached = self._calibrated_batch_sizes.get(key)
+        if cached is not None:
+            return cached
+        
+        model_info = self.loaded_models.get(model_id)
+        if model_info is None:
+            raise Exception(f"Model {model_id} not loaded")
+        
+        self._run_batch(model_info, [sample], confidence)
+        
+        best_size, best_rate = candidates[0], 0.0
+        for size in candidates:
+            try:
+                start = time.perf_counter()
+                self._run_batch(model_info, [sample] * size, confidence)
+                rate = size / (time.perf_counter() - start)
+            except RuntimeError as e:
+                # CUDA out of memory is a RuntimeError
+                logger.info("Batch size %s failed during calibration of model %s: %s", size, model_id, e)
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
+                break
+            
+            logger.debug("Model %s, batch size %s: %.2f images/s", model_id, size, rate)
+            if rate < best_rate * (1 + BATCH_CALIBRATION_MIN_GAIN):
+                break
+            best_size, best_rate = size, rate
+        
+        logger.info(
+            "Calibrated batch size %s for model %s on %s images (%.2f images/s)",
+            best_size, model_id, 'x'.join(str(dim) for dim in sample.shape[:2]), best_rate
+        )
+        self._calibrated_batch_sizes[key] = best_size
+        return best_size
+    
+    def _run_batch(
+        self,
+        model_info: Dict[str, Any],
+        batch: List[np.ndarray],
+        confidence: float
+    ) -> List[DetectionBatch]:
+        """
+        Run one forward pass over a batch of images.
+        
+        Args:
+            model_info: Loaded model cache entry
+            batch: BGR images
+            confidence: Confidence threshold
+            
+        Returns:
+            Detections of each image, in order
+        """
+        model = model_info['model']
+        if model_info['type'] == 'mmrotate':
+            from mmdet.apis import inference_detector
+            results = inference_detector(model, batch)
+            return [self._mmrotate_result_to_batch(model, result, confidence) for result in results]
+        
+        results = model.predict(batch, conf=confidence, verbose=False, batch=len(batch))
+        return [self._yolo_result_to_batch(result) for result in results]
+    
+    def _load_image(self, image: Union[str, np.ndarray]) -> Optional[np.ndarray]:
+        """
+        Read an image as a BGR array.
+        
+        Args:
+            image: Image path, or an array which is returned as is
+            
+        Returns:
+            BGR array, or None if the image cannot be read
+        """
+        if isinstance(image, np.ndarray):
+            return image
+        if not os.path.exists(image):
+            return None
+        return cv2.imread(image)
+    
     def unload_model(self, model_id: int) -> bool:
         """
         Unload a model from memory.
@@ -450,10 +773,7 @@ class ModelInferenceService:
         Returns:
             True if unloaded successfully, False if not loaded
         """
-        if model_id in self.loaded_models:
-            del self.loaded_models[model_id]
-            return True
-        return False
+        return self.loaded_models.remove(model_id)
     
     def unload_all_models(self):
         """Unload all models from memory."""
@@ -466,5 +786,24 @@ class ModelInferenceService:
         Returns:
             List of model IDs
         """
-        return list(self.loaded_models.keys())
+        return self.loaded_models.keys()
+
+
+# Process-wide service used by the startup warm-up
+_model_inference_service: Optional[ModelInferenceService] = None
+
+
+def get_model_inference_service() -> ModelInferenceService:
+    """
+    Get the process-wide model inference service, creating it on first use.
+    
+    Returns:
+        Shared ModelInferenceService instance
+    """
+    global _model_inference_service
+    
+    if _model_inference_service is None:
+        _model_inference_service = ModelInferenceService()
+    
+    return _model_inference_service
 
@@ -0,0 +1,309 @@
+"""
+In-memory index of the models in the models directory.
+
+Each model folder holds a metadata.json (id, name, classes) and, once
+downloaded, its checkpoint file.pt. Inference, report creation checks,
+GET /api/v1/models and the health checks all look models up here instead
+of walking the directory and parsing every metadata.json per call.
+
+The registry re-reads a folder only when its modification time, or that of
+its metadata.json, changes; the directory is re-checked at most once per
+MODEL_REGISTRY_REFRESH_INTERVAL seconds, so lookups are dictionary hits.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+MODELS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'models')
+
+CHECKPOINT_FILE = 'file.pt'
+METADATA_FILE = 'metadata.json'
+
+
+class ModelRegistry:
+    """
+    Indexes model metadata by id, name, folder and detectable class.
+
+    Usage:
+        registry = get_model_registry()
+        registry.get(28)                    # metadata of model 28, or None
+        registry.find("yolov11x-coco")      # by id or case-insensitive name
+        registry.model_ids_with_class("ship")
+
+    Returned metadata dictionaries are copies and may be modified by callers.
+    """
+
+    def __init__(self, models_dir: str = MODELS_DIR, refresh_interval: Optional[float] = None):
+        """
+        Initialize the registry; the directory is read on first use.
+
+        Args:
+            models_dir: Models directory
+            refresh_interval: Minimum seconds between directory checks
+                (default: MODEL_REGISTRY_REFRESH_INTERVAL or 5; 0 checks on every lookup)
+        """
+        self.models_dir = models_dir
+        self.refresh_interval = (
+            refresh_interval if refresh_interval is not None
+            else float(os.getenv('MODEL_REGISTRY_REFRESH_INTERVAL', '5'))
+        )
+
+        # folder -> (signature, metadata or None if unreadable)
+        self._folders: Dict[str, Tuple[Tuple[int, int], Optional[Dict[str, Any]]]] = {}
+
+        # Lookup indexes, rebuilt after each refresh that finds a change
+        self._by_id: Dict[int, Dict[str, Any]] = {}
+        self._by_name: Dict[str, Dict[str, Any]] = {}
+        self._by_folder: Dict[str, Dict[str, Any]] = {}
+        self._by_class: Dict[str, FrozenSet[int]] = {}
+
+        self._lock = threading.Lock()
+        self._checked_at: Optional[float] = None
+
+        self.refreshes = 0
+        self.metadata_reads = 0
+
+    def get(self, model_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a model by id.
+
+        Args:
+            model_id: Model ID
+
+        Returns:
+            Model metadata (see _read_model), or None if not found
+        """
+        self._maybe_refresh()
+        try:
+            model = self._by_id.get(int(model_id))
+        except (TypeError, ValueError):
+            return None
+        return dict(model) if model is not None else None
+
+    def find(self, identifier: Any) -> Optional[Dict[str, Any]]:
+        """
+        Get a model by id or by name (case-insensitive).
+
+        Args:
+            identifier: Model ID or name
+
+        Returns:
+            Model metadata, or None if not found
+        """
+        self._maybe_refresh()
+        model = None
+        if str(identifier).strip().lstrip('-').isdigit():
+            model = self._by_id.get(int(identifier))
+        if model is None:
+            model = self._by_name.get(str(identifier).lower())
+        return dict(model) if model is not None else None
+
+    def get_by_folder(self, folder: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a model by folder name.
+
+        Args:
+            folder: Folder name in the models directory
+
+        Returns:
+            Model metadata, or None if not found
+        """
+        self._maybe_refresh()
+        model = self._by_folder.get(folder)
+        return dict(model) if model is not None else None
+
+    def list_models(self) -> List[Dict[str, Any]]:
+        """
+        List every model.
+
+        Returns:
+            Model metadata sorted by id
+        """
+        self._maybe_refresh()
+        return [dict(model) for _, model in sorted(self._by_id.items())]
+
+    def model_ids_with_class(self, class_name: str) -> FrozenSet[int]:
+        """
+        Get the models that can detect a class.
+
+        Args:
+            class_name: Class name (case-insensitive)
+
+        Returns:
+            IDs of the models listing the class
+        """
+        self._maybe_refresh()
+        return self._by_class.get(class_name.lower(), frozenset())
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Re-read the folders that changed since the last refresh.
+
+        Args:
+            force: Check the directory even if the refresh interval has not elapsed
+
+        Returns:
+            True if any model was added, changed or removed
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._checked_at is not None and now - self._checked_at < self.refresh_interval:
+                return False
+            self._checked_at = now
+
+            folders = {}
+            changed = False
+            for folder, signature in self._scan():
+                cached = self._folders.get(folder)
+                if cached is not None and cached[0] == signature:
+                    folders[folder] = cached
+                    continue
+
+                folders[folder] = (signature, self._read_model(folder))
+                changed = True
+
+            if changed or folders.keys() != self._folders.keys():
+                self._folders = folders
+                self._rebuild_indexes()
+                self.refreshes += 1
+                return True
+            return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get registry statistics for monitoring.
+
+        Returns:
+            Dictionary with model and class counts and refresh counters
+        """
+        return {
+            "models": len(self._by_id),
+            "with_checkpoint": sum(1 for model in self._by_id.values() if model['has_checkpoint']),
+            "classes": len(self._by_class),
+            "refresh_interval_seconds": self.refresh_interval,
+            "refreshes": self.refreshes,
+            "metadata_reads": self.metadata_reads
+        }
+
+    def _maybe_refresh(self) -> None:
+        """Refresh if the refresh interval has elapsed."""
+        checked_at = self._checked_at
+        if checked_at is None or time.monotonic() - checked_at >= self.refresh_interval:
+            self.refresh()
+
+    def _scan(self) -> List[Tuple[str, Tuple[int, int]]]:
+        """
+        List the model folders with their change signatures.
+
+        A folder's modification time changes when a file in it is created,
+        renamed or removed (e.g. a downloaded checkpoint); metadata.json is
+        also checked since it can be edited in place.
+
+        Returns:
+            (folder, (folder mtime, metadata.json mtime)) for each folder with metadata
+        """
+        if not os.path.isdir(self.models_dir):
+            logger.warning("Models directory %s not found", self.models_dir)
+            return []
+
+        folders = []
+        for entry in os.scandir(self.models_dir):
+            if not entry.is_dir():
+                continue
+            try:
+                metadata_mtime = os.stat(os.path.join(entry.path, METADATA_FILE)).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            folders.append((entry.name, (entry.stat().st_mtime_ns, metadata_mtime)))
+        return folders
+
+    def _read_model(self, folder: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a model folder.
+
+        Args:
+            folder: Folder name
+
+        Returns:
+            metadata.json contents plus folder, folder_path, checkpoint_path,
+            has_checkpoint and checkpoint_size_mb; None if the metadata is
+            unreadable or has no id
+        """
+        folder_path = os.path.join(self.models_dir, folder)
+        metadata_file = os.path.join(folder_path, METADATA_FILE)
+        self.metadata_reads += 1
+        try:
+            with open(metadata_file, 'r') as f:
+                metadata = json.load(f)
+            metadata['id'] = int(metadata['id'])
+        except (json.JSONDecodeError, IOError, KeyError, TypeError, ValueError) as e:
+            logger.warning("Error reading %s: %s", metadata_file, e)
+            return None
+
+        checkpoint_path = os.path.join(folder_path, CHECKPOINT_FILE)
+        metadata['folder'] = folder
+        metadata['folder_path'] = folder_path
+        metadata['checkpoint_path'] = checkpoint_path
+        metadata['has_checkpoint'] = os.path.exists(checkpoint_path)
+        metadata['checkpoint_size_mb'] = (
+            round(os.path.getsize(checkpoint_path) / 1024 / 1024, 2) if metadata['has_checkpoint'] else 0
+        )
+        metadata.setdefault('classes', [])
+        return metadata
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild the lookup indexes from the cached folders."""
+        by_id: Dict[int, Dict[str, Any]] = {}
+        by_name: Dict[str, Dict[str, Any]] = {}
+        by_folder: Dict[str, Dict[str, Any]] = {}
+        by_class: Dict[str, set] = {}
+
+        for folder in sorted(self._folders):
+            model = self._folders[folder][1]
+            if model is None:
+                continue
+            if model['id'] in by_id:
+                logger.warning(
+                    "Model ID %s in %s already used by %s; ignored", model['id'], folder, by_id[model['id']]['folder']
+                )
+                continue
+
+            by_id[model['id']] = model
+            by_folder[folder] = model
+            by_name.setdefault(str(model.get('name', '')).lower(), model)
+            for class_name in model['classes']:
+                by_class.setdefault(str(class_name).lower(), set()).add(model['id'])
+
+        self._by_id = by_id
+        self._by_name = by_name
+        self._by_folder = by_folder
+        self._by_class = {class_name: frozenset(ids) for class_name, ids in by_class.items()}
+
+
+# Process-wide registry shared by every service
+_model_registry: Optional[ModelRegistry] = None
+_model_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """
+    Get the process-wide model registry, creating it on first use.
+
+    Returns:
+        Shared ModelRegistry instance
+    """
+    global _model_registry
+
+    if _model_registry is None:
+        with _model_registry_lock:
+            if _model_registry is None:
+                _model_registry = ModelRegistry()
+
+    return _model_registry
@@ -34,6 +34,8 @@ class ObjectStorageService:
             par_base_url: Base PAR URL (optional, uses environment variable if not provided)
         """
         self.par_base_url = par_base_url or PAR_BASE_URL
+        # Keeps the TLS connection to object storage alive between metadata requests
+        self.session = requests.Session()
     
     def list_objects(self, prefix: str = "data/", limit: int = 1000, timeout: int = 30) -> List[str]:
         """
@@ -169,7 +171,7 @@ class ObjectStorageService:
             base_o = self.par_base_url.rstrip("/") + "/o"
             object_url = f"{base_o}/" + urllib.parse.quote(object_name, safe="")
             
-            r = requests.head(object_url, timeout=30)
+            r = self.session.head(object_url, timeout=30)
             return r.status_code == 200
         except:
             return False
@@ -188,7 +190,7 @@ class ObjectStorageService:
             base_o = self.par_base_url.rstrip("/") + "/o"
             object_url = f"{base_o}/" + urllib.parse.quote(object_name, safe="")
             
-            r = requests.head(object_url, timeout=30)
+            r = self.session.head(object_url, timeout=30)
             if r.status_code == 200:
                 return {
                     "name": object_name,
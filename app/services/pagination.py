@@ -0,0 +1,142 @@
+"""
+Pagination helpers shared by the list services.
+
+Pages are fetched in a single statement that also computes the total with
+COUNT(*) OVER (). Keyset pagination orders rows on (created_at, id) and
+encodes the last row of a page as an opaque cursor token, so a deep page
+costs the same index range scan as the first one.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Cursor timestamps are UTC, formatted identically in Python and Oracle
+CURSOR_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+CURSOR_TIMESTAMP_SQL_FORMAT = 'YYYY-MM-DD HH24:MI:SS.FF6'
+
+# Window total selected by offset queries; keyset queries skip it so they
+# never have to visit rows beyond the page
+TOTAL_COUNT_COLUMN = "COUNT(*) OVER () AS total_count"
+
+# Sort key selected by keyset queries to build the next cursor
+SORT_KEY_COLUMN = "SYS_EXTRACT_UTC(created_at) AS sort_created_at"
+
+PAGINATION_MODES = ('offset', 'keyset')
+
+
+def encode_cursor(created_at_utc: datetime, row_id: int) -> str:
+    """
+    Encode the position of a row as an opaque cursor token.
+
+    Args:
+        created_at_utc: UTC creation timestamp of the row (SORT_CREATED_AT)
+        row_id: Row ID
+
+    Returns:
+        URL-safe cursor token
+    """
+    payload = json.dumps([created_at_utc.strftime(CURSOR_TIMESTAMP_FORMAT), int(row_id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token: str) -> Tuple[str, int]:
+    """
+    Decode a cursor token produced by encode_cursor.
+
+    Args:
+        token: Cursor token
+
+    Returns:
+        Tuple of (UTC timestamp string, row ID)
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        datetime.strptime(created_at, CURSOR_TIMESTAMP_FORMAT)
+        return created_at, int(row_id)
+    except Exception:
+        raise ValueError("Invalid pagination cursor")
+
+
+def keyset_condition(descending: bool) -> str:
+    """
+    Build the predicate selecting rows after the cursor position.
+
+    The leading range predicate on created_at lets Oracle drive the query
+    with a range scan of the (created_at, id) index.
+
+    Args:
+        descending: Whether the page is ordered newest first
+
+    Returns:
+        SQL predicate using the :cursor_created_at and :cursor_id binds
+    """
+    cursor_ts = f"FROM_TZ(TO_TIMESTAMP(:cursor_created_at, '{CURSOR_TIMESTAMP_SQL_FORMAT}'), 'UTC')"
+    op = '<' if descending else '>'
+    return (
+        f"created_at {op}= {cursor_ts} "
+        f"AND (created_at {op} {cursor_ts} OR (created_at = {cursor_ts} AND id {op} :cursor_id))"
+    )
+
+
+def keyset_params(cursor: Optional[str]) -> Dict[str, Any]:
+    """
+    Get the bind parameters for a keyset cursor.
+
+    Args:
+        cursor: Cursor token, or None for the first page
+
+    Returns:
+        Bind parameters for keyset_condition (empty for the first page)
+    """
+    if cursor is None:
+        return {}
+    created_at, row_id = decode_cursor(cursor)
+    return {'cursor_created_at': created_at, 'cursor_id': row_id}
+
+
+def paginate_rows(rows: List[Dict[str, Any]], per_page: int,
+                  keyset: bool) -> Tuple[List[Dict[str, Any]], Optional[int], Optional[str]]:
+    """
+    Split a fetched page into its rows, total and next cursor.
+
+    Keyset queries fetch one row more than the page size to learn whether
+    another page follows; they do not report a total.
+
+    Args:
+        rows: Rows returned by the paginated query
+        per_page: Number of items per page
+        keyset: Whether the query used keyset pagination
+
+    Returns:
+        Tuple of (page rows, total or None, next cursor or None)
+    """
+    if keyset:
+        page_rows = rows[:per_page]
+        next_cursor = None
+        if len(rows) > per_page:
+            last = page_rows[-1]
+            next_cursor = encode_cursor(last['SORT_CREATED_AT'], last['ID'])
+        return page_rows, None, next_cursor
+
+    total = rows[0]['TOTAL_COUNT'] if rows else None
+    return rows, total, None
+
+
+def count_total(rows: List[Dict[str, Any]]) -> int:
+    """
+    Get the total from the rows of a fallback COUNT(*) query.
+
+    Args:
+        rows: Rows returned by a query selecting COUNT(*) AS total
+
+    Returns:
+        Total number of rows (0 if the query returned nothing)
+    """
+    return rows[0]['TOTAL'] if rows else 0
@@ -0,0 +1,144 @@
+"""
+Helpers that keep the number of distinct statement texts bounded.
+
+Every distinct SQL text is parsed and cached separately by the database (and
+by the client statement cache, see DB_STMT_CACHE_SIZE), so statements built
+at runtime should only vary over a small, fixed set of shapes:
+
+- IN lists are padded to a bucket size by repeating their last value, so an
+  IN list of 1 to 1000 binds has at most len(IN_LIST_BUCKETS) texts.
+- UPDATE statements set a fixed column list; columns that were not supplied
+  keep their value through a CASE on a flag bind.
+- Sparse select lists (see columns_to_select) always include the
+  scalar columns, so only the expensive columns vary the text.
+"""
+
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+
+# Padded IN list sizes; Oracle allows at most 1000 expressions in one list
+IN_LIST_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1000)
+
+MAX_IN_LIST_SIZE = IN_LIST_BUCKETS[-1]
+
+
+def in_list_bucket(count: int) -> int:
+    """
+    Get the padded size of an IN list.
+
+    Args:
+        count: Number of values (1 to MAX_IN_LIST_SIZE)
+
+    Returns:
+        Smallest bucket size that holds count values
+    """
+    for size in IN_LIST_BUCKETS:
+        if count <= size:
+            return size
+    return MAX_IN_LIST_SIZE
+
+
+def in_list_condition(column: str, values: Sequence[Any], prefix: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    Build an IN condition with a bounded number of statement shapes.
+
+    Values are de-duplicated, and each list is padded to its bucket size by
+    repeating its last value, which does not change the result. More than
+    MAX_IN_LIST_SIZE values are split into OR-ed lists.
+
+    Args:
+        column: Column (or qualified column) to test
+        values: Values to match (may be empty)
+        prefix: Bind name prefix; binds are named <prefix>_0, <prefix>_1, ...
+
+    Returns:
+        Tuple of (condition, params); an empty list gives a condition that is
+        never true
+    """
+    unique_values = list(dict.fromkeys(values))
+    if not unique_values:
+        return "1 = 0", {}
+
+    params: Dict[str, Any] = {}
+    lists = []
+    for start in range(0, len(unique_values), MAX_IN_LIST_SIZE):
+        chunk = unique_values[start:start + MAX_IN_LIST_SIZE]
+        chunk += [chunk[-1]] * (in_list_bucket(len(chunk)) - len(chunk))
+
+        names = []
+        for value in chunk:
+            name = f"{prefix}_{len(params)}"
+            params[name] = value
+            names.append(f":{name}")
+        lists.append(f"{column} IN ({','.join(names)})")
+
+    if len(lists) == 1:
+        return lists[0], params
+    return f"({' OR '.join(lists)})", params
+
+
+def fixed_update(table: str, columns: Iterable[str], where: str) -> str:
+    """
+    Build an UPDATE statement that sets a fixed column list.
+
+    Each column is assigned CASE WHEN :set_<column> = 1 THEN :<column> ELSE
+    <column> END, so one text serves every combination of supplied fields;
+    fill the binds with fixed_update_params. updated_at is always refreshed.
+
+    Args:
+        table: Table name
+        columns: Updatable columns, also used as bind names
+        where: WHERE condition identifying the row
+
+    Returns:
+        UPDATE statement text
+    """
+    assignments = [
+        f"{column} = CASE WHEN :set_{column} = 1 THEN :{column} ELSE {column} END"
+        for column in columns
+    ]
+    assignments.append("updated_at = CURRENT_TIMESTAMP")
+
+    return f"""
+            UPDATE {table}
+            SET {', '.join(assignments)}
+            WHERE {where}
+        """
+
+
+def fixed_update_params(columns: Iterable[str], values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the binds of a fixed_update statement.
+
+    Args:
+        columns: Updatable columns passed to fixed_update
+        values: New values of the columns to change
+
+    Returns:
+        Value and set_<column> flag binds for every column
+    """
+    params: Dict[str, Any] = {}
+    for column in columns:
+        params[f"set_{column}"] = 1 if column in values else 0
+        params[column] = values.get(column)
+    return params
+
+
+def columns_to_select(requested: List[str], all_columns: Sequence[str], variable_columns: Sequence[str]) -> List[str]:
+    """
+    Widen a sparse column selection to a bounded set of select lists.
+
+    Only the columns in variable_columns (the expensive ones) are selected
+    on request; every other column is always selected, since fetching an
+    extra scalar is cheaper than parsing one statement per field subset.
+
+    Args:
+        requested: Columns the caller asked for
+        all_columns: Every selectable column, in select order
+        variable_columns: Columns selected only when requested
+
+    Returns:
+        Columns to select, in all_columns order
+    """
+    wanted = set(requested)
+    return [column for column in all_columns if column not in variable_columns or column in wanted]
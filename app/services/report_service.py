@@ -5,13 +5,84 @@ This module contains the service layer for report operations,
 handling the conversion between database records and API models.
 """
 
+import os
 import json
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+import logging
+from typing import List, Optional, Dict, Any, Tuple, Iterator, AsyncIterator
+from datetime import datetime, timedelta, timezone
 
-from ..database import Database
-from ..models import ReportCreate, ReportUpdate, ReportResponse, GeometryBase
-from .validation_service import ValidationService
+import oracledb
+
+from ..database import Database, AsyncDatabase
+from ..models import (
+    ReportCreate,
+    ReportUpdate,
+    ReportResponse,
+    ReportSummaryResponse,
+    ReportStatsResponse,
+    ReportThroughput,
+    GeometryBase
+)
+from .validation_service import ValidationService, AsyncValidationService
+from .sdo_geometry import SDO_GEOMETRY_TYPE_NAME, SdoGeometryConverter, sdo_to_geojson
+from .lookup_cache import TTLCache
+from .query_builder import fixed_update, fixed_update_params, columns_to_select
+from .pagination import (
+    TOTAL_COUNT_COLUMN,
+    SORT_KEY_COLUMN,
+    keyset_condition,
+    keyset_params,
+    paginate_rows,
+    count_total
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Dashboard aggregates keyed by window size; cleared whenever this process
+# creates or deletes a report or changes a status, and expired after a short
+# TTL to pick up changes made by other workers
+_report_stats_cache = TTLCache(float(os.getenv('REPORT_STATS_CACHE_TTL', '10')), max_size=32)
+
+
+def invalidate_report_stats() -> None:
+    """Drop the cached report dashboard aggregates."""
+    _report_stats_cache.clear()
+
+
+def get_report_stats_cache() -> TTLCache:
+    """Get the cache of report dashboard aggregates."""
+    return _report_stats_cache
+
+
+REPORT_FIELDS = (
+    'id', 'name', 'status', 'timestamp', 'bucket_img_path',
+    'image_footprint', 'area_of_interest', 'author', 'created_at', 'updated_at'
+)
+
+# Heaviest columns to transfer and decode; skipped by include_geometry=false
+GEOMETRY_FIELDS = ('image_footprint', 'area_of_interest')
+
+REPORT_COLUMNS = ", ".join(REPORT_FIELDS)
+
+# Columns a report update may change; one UPDATE text serves every subset
+REPORT_UPDATE_COLUMNS = ('name', 'status', 'bucket_img_path', 'author')
+
+DETECTION_FIELDS = (
+    'id', 'report_id', 'class_name', 'confidence', 'model_id',
+    'pixel_bbox_x1', 'pixel_bbox_y1', 'pixel_bbox_x2', 'pixel_bbox_y2', 'footprint'
+)
+
+# Detections fetched per round trip when exporting a report
+DETECTION_EXPORT_BATCH_SIZE = 5000
+
+# Server-generated REPORTS values returned by the INSERT itself
+REPORT_RETURNING = {
+    'new_id': oracledb.DB_TYPE_NUMBER,
+    'new_timestamp': oracledb.DB_TYPE_TIMESTAMP_TZ,
+    'new_created_at': oracledb.DB_TYPE_TIMESTAMP_TZ,
+    'new_updated_at': oracledb.DB_TYPE_TIMESTAMP_TZ
+}
 
 
 class ReportService:
@@ -39,55 +110,14 @@ class ReportService:
         Raises:
             Exception: If creation fails
         """
-        # Build the query with or without geometry
-        if report_data.area_of_interest:
-            sdo_geometry_sql = self._geometry_to_sdo(report_data.area_of_interest)
-            query = f"""
-                INSERT INTO REPORTS (name, bucket_img_path, area_of_interest, author)
-                VALUES (:name, :bucket_img_path, {sdo_geometry_sql}, :author)
-            """
-        else:
-            query = """
-                INSERT INTO REPORTS (name, bucket_img_path, area_of_interest, author)
-                VALUES (:name, :bucket_img_path, NULL, :author)
-            """
-        
-        params = {
-            'name': report_data.name,
-            'bucket_img_path': report_data.bucket_img_path,
-            'author': report_data.author
-        }
-        
-        # Execute the insert
-        cursor = self.db.connection.cursor()
-        cursor.execute(query, params)
-        self.db.connection.commit()  
-        cursor.close()
-        
-        # Get the generated ID by querying the last inserted record
-        id_query = """
-            SELECT id FROM REPORTS 
-            WHERE name = :name AND author = :author 
-            ORDER BY created_at DESC 
-            FETCH FIRST 1 ROWS ONLY
-        """
-        
-        id_params = {
-            'name': report_data.name,
-            'author': report_data.author
-        }
-        
-        cursor = self.db.connection.cursor()
-        cursor.execute(id_query, id_params)
-        result = cursor.fetchone()
-        report_id = result[0] if result else None
-        cursor.close()
+        geometry_type = self.db.get_type(SDO_GEOMETRY_TYPE_NAME) if report_data.area_of_interest else None
+        query, params = self._build_create_report_insert(report_data, geometry_type)
         
-        if report_id is None:
-            raise Exception("Failed to get generated report ID")
+        # Insert, commit and read back the generated values in one round trip
+        returned = self.db.execute_returning(query, params, REPORT_RETURNING)
+        invalidate_report_stats()
         
-        # Return the created report
-        return self.get_report(report_id)
+        return self._inserted_report(params, returned, report_data.area_of_interest)
     
     def get_report(self, report_id: int) -> ReportResponse:
         """
@@ -102,118 +132,65 @@ class ReportService:
         Raises:
             Exception: If report not found
         """
-        query = """
-            SELECT id, name, status, timestamp, bucket_img_path, image_footprint, area_of_interest, author, created_at, updated_at
-            FROM REPORTS
-            WHERE id = :report_id
-        """
-        
-        result = self.db.execute_query(query, {'report_id': report_id})
-        
-        if not result:
-            raise Exception(f"Report with ID {report_id} not found")
-        
-        report = result[0]
-        
-        # Convert SDO_GEOMETRY to GeoJSON format if present
-        image_footprint = None
-        if report['IMAGE_FOOTPRINT']:
-            image_footprint = self._sdo_to_geometry(report['IMAGE_FOOTPRINT'])
-        
-        area_of_interest = None
-        if report['AREA_OF_INTEREST']:
-            area_of_interest = self._sdo_to_geometry(report['AREA_OF_INTEREST'])
+        result = self.db.execute_query(self.GET_REPORT_QUERY, {'report_id': report_id})
         
-        return ReportResponse(
-            id=report['ID'],
-            name=report['NAME'],
-            status=report['STATUS'],
-            timestamp=report['TIMESTAMP'],
-            bucket_img_path=report['BUCKET_IMG_PATH'],
-            image_footprint=image_footprint,
-            area_of_interest=area_of_interest,
-            author=report['AUTHOR'],
-            created_at=report['CREATED_AT'],
-            updated_at=report['UPDATED_AT']
-        )
+        return self._report_from_result(report_id, result)
     
-    def get_reports(self, page: int = 1, per_page: int = 10, author: Optional[str] = None, status: Optional[str] = None) -> Dict[str, Any]:
+    def get_reports(self, page: int = 1, per_page: int = 10, author: Optional[str] = None, status: Optional[str] = None,
+                    keyset: bool = False, cursor: Optional[str] = None,
+                    fields: Optional[List[str]] = None, include_geometry: bool = True) -> Dict[str, Any]:
         """
         Get a list of reports with pagination.
         
         Args:
-            page: Page number (1-based)
+            page: Page number (1-based, ignored for keyset pagination)
             per_page: Number of items per page
             author: Filter by author name (optional)
             status: Filter by status (optional)
+            keyset: Use keyset pagination ordered on (created_at, id)
+            cursor: Keyset cursor returned as next_cursor by the previous page
+            fields: Report fields to select (optional, default all)
+            include_geometry: Whether to select the geometry columns
             
         Returns:
             Dictionary containing reports list and pagination info
+            
+        Raises:
+            ValueError: If the cursor is malformed or a field is unknown
         """
-        offset = (page - 1) * per_page
-        
-        # Build the WHERE clause
-        where_conditions = []
-        params = {'offset': offset, 'per_page': per_page}
-        
-        if author is not None:
-            where_conditions.append("author = :author")
-            params['author'] = author
+        columns = self._select_report_fields(fields, include_geometry)
+        query, params = self._build_reports_query(page, per_page, author, status, keyset, cursor, columns)
+        results = self.db.execute_query(query, params)
+        result = self._reports_page(results, page, per_page, keyset, columns)
         
-        if status is not None:
-            where_conditions.append("status = :status")
-            params['status'] = status
+        count = self._missing_total_query(result, author, status, keyset)
+        if count is not None:
+            result['total'] = count_total(self.db.execute_query(*count))
         
-        where_clause = ""
-        if where_conditions:
-            where_clause = "WHERE " + " AND ".join(where_conditions)
+        return result
+    
+    def get_report_stats(self, hours: int = 24) -> ReportStatsResponse:
+        """
+        Get report counts by status and author, and completions per hour.
         
-        # Get total count
-        count_query = f"SELECT COUNT(*) as total FROM REPORTS {where_clause}"
-        count_result = self.db.execute_query(count_query, {k: v for k, v in params.items() if k != 'offset' and k != 'per_page'})
-        total = count_result[0]['TOTAL'] if count_result else 0
+        Served from a short-lived in-memory cache; see REPORT_STATS_CACHE_TTL.
         
-        # Get reports
-        query = f"""
-            SELECT id, name, status, timestamp, bucket_img_path, image_footprint, area_of_interest, author, created_at, updated_at
-            FROM REPORTS
-            {where_clause}
-            ORDER BY created_at DESC
-            OFFSET :offset ROWS FETCH NEXT :per_page ROWS ONLY
+        Args:
+            hours: Number of hours of completion throughput to return
+            
+        Returns:
+            Report dashboard aggregates
         """
+        found, stats = _report_stats_cache.get(hours)
+        if found:
+            return stats
         
-        results = self.db.execute_query(query, params)
-        
-        reports = []
-        for result in results:
-            # Convert SDO_GEOMETRY to GeoJSON format if present
-            image_footprint = None
-            if result['IMAGE_FOOTPRINT']:
-                image_footprint = self._sdo_to_geometry(result['IMAGE_FOOTPRINT'])
-            
-            area_of_interest = None
-            if result['AREA_OF_INTEREST']:
-                area_of_interest = self._sdo_to_geometry(result['AREA_OF_INTEREST'])
-            
-            reports.append(ReportResponse(
-                id=result['ID'],
-                name=result['NAME'],
-                status=result['STATUS'],
-                timestamp=result['TIMESTAMP'],
-                bucket_img_path=result['BUCKET_IMG_PATH'],
-                image_footprint=image_footprint,
-                area_of_interest=area_of_interest,
-                author=result['AUTHOR'],
-                created_at=result['CREATED_AT'],
-                updated_at=result['UPDATED_AT']
-            ))
+        window_start = self._stats_window_start(hours)
+        rows = self.db.execute_query(self.REPORT_STATS_QUERY, {'window_start': window_start})
+        stats = self._rows_to_report_stats(rows, hours, window_start)
         
-        return {
-            'reports': reports,
-            'total': total,
-            'page': page,
-            'per_page': per_page
-        }
+        _report_stats_cache.put(hours, stats)
+        return stats
     
     def update_report(self, report_id: int, report_data: ReportUpdate) -> ReportResponse:
         """
@@ -232,48 +209,14 @@ class ReportService:
         # Check if report exists
         self.get_report(report_id)
         
-        # Build update query dynamically
-        update_fields = []
-        params = {'report_id': report_id}
-        
-        if report_data.name is not None:
-            update_fields.append("name = :name")
-            params['name'] = report_data.name
-        
-        if report_data.status is not None:
-            update_fields.append("status = :status")
-            params['status'] = report_data.status
-        
-        if report_data.bucket_img_path is not None:
-            update_fields.append("bucket_img_path = :bucket_img_path")
-            params['bucket_img_path'] = report_data.bucket_img_path
-        
-        # Note: Geometry updates need to be handled separately due to SQL construction
-        # For now, we'll skip geometry updates in this method
-        # TODO: Implement proper geometry update handling
-        if report_data.image_footprint is not None:
-            raise ValueError("Updating image_footprint is not yet supported. Please use a dedicated endpoint.")
-        
-        if report_data.area_of_interest is not None:
-            raise ValueError("Updating area_of_interest is not yet supported. Please use a dedicated endpoint.")
-        
-        if report_data.author is not None:
-            update_fields.append("author = :author")
-            params['author'] = report_data.author
-        
-        if not update_fields:
+        update = self._build_update_query(report_id, report_data)
+        if update is None:
             return self.get_report(report_id)
         
-        # Add updated_at timestamp
-        update_fields.append("updated_at = CURRENT_TIMESTAMP")
-        
-        query = f"""
-            UPDATE REPORTS
-            SET {', '.join(update_fields)}
-            WHERE id = :report_id
-        """
-        
+        query, params = update
         self.db.execute_update(query, params)
+        if report_data.status is not None:
+            invalidate_report_stats()
         
         return self.get_report(report_id)
     
@@ -291,14 +234,22 @@ class ReportService:
             Exception: If report not found or deletion fails
         """
         # Check if report exists
-        self.get_report(report_id)
+        if not self.report_exists(report_id):
+            raise Exception(f"Report with ID {report_id} not found")
+        
+        affected_rows = self.db.execute_update(self.DELETE_REPORT_QUERY, {'report_id': report_id})
+        invalidate_report_stats()
         
-        query = "DELETE FROM REPORTS WHERE id = :report_id"
-        affected_rows = self.db.execute_update(query, {'report_id': report_id})
+        if affected_rows > 0:
+            try:
+                self.db.execute_update(self.DROP_DETECTIONS_PARTITION_BLOCK, {'report_id': report_id})
+            except Exception as e:
+                self._log_partition_drop_failure(report_id, e)
         
         return affected_rows > 0
     
-    def get_overlapping_reports(self, report_id: int) -> List[ReportResponse]:
+    def get_overlapping_reports(self, report_id: int, fields: Optional[List[str]] = None,
+                                include_geometry: bool = True) -> List[Any]:
         """
         Get all reports whose area_of_interest overlaps with the specified report.
         
@@ -307,6 +258,8 @@ class ReportService:
         
         Args:
             report_id: Report ID to find overlaps with
+            fields: Report fields to select (optional, default all)
+            include_geometry: Whether to select the geometry columns
             
         Returns:
             List of overlapping reports
@@ -314,52 +267,48 @@ class ReportService:
         Raises:
             Exception: If report not found or has no area_of_interest
         """
-        # First, get the target report and verify it has an area_of_interest
-        target_report = self.get_report(report_id)
+        columns = self._select_report_fields(fields, include_geometry)
         
-        if not target_report.area_of_interest:
-            raise Exception(f"Report {report_id} does not have an area_of_interest defined")
+        # Verify the target report has an area_of_interest without fetching it
+        target = self.db.execute_query(self.AREA_OF_INTEREST_CHECK_QUERY, {'report_id': report_id})
+        self._check_overlap_target(report_id, target)
         
-        # Query for overlapping reports using Oracle Spatial function
-        query = """
-            SELECT r2.id, r2.name, r2.status, r2.timestamp, r2.bucket_img_path, 
-                   r2.image_footprint, r2.area_of_interest, r2.author, r2.created_at, r2.updated_at
-            FROM REPORTS r1, REPORTS r2
-            WHERE r1.id = :report_id
-            AND r2.id != :report_id
-            AND r1.area_of_interest IS NOT NULL
-            AND r2.area_of_interest IS NOT NULL
-            AND SDO_ANYINTERACT(r1.area_of_interest, r2.area_of_interest) = 'TRUE'
-            ORDER BY r2.created_at DESC
-        """
+        results = self.db.execute_query(self._build_overlapping_query(columns), {'report_id': report_id})
         
-        results = self.db.execute_query(query, {'report_id': report_id})
+        return [self._row_to_report(result, columns) for result in results]
+    
+    def report_exists(self, report_id: int) -> bool:
+        """
+        Check whether a report exists without fetching its row.
         
-        overlapping_reports = []
-        for result in results:
-            # Convert SDO_GEOMETRY to GeoJSON format if present
-            image_footprint = None
-            if result['IMAGE_FOOTPRINT']:
-                image_footprint = self._sdo_to_geometry(result['IMAGE_FOOTPRINT'])
-            
-            area_of_interest = None
-            if result['AREA_OF_INTEREST']:
-                area_of_interest = self._sdo_to_geometry(result['AREA_OF_INTEREST'])
+        Args:
+            report_id: Report ID
             
-            overlapping_reports.append(ReportResponse(
-                id=result['ID'],
-                name=result['NAME'],
-                status=result['STATUS'],
-                timestamp=result['TIMESTAMP'],
-                bucket_img_path=result['BUCKET_IMG_PATH'],
-                image_footprint=image_footprint,
-                area_of_interest=area_of_interest,
-                author=result['AUTHOR'],
-                created_at=result['CREATED_AT'],
-                updated_at=result['UPDATED_AT']
-            ))
+        Returns:
+            True if the report exists
+        """
+        result = self.db.execute_query(self.REPORT_EXISTS_QUERY, {'report_id': report_id})
+        return bool(result)
+    
+    def iter_detections(self, report_id: int, batch_size: int = DETECTION_EXPORT_BATCH_SIZE,
+                        include_geometry: bool = True) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream the detections of a report batch by batch.
         
-        return overlapping_reports
+        Only one batch is held in memory at a time, so reports with hundreds
+        of thousands of detections can be exported.
+        
+        Args:
+            report_id: Report ID
+            batch_size: Detections fetched per round trip
+            include_geometry: Whether to fetch and decode the footprint
+            
+        Yields:
+            Lists of detection dictionaries
+        """
+        query, columns = self._build_detections_query(include_geometry)
+        for rows in self.db.iter_query(query, {'report_id': report_id}, batch_size=batch_size, row_format='tuple'):
+            yield self._rows_to_detections(columns, rows)
     
     def create_report_with_processing(self, report_data: ReportCreate) -> Dict[str, Any]:
         """
@@ -392,11 +341,7 @@ class ReportService:
         # Step 3: Trigger background processing
         self._trigger_background_processing(report_id, report_data)
         
-        return {
-            "report_id": report_id,
-            "status": "accepted",
-            "message": "Report creation initiated. Processing will begin shortly."
-        }
+        return self._processing_accepted(report_id)
     
     def _validate_report_creation(self, report_data: ReportCreate, validation_service: ValidationService):
         """
@@ -406,31 +351,48 @@ class ReportService:
             report_data: Report creation data
             validation_service: Validation service instance
             
+        Raises:
+            Exception: If any validation fails
+        """
+        self._check_validation_results(report_data, **validation_service.validate_report_creation(report_data))
+    
+    def _check_validation_results(self, report_data: ReportCreate, image_exists: bool,
+                                  ruleset_validation: Dict[str, Any], model_exists: bool,
+                                  author_exists: bool, geometry_valid: bool):
+        """
+        Raise for the first failed report creation check.
+        
+        Args:
+            report_data: Report creation data
+            image_exists: Whether the image exists in object storage
+            ruleset_validation: Result of validate_rulesets_exist
+            model_exists: Whether the model exists and is available
+            author_exists: Whether the author exists
+            geometry_valid: Whether the area of interest is valid
+            
         Raises:
             Exception: If any validation fails
         """
         # Validate image exists in object storage
-        if not validation_service.validate_image_exists(report_data.image_name):
+        if not image_exists:
             raise Exception(f"Image '{report_data.image_name}' not found in object storage")
         
         # Validate all rulesets exist
-        ruleset_validation = validation_service.validate_rulesets_exist(report_data.ruleset_ids)
         if not ruleset_validation["valid"]:
             missing = ruleset_validation["missing_rulesets"]
             raise Exception(f"Rulesets not found: {missing}")
         
         # Validate model exists
-        if not validation_service.validate_model_exists(report_data.model_id):
+        if not model_exists:
             raise Exception(f"Model '{report_data.model_id}' not found or not available")
         
         # Validate author exists
-        if not validation_service.validate_author_exists(report_data.author_id):
+        if not author_exists:
             raise Exception(f"Author '{report_data.author_id}' not found")
         
         # Validate area of interest if provided
-        if report_data.area_of_interest:
-            if not validation_service.validate_geometry(report_data.area_of_interest.dict()):
-                raise Exception("Invalid area of interest geometry")
+        if not geometry_valid:
+            raise Exception("Invalid area of interest geometry")
     
     def _create_report_record(self, report_data: ReportCreate) -> int:
         """
@@ -442,54 +404,14 @@ class ReportService:
         Returns:
             ID of the created report
         """
-        # Build the query with or without geometry
-        if report_data.area_of_interest:
-            sdo_geometry_sql = self._geometry_to_sdo(report_data.area_of_interest)
-            query = f"""
-                INSERT INTO REPORTS (name, status, bucket_img_path, area_of_interest, author)
-                VALUES (:name, 'initiating', :bucket_img_path, {sdo_geometry_sql}, :author)
-            """
-        else:
-            query = """
-                INSERT INTO REPORTS (name, status, bucket_img_path, area_of_interest, author)
-                VALUES (:name, 'initiating', :bucket_img_path, NULL, :author)
-            """
-        
-        params = {
-            'name': report_data.report_name,
-            'bucket_img_path': report_data.image_name,
-            'author': report_data.author_id
-        }
-        
-        # Execute the insert
-        cursor = self.db.connection.cursor()
-        cursor.execute(query, params)
-        self.db.connection.commit()  # CRITICAL: Commit the transaction
-        cursor.close()
-        
-        # Get the generated ID by querying the last inserted record
-        id_query = """
-            SELECT id FROM REPORTS 
-            WHERE name = :name AND author = :author 
-            ORDER BY created_at DESC 
-            FETCH FIRST 1 ROWS ONLY
-        """
+        geometry_type = self.db.get_type(SDO_GEOMETRY_TYPE_NAME) if report_data.area_of_interest else None
+        query, params = self._build_report_record_insert(report_data, geometry_type)
         
-        id_params = {
-            'name': report_data.report_name,
-            'author': report_data.author_id
-        }
-        
-        cursor = self.db.connection.cursor()
-        cursor.execute(id_query, id_params)
-        result = cursor.fetchone()
-        report_id = result[0] if result else None
-        cursor.close()
-        
-        if report_id is None:
-            raise Exception("Failed to get generated report ID")
+        # Insert and commit in one round trip, reading the identity back
+        returned = self.db.execute_returning(query, params, REPORT_RETURNING)
+        invalidate_report_stats()
         
-        return report_id
+        return self._new_report_id(returned)
     
     def _trigger_background_processing(self, report_id: int, report_data: ReportCreate):
         """
@@ -522,65 +444,856 @@ class ReportService:
         #         ruleset_ids=report_data.ruleset_ids,
         #         area_of_interest=report_data.area_of_interest.dict() if report_data.area_of_interest else None
         #     )
-        #     logger.info(f"Background task queued for report_id: {report_id}, task_id: {task.id}")
+        #     logger.info("Background task queued for report_id: %s, task_id: %s", report_id, task.id)
         # except Exception as e:
-        #     logger.error(f"Failed to queue background task for report_id: {report_id}, error: {str(e)}")
+        #     logger.error("Failed to queue background task for report_id: %s, error: %s", report_id, e)
         #     raise Exception(f"Failed to start background processing: {str(e)}")
         
         # For now, just log the action
-        print(f"TODO: Trigger background processing for report_id: {report_id}")
-        print(f"Parameters: model_id={report_data.model_id}, confidence={report_data.confidence_threshold}")
-        print(f"Rulesets: {report_data.ruleset_ids}")
+        logger.info(
+            "TODO: Trigger background processing for report_id: %s (model_id=%s, confidence=%s, rulesets=%s)",
+            report_id, report_data.model_id, report_data.confidence_threshold, report_data.ruleset_ids
+        )
+    
+    INSERT_WITH_GEOMETRY_QUERY = """
+        INSERT INTO REPORTS (name, status, bucket_img_path, area_of_interest, author)
+        VALUES (:name, :status, :bucket_img_path, :area_of_interest, :author)
+        RETURNING id, timestamp, created_at, updated_at
+        INTO :new_id, :new_timestamp, :new_created_at, :new_updated_at
+    """
+    
+    INSERT_WITHOUT_GEOMETRY_QUERY = """
+        INSERT INTO REPORTS (name, status, bucket_img_path, area_of_interest, author)
+        VALUES (:name, :status, :bucket_img_path, NULL, :author)
+        RETURNING id, timestamp, created_at, updated_at
+        INTO :new_id, :new_timestamp, :new_created_at, :new_updated_at
+    """
+    
+    GET_REPORT_QUERY = f"""
+        SELECT {REPORT_COLUMNS}
+        FROM REPORTS
+        WHERE id = :report_id
+    """
     
-    def _geometry_to_sdo(self, geometry: GeometryBase) -> str:
+    REPORT_EXISTS_QUERY = "SELECT 1 AS found FROM REPORTS WHERE id = :report_id"
+    
+    # DETECTIONS is list-partitioned by report_id (one partition per report) and
+    # NOTIFICATIONS is reference-partitioned on it. DDL commits on its own, so
+    # the partition is only dropped after DELETE_REPORT_QUERY has committed and
+    # the foreign keys have removed its rows together with the report; the drop
+    # just releases the emptied segments, and a failed drop leaves an empty
+    # partition behind. Partition names cannot be bound, so the block builds the
+    # DDL from the numeric bind; a report without detections has no partition.
+    DROP_DETECTIONS_PARTITION_BLOCK = """
+        DECLARE
+            no_such_partition EXCEPTION;
+            PRAGMA EXCEPTION_INIT(no_such_partition, -14702);
+        BEGIN
+            EXECUTE IMMEDIATE 'ALTER TABLE DETECTIONS DROP PARTITION FOR ('
+                || TO_CHAR(TRUNC(:report_id)) || ') UPDATE INDEXES';
+        EXCEPTION
+            WHEN no_such_partition THEN NULL;
+        END;
+    """
+    
+    DELETE_REPORT_QUERY = "DELETE FROM REPORTS WHERE id = :report_id"
+    
+    UPDATE_REPORT_QUERY = fixed_update('REPORTS', REPORT_UPDATE_COLUMNS, 'id = :report_id')
+    
+    # Dashboard aggregates in one statement. Each branch groups on a single
+    # column. author is NOT NULL, so REPORTS_AUTHOR_IDX holds every row; status
+    # is nullable and a single-column B-tree skips NULL keys, which is why
+    # REPORTS_STATUS_IDX is on (status, 0). The throughput branch only visits
+    # completed reports through REPORTS_STATUS_IDX. Completion time is updated_at.
+    REPORT_STATS_QUERY = """
+        SELECT 'status' AS dimension, status AS value, CAST(NULL AS DATE) AS hour, COUNT(*) AS report_count
+        FROM REPORTS
+        GROUP BY status
+        UNION ALL
+        SELECT 'author', author, CAST(NULL AS DATE), COUNT(*)
+        FROM REPORTS
+        GROUP BY author
+        UNION ALL
+        SELECT 'completed', NULL, TRUNC(CAST(SYS_EXTRACT_UTC(updated_at) AS DATE), 'HH24'), COUNT(*)
+        FROM REPORTS
+        WHERE status = 'completed'
+          AND SYS_EXTRACT_UTC(updated_at) >= :window_start
+        GROUP BY TRUNC(CAST(SYS_EXTRACT_UTC(updated_at) AS DATE), 'HH24')
+    """
+    
+    # Existence and area_of_interest check for the target of an overlap query
+    AREA_OF_INTEREST_CHECK_QUERY = """
+        SELECT CASE WHEN area_of_interest IS NULL THEN 0 ELSE 1 END AS has_area_of_interest
+        FROM REPORTS
+        WHERE id = :report_id
+    """
+    
+    def _build_report_insert(self, name: str, bucket_img_path: str, author: str,
+                             area_of_interest_sdo: Optional[Any] = None,
+                             status: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
         """
-        Convert GeoJSON geometry to Oracle SDO_GEOMETRY format.
+        Build the INSERT statement for a new report.
+        
+        The geometry is bound as an SDO_GEOMETRY object, so the statement text
+        only depends on whether an area of interest is present.
         
         Args:
-            geometry: GeoJSON geometry
+            name: Report name
+            bucket_img_path: Path to the image in the bucket
+            author: Author name
+            area_of_interest_sdo: Area of interest as an SDO_GEOMETRY object (optional)
+            status: Initial processing status (optional)
             
         Returns:
-            SDO_GEOMETRY string
+            Tuple of (query, params); the query returns the REPORT_RETURNING binds
+        """
+        params = {
+            'name': name,
+            'status': status,
+            'bucket_img_path': bucket_img_path,
+            'author': author
+        }
+        
+        if area_of_interest_sdo is not None:
+            params['area_of_interest'] = area_of_interest_sdo
+            return self.INSERT_WITH_GEOMETRY_QUERY, params
+        
+        return self.INSERT_WITHOUT_GEOMETRY_QUERY, params
+    
+    def _build_create_report_insert(self, report_data: ReportCreate, geometry_type=None) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build the INSERT statement for a report created through create_report.
+        
+        Args:
+            report_data: Report creation data
+            geometry_type: SDO_GEOMETRY type object (needed only with an area of interest)
+            
+        Returns:
+            Tuple of (query, params)
+        """
+        return self._build_report_insert(
+            name=report_data.name,
+            bucket_img_path=report_data.bucket_img_path,
+            author=report_data.author,
+            area_of_interest_sdo=self._area_of_interest_sdo(report_data, geometry_type)
+        )
+    
+    def _build_report_record_insert(self, report_data: ReportCreate, geometry_type=None) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build the INSERT statement for the initial record of a processed report.
+        
+        Args:
+            report_data: Report creation data
+            geometry_type: SDO_GEOMETRY type object (needed only with an area of interest)
+            
+        Returns:
+            Tuple of (query, params)
+        """
+        return self._build_report_insert(
+            name=report_data.report_name,
+            bucket_img_path=report_data.image_name,
+            author=report_data.author_id,
+            area_of_interest_sdo=self._area_of_interest_sdo(report_data, geometry_type),
+            status='initiating'
+        )
+    
+    def _area_of_interest_sdo(self, report_data: ReportCreate, geometry_type) -> Optional[Any]:
+        """
+        Convert the area of interest of a new report to SDO_GEOMETRY.
+        
+        Args:
+            report_data: Report creation data
+            geometry_type: SDO_GEOMETRY type object
+            
+        Returns:
+            SDO_GEOMETRY object, or None if the report has no area of interest
+        """
+        if not report_data.area_of_interest:
+            return None
+        return self._geometry_to_sdo(report_data.area_of_interest, geometry_type)
+    
+    def _build_reports_where(self, author: Optional[str], status: Optional[str]) -> Tuple[List[str], Dict[str, Any]]:
         """
-        # This is a simplified conversion - in production, you'd want a more robust solution
-        coords = geometry.coordinates
+        Build the filter conditions for a report listing.
         
-        if geometry.type == 'Polygon':
-            # Convert to SDO_GEOMETRY format
-            # For now, we'll store as a simple polygon
-            return f"SDO_GEOMETRY(2003, 4326, NULL, SDO_ELEM_INFO_ARRAY(1, 1003, 1), SDO_ORDINATE_ARRAY({self._coords_to_string(coords[0])}))"
+        Args:
+            author: Filter by author name (optional)
+            status: Filter by status (optional)
+            
+        Returns:
+            Tuple of (WHERE conditions, filter params)
+        """
+        where_conditions = []
+        params = {}
+        
+        if author is not None:
+            where_conditions.append("author = :author")
+            params['author'] = author
+        
+        if status is not None:
+            where_conditions.append("status = :status")
+            params['status'] = status
+        
+        return where_conditions, params
+    
+    def _select_report_fields(self, fields: Optional[List[str]], include_geometry: bool) -> Optional[List[str]]:
+        """
+        Resolve a sparse fieldset into the report columns to select.
+        
+        The id is always selected, since keyset cursors are built from it.
+        
+        Args:
+            fields: Requested report fields (optional, default all)
+            include_geometry: Whether to select the geometry columns
+            
+        Returns:
+            Columns to select in REPORT_FIELDS order, or None for a full report
+            
+        Raises:
+            ValueError: If a requested field is unknown
+        """
+        if fields is None and include_geometry:
+            return None
+        
+        requested = set(REPORT_FIELDS if fields is None else fields)
+        unknown = requested.difference(REPORT_FIELDS)
+        if unknown:
+            raise ValueError(
+                f"Invalid fields: {', '.join(sorted(unknown))}. "
+                f"Allowed fields: {', '.join(REPORT_FIELDS)}"
+            )
+        
+        if not include_geometry:
+            requested.difference_update(GEOMETRY_FIELDS)
+        requested.add('id')
+        
+        return [field for field in REPORT_FIELDS if field in requested]
+    
+    def _statement_columns(self, columns: Optional[List[str]]) -> List[str]:
+        """
+        Get the columns a report query selects for a sparse fieldset.
+        
+        Scalar columns are always selected and only the geometry columns
+        follow the fieldset, so the listing has at most four select lists
+        instead of one per field combination; the response still carries
+        only the requested fields.
+        
+        Args:
+            columns: Columns resolved by _select_report_fields (optional, default all)
+            
+        Returns:
+            Columns to select, in REPORT_FIELDS order
+        """
+        if columns is None:
+            return list(REPORT_FIELDS)
+        return columns_to_select(columns, REPORT_FIELDS, GEOMETRY_FIELDS)
+    
+    def _build_reports_query(self, page: int, per_page: int, author: Optional[str], status: Optional[str],
+                             keyset: bool = False, cursor: Optional[str] = None,
+                             columns: Optional[List[str]] = None) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build the single-statement page query for a report listing.
+        
+        Offset pages carry the filtered total as a window count. Keyset pages
+        are ordered on (created_at, id), start after the cursor row and fetch
+        one extra row to detect whether another page follows.
+        
+        Args:
+            page: Page number (1-based, ignored for keyset pages)
+            per_page: Number of items per page
+            author: Filter by author name (optional)
+            status: Filter by status (optional)
+            keyset: Whether to use keyset pagination
+            cursor: Keyset cursor from the previous page (optional)
+            columns: Columns to select (optional, default all)
+            
+        Returns:
+            Tuple of (query, params)
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        where_conditions, params = self._build_reports_where(author, status)
+        select_list = ", ".join(self._statement_columns(columns)) if columns else REPORT_COLUMNS
+        
+        if keyset:
+            if cursor is not None:
+                where_conditions.append(keyset_condition(descending=True))
+                params.update(keyset_params(cursor))
+            extra_column = SORT_KEY_COLUMN
+            paging_clause = "FETCH FIRST :fetch_rows ROWS ONLY"
+            params['fetch_rows'] = per_page + 1
         else:
-            # For other geometry types, you'd implement similar conversions
-            raise ValueError(f"Unsupported geometry type: {geometry.type}")
+            extra_column = TOTAL_COUNT_COLUMN
+            paging_clause = "OFFSET :offset ROWS FETCH NEXT :per_page ROWS ONLY"
+            params['offset'] = (page - 1) * per_page
+            params['per_page'] = per_page
+        
+        where_clause = ""
+        if where_conditions:
+            where_clause = "WHERE " + " AND ".join(where_conditions)
+        
+        query = f"""
+            SELECT {select_list}, {extra_column}
+            FROM REPORTS
+            {where_clause}
+            ORDER BY created_at DESC, id DESC
+            {paging_clause}
+        """
+        
+        return query, params
     
-    def _sdo_to_geometry(self, sdo_geometry) -> GeometryBase:
+    def _build_reports_count_query(self, author: Optional[str], status: Optional[str]) -> Tuple[str, Dict[str, Any]]:
         """
-        Convert Oracle SDO_GEOMETRY to GeoJSON geometry format.
+        Build the count query used when an offset page is past the last row.
         
         Args:
-            sdo_geometry: Oracle SDO_GEOMETRY object
+            author: Filter by author name (optional)
+            status: Filter by status (optional)
             
         Returns:
-            GeoJSON geometry
+            Tuple of (query, params)
         """
-        # This is a simplified conversion - in production, you'd want a more robust solution
-        # For now, we'll return a basic polygon structure
-        # In a real implementation, you'd parse the SDO_GEOMETRY object
+        where_conditions, params = self._build_reports_where(author, status)
         
-        # Placeholder - you'd implement proper SDO_GEOMETRY to GeoJSON conversion here
-        return GeometryBase(
-            type="Polygon",
-            coordinates=[[[-74.0059, 40.7128], [-73.9352, 40.7128], [-73.9352, 40.7589], [-74.0059, 40.7589], [-74.0059, 40.7128]]]
+        where_clause = ""
+        if where_conditions:
+            where_clause = "WHERE " + " AND ".join(where_conditions)
+        
+        return f"SELECT COUNT(*) as total FROM REPORTS {where_clause}", params
+    
+    def _build_overlapping_query(self, columns: Optional[List[str]] = None) -> str:
+        """
+        Build the query for reports overlapping a target report.
+        
+        Uses Oracle Spatial's SDO_ANYINTERACT function on area_of_interest.
+        
+        Args:
+            columns: Columns to select (optional, default all)
+            
+        Returns:
+            Query using the :report_id bind
+        """
+        select_list = ", ".join(f"r2.{column}" for column in self._statement_columns(columns))
+        
+        return f"""
+            SELECT {select_list}
+            FROM REPORTS r1, REPORTS r2
+            WHERE r1.id = :report_id
+            AND r2.id != :report_id
+            AND r1.area_of_interest IS NOT NULL
+            AND r2.area_of_interest IS NOT NULL
+            AND SDO_ANYINTERACT(r1.area_of_interest, r2.area_of_interest) = 'TRUE'
+            ORDER BY r2.created_at DESC
+        """
+    
+    def _check_overlap_target(self, report_id: int, target: List[Dict[str, Any]]) -> None:
+        """
+        Check the result of AREA_OF_INTEREST_CHECK_QUERY for a target report.
+        
+        Args:
+            report_id: Target report ID
+            target: Rows returned by the check query
+            
+        Raises:
+            Exception: If report not found or has no area_of_interest
+        """
+        if not target:
+            raise Exception(f"Report with ID {report_id} not found")
+        
+        if not target[0]['HAS_AREA_OF_INTEREST']:
+            raise Exception(f"Report {report_id} does not have an area_of_interest defined")
+    
+    def _missing_total_query(self, result: Dict[str, Any], author: Optional[str], status: Optional[str],
+                             keyset: bool) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Get the count query for an offset page that carries no window count.
+        
+        No row carries the window count when the page is past the last row;
+        an empty first page needs no count query and gets a total of 0.
+        
+        Args:
+            result: Listing result built by _reports_page
+            author: Filter by author name (optional)
+            status: Filter by status (optional)
+            keyset: Whether the query used keyset pagination
+            
+        Returns:
+            Tuple of (query, params), or None if the total is already known
+        """
+        if keyset or result['total'] is not None:
+            return None
+        if result['page'] == 1:
+            result['total'] = 0
+            return None
+        return self._build_reports_count_query(author, status)
+    
+    def _reports_page(self, results: List[Dict[str, Any]], page: int, per_page: int, keyset: bool,
+                      columns: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Convert the rows of a page query into the listing result.
+        
+        Args:
+            results: Rows returned by the page query
+            page: Page number (1-based)
+            per_page: Number of items per page
+            keyset: Whether the query used keyset pagination
+            columns: Columns the query selected (optional, default all)
+            
+        Returns:
+            Dictionary containing reports list and pagination info
+        """
+        rows, total, next_cursor = paginate_rows(results, per_page, keyset)
+        
+        return {
+            'reports': [self._row_to_report(row, columns) for row in rows],
+            'total': total,
+            'page': page,
+            'per_page': per_page,
+            'next_cursor': next_cursor
+        }
+    
+    def _stats_window_start(self, hours: int) -> datetime:
+        """
+        Get the start of the throughput window, as a naive UTC datetime.
+        
+        The window ends with the current (partial) hour and spans `hours` hours.
+        
+        Args:
+            hours: Number of hours in the window
+            
+        Returns:
+            Start of the oldest hour in the window
+        """
+        current_hour = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0, tzinfo=None)
+        return current_hour - timedelta(hours=hours - 1)
+    
+    def _rows_to_report_stats(self, rows: List[Dict[str, Any]], hours: int,
+                              window_start: datetime) -> ReportStatsResponse:
+        """
+        Build the dashboard aggregates from the rows of REPORT_STATS_QUERY.
+        
+        Args:
+            rows: Query rows (DIMENSION, VALUE, HOUR, REPORT_COUNT)
+            hours: Number of hours in the throughput window
+            window_start: Start of the oldest hour in the window
+            
+        Returns:
+            Report dashboard aggregates, with hours without completions as zero
+        """
+        by_status: Dict[str, int] = {}
+        by_author: Dict[str, int] = {}
+        completed: Dict[datetime, int] = {}
+        
+        for row in rows:
+            count = int(row['REPORT_COUNT'])
+            if row['DIMENSION'] == 'status':
+                by_status[row['VALUE'] or 'unknown'] = count
+            elif row['DIMENSION'] == 'author':
+                by_author[row['VALUE']] = count
+            else:
+                completed[row['HOUR']] = count
+        
+        hour_starts = [window_start + timedelta(hours=offset) for offset in range(hours)]
+        
+        return ReportStatsResponse(
+            total=sum(by_status.values()),
+            by_status=by_status,
+            by_author=by_author,
+            completed_per_hour=[
+                ReportThroughput(hour=hour.replace(tzinfo=timezone.utc), completed=completed.get(hour, 0))
+                for hour in hour_starts
+            ],
+            window_hours=hours,
+            generated_at=datetime.now(timezone.utc)
+        )
+    
+    def _build_update_query(self, report_id: int, report_data: ReportUpdate) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Build the UPDATE statement for the fields set in a report update.
+        
+        The statement text is always UPDATE_REPORT_QUERY; fields that are not
+        set keep their value.
+        
+        Args:
+            report_id: Report ID
+            report_data: Report update data
+            
+        Returns:
+            Tuple of (query, params), or None if there is nothing to update
+        """
+        values = {}
+        
+        if report_data.name is not None:
+            values['name'] = report_data.name
+        
+        if report_data.status is not None:
+            values['status'] = report_data.status
+        
+        if report_data.bucket_img_path is not None:
+            values['bucket_img_path'] = report_data.bucket_img_path
+        
+        # Note: Geometry updates need to be handled separately due to SQL construction
+        # For now, we'll skip geometry updates in this method
+        # TODO: Implement proper geometry update handling
+        if report_data.image_footprint is not None:
+            raise ValueError("Updating image_footprint is not yet supported. Please use a dedicated endpoint.")
+        
+        if report_data.area_of_interest is not None:
+            raise ValueError("Updating area_of_interest is not yet supported. Please use a dedicated endpoint.")
+        
+        if report_data.author is not None:
+            values['author'] = report_data.author
+        
+        if not values:
+            return None
+        
+        params = fixed_update_params(REPORT_UPDATE_COLUMNS, values)
+        params['report_id'] = report_id
+        
+        return self.UPDATE_REPORT_QUERY, params
+    
+    def _inserted_report(self, params: Dict[str, Any], returned: Dict[str, Any],
+                         area_of_interest: Optional[GeometryBase]) -> ReportResponse:
+        """
+        Build the response for a report from its INSERT binds and returned values.
+        
+        Args:
+            params: Input binds of the INSERT
+            returned: Values returned by the INSERT (see REPORT_RETURNING)
+            area_of_interest: Geometry that was inserted (optional)
+            
+        Returns:
+            Report response
+        """
+        return ReportResponse(
+            id=self._new_report_id(returned),
+            name=params['name'],
+            status=params['status'],
+            timestamp=returned['new_timestamp'],
+            bucket_img_path=params['bucket_img_path'],
+            image_footprint=None,
+            area_of_interest=area_of_interest,
+            author=params['author'],
+            created_at=returned['new_created_at'],
+            updated_at=returned['new_updated_at']
+        )
+    
+    def _new_report_id(self, returned: Dict[str, Any]) -> int:
+        """
+        Get the ID generated for a new report.
+        
+        Args:
+            returned: Values returned by the INSERT (see REPORT_RETURNING)
+            
+        Returns:
+            ID of the created report
+            
+        Raises:
+            Exception: If the INSERT returned no ID
+        """
+        if returned['new_id'] is None:
+            raise Exception("Failed to get generated report ID")
+        
+        return int(returned['new_id'])
+    
+    def _report_from_result(self, report_id: int, result: List[Dict[str, Any]]) -> ReportResponse:
+        """
+        Convert the result of GET_REPORT_QUERY into a report response.
+        
+        Args:
+            report_id: Report ID
+            result: Rows returned by GET_REPORT_QUERY
+            
+        Returns:
+            Report response
+            
+        Raises:
+            Exception: If report not found
+        """
+        if not result:
+            raise Exception(f"Report with ID {report_id} not found")
+        
+        return self._row_to_report(result[0])
+    
+    def _log_partition_drop_failure(self, report_id: int, error: Exception) -> None:
+        """
+        Log a failed DROP_DETECTIONS_PARTITION_BLOCK after a report was deleted.
+        
+        The drop can fail on a DDL lock held by a writer or on an unpartitioned
+        schema; the partition is already empty and only costs its segment.
+        
+        Args:
+            report_id: ID of the deleted report
+            error: Error raised by the block
+        """
+        logger.warning("Could not drop detections partition of report_id %s: %s", report_id, error)
+    
+    def _processing_accepted(self, report_id: int) -> Dict[str, Any]:
+        """
+        Build the 202 Accepted result of create_report_with_processing.
+        
+        Args:
+            report_id: ID of the created report
+            
+        Returns:
+            Dictionary containing report_id and status
+        """
+        return {
+            "report_id": report_id,
+            "status": "accepted",
+            "message": "Report creation initiated. Processing will begin shortly."
+        }
+    
+    def _build_detections_query(self, include_geometry: bool) -> Tuple[str, List[str]]:
+        """
+        Build the query that exports the detections of a report.
+        
+        Args:
+            include_geometry: Whether to select the footprint
+            
+        Returns:
+            Tuple of (query using the :report_id bind, selected columns)
+        """
+        columns = [field for field in DETECTION_FIELDS if include_geometry or field != 'footprint']
+        
+        query = f"""
+            SELECT {', '.join(columns)}
+            FROM DETECTIONS
+            WHERE report_id = :report_id
+            ORDER BY id
+        """
+        
+        return query, columns
+    
+    def _rows_to_detections(self, columns: List[str], rows: List[tuple]) -> List[Dict[str, Any]]:
+        """
+        Convert a batch of DETECTIONS row tuples into dictionaries.
+        
+        Args:
+            columns: Columns selected by the detections query
+            rows: Row tuples in column order
+            
+        Returns:
+            List of detection dictionaries, with the footprint as GeoJSON
+        """
+        detections = [dict(zip(columns, row)) for row in rows]
+        
+        if 'footprint' in columns:
+            for detection in detections:
+                if detection['footprint'] is not None:
+                    detection['footprint'] = sdo_to_geojson(detection['footprint'])
+        
+        return detections
+    
+    def _row_to_report(self, row: Dict[str, Any], columns: Optional[List[str]] = None) -> Any:
+        """
+        Convert a REPORTS row into a report response.
+        
+        Args:
+            row: Row dictionary keyed by upper-case column name
+            columns: Columns the query selected (optional, default all)
+            
+        Returns:
+            Report response, or a report summary when columns is given
+        """
+        if columns is not None:
+            values = {column: row[column.upper()] for column in columns}
+            for column in GEOMETRY_FIELDS:
+                if values.get(column):
+                    values[column] = self._sdo_to_geometry(values[column])
+            return ReportSummaryResponse(**values)
+        
+        # Convert SDO_GEOMETRY to GeoJSON format if present
+        image_footprint = None
+        if row['IMAGE_FOOTPRINT']:
+            image_footprint = self._sdo_to_geometry(row['IMAGE_FOOTPRINT'])
+        
+        area_of_interest = None
+        if row['AREA_OF_INTEREST']:
+            area_of_interest = self._sdo_to_geometry(row['AREA_OF_INTEREST'])
+        
+        return ReportResponse(
+            id=row['ID'],
+            name=row['NAME'],
+            status=row['STATUS'],
+            timestamp=row['TIMESTAMP'],
+            bucket_img_path=row['BUCKET_IMG_PATH'],
+            image_footprint=image_footprint,
+            area_of_interest=area_of_interest,
+            author=row['AUTHOR'],
+            created_at=row['CREATED_AT'],
+            updated_at=row['UPDATED_AT']
         )
     
-    def _coords_to_string(self, coords: List[List[float]]) -> str:
+    def _geometry_to_sdo(self, geometry: GeometryBase, geometry_type):
+        """
+        Convert GeoJSON geometry to an Oracle SDO_GEOMETRY object for binding.
+        
+        Args:
+            geometry: GeoJSON geometry
+            geometry_type: MDSYS.SDO_GEOMETRY type object of the connection
+            
+        Returns:
+            SDO_GEOMETRY database object
+        """
+        return SdoGeometryConverter(geometry_type).to_sdo(geometry)
+    
+    def _sdo_to_geometry(self, sdo_geometry) -> GeometryBase:
         """
-        Convert coordinate array to string format for SDO_GEOMETRY.
+        Convert Oracle SDO_GEOMETRY to GeoJSON geometry format.
         
         Args:
-            coords: List of coordinate pairs
+            sdo_geometry: Oracle SDO_GEOMETRY object
             
         Returns:
-            Coordinate string
+            GeoJSON geometry
+        """
+        return GeometryBase(**sdo_to_geojson(sdo_geometry))
+    
+
+
+class AsyncReportService(ReportService):
+    """
+    Asyncio counterpart of ReportService.
+    
+    Shares query building and row conversion with ReportService, but awaits
+    every database call on an AsyncDatabase so the event loop stays free.
+    """
+    
+    def __init__(self, db: AsyncDatabase):
         """
-        return ', '.join([f"{coord[0]}, {coord[1]}" for coord in coords])
+        Initialize the async report service.
+        
+        Args:
+            db: Async database connection instance
+        """
+        self.db = db
+    
+    async def create_report(self, report_data: ReportCreate) -> ReportResponse:
+        """Create a new report (see ReportService.create_report)."""
+        geometry_type = await self.db.get_type(SDO_GEOMETRY_TYPE_NAME) if report_data.area_of_interest else None
+        query, params = self._build_create_report_insert(report_data, geometry_type)
+        returned = await self.db.execute_returning(query, params, REPORT_RETURNING)
+        invalidate_report_stats()
+        
+        return self._inserted_report(params, returned, report_data.area_of_interest)
+    
+    async def get_report(self, report_id: int) -> ReportResponse:
+        """Get a report by ID (see ReportService.get_report)."""
+        result = await self.db.execute_query(self.GET_REPORT_QUERY, {'report_id': report_id})
+        
+        return self._report_from_result(report_id, result)
+    
+    async def get_reports(self, page: int = 1, per_page: int = 10, author: Optional[str] = None, status: Optional[str] = None,
+                          keyset: bool = False, cursor: Optional[str] = None,
+                          fields: Optional[List[str]] = None, include_geometry: bool = True) -> Dict[str, Any]:
+        """Get a list of reports with pagination (see ReportService.get_reports)."""
+        columns = self._select_report_fields(fields, include_geometry)
+        query, params = self._build_reports_query(page, per_page, author, status, keyset, cursor, columns)
+        results = await self.db.execute_query(query, params)
+        result = self._reports_page(results, page, per_page, keyset, columns)
+        
+        count = self._missing_total_query(result, author, status, keyset)
+        if count is not None:
+            result['total'] = count_total(await self.db.execute_query(*count))
+        
+        return result
+    
+    async def get_report_stats(self, hours: int = 24) -> ReportStatsResponse:
+        """Get the report dashboard aggregates (see ReportService.get_report_stats)."""
+        found, stats = _report_stats_cache.get(hours)
+        if found:
+            return stats
+        
+        window_start = self._stats_window_start(hours)
+        rows = await self.db.execute_query(self.REPORT_STATS_QUERY, {'window_start': window_start})
+        stats = self._rows_to_report_stats(rows, hours, window_start)
+        
+        _report_stats_cache.put(hours, stats)
+        return stats
+    
+    async def update_report(self, report_id: int, report_data: ReportUpdate) -> ReportResponse:
+        """Update an existing report (see ReportService.update_report)."""
+        # Check if report exists
+        await self.get_report(report_id)
+        
+        update = self._build_update_query(report_id, report_data)
+        if update is None:
+            return await self.get_report(report_id)
+        
+        query, params = update
+        await self.db.execute_update(query, params)
+        if report_data.status is not None:
+            invalidate_report_stats()
+        
+        return await self.get_report(report_id)
+    
+    async def delete_report(self, report_id: int) -> bool:
+        """Delete a report and drop its detections partition (see ReportService.delete_report)."""
+        # Check if report exists
+        if not await self.report_exists(report_id):
+            raise Exception(f"Report with ID {report_id} not found")
+        
+        affected_rows = await self.db.execute_update(self.DELETE_REPORT_QUERY, {'report_id': report_id})
+        invalidate_report_stats()
+        
+        if affected_rows > 0:
+            try:
+                await self.db.execute_update(self.DROP_DETECTIONS_PARTITION_BLOCK, {'report_id': report_id})
+            except Exception as e:
+                self._log_partition_drop_failure(report_id, e)
+        
+        return affected_rows > 0
+    
+    async def get_overlapping_reports(self, report_id: int, fields: Optional[List[str]] = None,
+                                      include_geometry: bool = True) -> List[Any]:
+        """Get the reports overlapping a report (see ReportService.get_overlapping_reports)."""
+        columns = self._select_report_fields(fields, include_geometry)
+        
+        target = await self.db.execute_query(self.AREA_OF_INTEREST_CHECK_QUERY, {'report_id': report_id})
+        self._check_overlap_target(report_id, target)
+        
+        results = await self.db.execute_query(self._build_overlapping_query(columns), {'report_id': report_id})
+        
+        return [self._row_to_report(result, columns) for result in results]
+    
+    async def report_exists(self, report_id: int) -> bool:
+        """Check whether a report exists (see ReportService.report_exists)."""
+        result = await self.db.execute_query(self.REPORT_EXISTS_QUERY, {'report_id': report_id})
+        return bool(result)
+    
+    async def iter_detections(self, report_id: int, batch_size: int = DETECTION_EXPORT_BATCH_SIZE,
+                              include_geometry: bool = True) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream the detections of a report batch by batch (see ReportService.iter_detections)."""
+        query, columns = self._build_detections_query(include_geometry)
+        async for rows in self.db.iter_query(query, {'report_id': report_id}, batch_size=batch_size, row_format='tuple'):
+            yield self._rows_to_detections(columns, rows)
+    
+    async def create_report_with_processing(self, report_data: ReportCreate) -> Dict[str, Any]:
+        """Create a report and trigger its processing (see ReportService.create_report_with_processing)."""
+        validation_service = AsyncValidationService(self.db)
+        
+        # Step 1: Validation
+        await self._validate_report_creation(report_data, validation_service)
+        
+        # Step 2: Create report record
+        report_id = await self._create_report_record(report_data)
+        
+        # Step 3: Trigger background processing
+        self._trigger_background_processing(report_id, report_data)
+        
+        return self._processing_accepted(report_id)
+    
+    async def _validate_report_creation(self, report_data: ReportCreate, validation_service: AsyncValidationService):
+        """Validate all requirements for report creation (see ReportService._validate_report_creation)."""
+        self._check_validation_results(report_data, **await validation_service.validate_report_creation(report_data))
+    
+    async def _create_report_record(self, report_data: ReportCreate) -> int:
+        """Create the initial report record (see ReportService._create_report_record)."""
+        geometry_type = await self.db.get_type(SDO_GEOMETRY_TYPE_NAME) if report_data.area_of_interest else None
+        query, params = self._build_report_record_insert(report_data, geometry_type)
+        returned = await self.db.execute_returning(query, params, REPORT_RETURNING)
+        invalidate_report_stats()
+        
+        return self._new_report_id(returned)
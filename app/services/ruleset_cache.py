@@ -0,0 +1,132 @@
+"""
+In-process cache of parsed rulesets.
+
+Rulesets change rarely but are read on every report creation. The cache
+keeps parsed RulesetResponse objects keyed by ID together with their version
+(updated_at), so a refetched row whose version is unchanged reuses the parsed
+object instead of decoding its JSON again. Entries expire after a TTL so that
+several workers, each with their own cache, converge on changes made through
+another worker; writes through this process invalidate immediately.
+"""
+
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from ..models import RulesetResponse
+from .lookup_cache import TTLCache
+
+
+class RulesetCache:
+    """
+    Bounded, TTL-based LRU cache of rulesets.
+
+    Storage, expiry and eviction are those of TTLCache; this class adds the
+    version check. The cache is shared by the sync and async services.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached rulesets (default: RULESET_CACHE_SIZE or 256)
+            ttl_seconds: Seconds an entry is served without touching the database
+                (default: RULESET_CACHE_TTL or 30)
+        """
+        max_size = max_size if max_size is not None else int(os.getenv('RULESET_CACHE_SIZE', '256'))
+        ttl_seconds = ttl_seconds if ttl_seconds is not None else float(os.getenv('RULESET_CACHE_TTL', '30'))
+
+        # ruleset_id -> (version, ruleset)
+        self._cache = TTLCache(ttl_seconds, max_size=max_size)
+
+        self.version_hits = 0
+
+    def get(self, ruleset_id: int) -> Optional[RulesetResponse]:
+        """
+        Get a ruleset that has not expired yet.
+
+        Args:
+            ruleset_id: Ruleset ID
+
+        Returns:
+            Cached ruleset, or None on a miss
+        """
+        found, entry = self._cache.get(ruleset_id)
+        return entry[1] if found else None
+
+    def get_version(self, ruleset_id: int, version: Optional[datetime]) -> Optional[RulesetResponse]:
+        """
+        Get a cached ruleset if it matches a version read from the database.
+
+        A match renews the entry's TTL, even if it had expired.
+
+        Args:
+            ruleset_id: Ruleset ID
+            version: updated_at value of the current row
+
+        Returns:
+            Cached ruleset, or None if absent or of another version
+        """
+        renewed, entry = self._cache.renew_if(ruleset_id, lambda cached: cached[0] == version)
+        if not renewed:
+            return None
+
+        self.version_hits += 1
+        return entry[1]
+
+    def put(self, ruleset: RulesetResponse) -> None:
+        """
+        Store a ruleset, evicting the least recently used entry if full.
+
+        Args:
+            ruleset: Parsed ruleset
+        """
+        self._cache.put(ruleset.id, (ruleset.updated_at, ruleset))
+
+    def invalidate(self, ruleset_id: int) -> None:
+        """
+        Drop a ruleset after it was updated or deleted.
+
+        Args:
+            ruleset_id: Ruleset ID
+        """
+        self._cache.invalidate(ruleset_id)
+
+    def clear(self) -> None:
+        """Drop every cached ruleset."""
+        self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics for monitoring.
+
+        Returns:
+            Dictionary with size, limits, hit/miss counters and version hits
+        """
+        stats = self._cache.get_stats()
+        stats["version_hits"] = self.version_hits
+        return stats
+
+
+# Process-wide cache shared by every service instance
+_ruleset_cache: Optional[RulesetCache] = None
+_ruleset_cache_lock = threading.Lock()
+
+
+def get_ruleset_cache() -> RulesetCache:
+    """
+    Get the process-wide ruleset cache, creating it on first use.
+
+    Returns:
+        Shared RulesetCache instance
+    """
+    global _ruleset_cache
+
+    if _ruleset_cache is None:
+        with _ruleset_cache_lock:
+            if _ruleset_cache is None:
+                _ruleset_cache = RulesetCache()
+
+    return _ruleset_cache
@@ -5,25 +5,68 @@ This module contains the service layer for ruleset operations,
 handling the conversion between database records and API models.
 """
 
-import json
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
-from ..database import Database
+import oracledb
+
+from ..database import Database, AsyncDatabase
 from ..models import RulesetCreate, RulesetUpdate, RulesetResponse, Condition
+from .ruleset_cache import RulesetCache, get_ruleset_cache
+from .query_builder import in_list_condition, fixed_update, fixed_update_params
+from .pagination import (
+    TOTAL_COUNT_COLUMN,
+    SORT_KEY_COLUMN,
+    keyset_condition,
+    keyset_params,
+    paginate_rows,
+    count_total
+)
+
+
+RULESET_COLUMNS = "id, name, description, user_groups, conditions, author, created_at, updated_at"
+
+# USER_GROUPS and CONDITIONS are native JSON columns; Python lists and dicts
+# are bound as OSON and fetched back as Python objects, never as JSON text
+RULESET_JSON_COLUMNS = {
+    'user_groups': oracledb.DB_TYPE_JSON,
+    'conditions': oracledb.DB_TYPE_JSON
+}
+
+# Columns a ruleset update may change; one UPDATE text serves every subset
+RULESET_UPDATE_COLUMNS = ('name', 'description', 'user_groups', 'conditions', 'author')
+
+UPDATE_RULESET_QUERY = fixed_update('RULESETS', RULESET_UPDATE_COLUMNS, 'id = :ruleset_id')
+
+GET_RULESET_QUERY = f"""
+    SELECT {RULESET_COLUMNS}
+    FROM RULESETS
+    WHERE id = :ruleset_id
+"""
+
+DELETE_RULESET_QUERY = "DELETE FROM RULESETS WHERE id = :ruleset_id"
+
+# Server-generated RULESETS values returned by the INSERT itself
+RULESET_RETURNING = {
+    'new_id': oracledb.DB_TYPE_NUMBER,
+    'new_created_at': oracledb.DB_TYPE_TIMESTAMP_TZ,
+    'new_updated_at': oracledb.DB_TYPE_TIMESTAMP_TZ
+}
 
 
 class RulesetService:
     """Service class for ruleset operations."""
     
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, cache: Optional[RulesetCache] = None):
         """
         Initialize the ruleset service.
         
         Args:
             db: Database connection instance
+            cache: Ruleset cache (default: the process-wide cache)
         """
         self.db = db
+        self.cache = cache if cache is not None else get_ruleset_cache()
     
     def create_ruleset(self, ruleset_data: RulesetCreate) -> RulesetResponse:
         """
@@ -38,287 +81,603 @@ class RulesetService:
         Raises:
             Exception: If creation fails
         """
-        # Convert JSON fields to strings for Oracle
-        # user_groups should be a list of strings
-        if ruleset_data.user_groups:
-            # Ensure it's a list and convert to JSON
-            if isinstance(ruleset_data.user_groups, list):
-                user_groups_json = json.dumps(ruleset_data.user_groups)
+        query, params = self._build_insert_query(ruleset_data)
+        
+        # Insert, commit and read back the generated values in one round trip
+        returned = self.db.execute_returning(
+            query, params, RULESET_RETURNING, input_sizes=self._json_input_sizes(params)
+        )
+        ruleset = self._inserted_ruleset(ruleset_data, returned)
+        self.cache.put(ruleset)
+        
+        return ruleset
+    
+    def get_ruleset(self, ruleset_id: int) -> RulesetResponse:
+        """
+        Get a ruleset by ID.
+        
+        Args:
+            ruleset_id: Ruleset ID
+            
+        Returns:
+            Ruleset response
+            
+        Raises:
+            Exception: If ruleset not found
+        """
+        cached = self.cache.get(ruleset_id)
+        if cached is not None:
+            return cached
+        
+        result = self.db.execute_query(GET_RULESET_QUERY, {'ruleset_id': ruleset_id})
+        
+        return self._ruleset_from_result(ruleset_id, result)
+    
+    def get_cached_rulesets(self, ruleset_ids: List[int]) -> Tuple[Dict[int, RulesetResponse], List[int]]:
+        """
+        Look up a list of rulesets in the cache only.
+        
+        Args:
+            ruleset_ids: List of ruleset IDs
+            
+        Returns:
+            Tuple of (cached rulesets by ID, IDs that must be read from the database)
+        """
+        rulesets = {}
+        uncached_ids = []
+        for ruleset_id in dict.fromkeys(ruleset_ids):
+            cached = self.cache.get(ruleset_id)
+            if cached is not None:
+                rulesets[ruleset_id] = cached
             else:
-                # If it's not a list, wrap it in a list
-                user_groups_json = json.dumps([ruleset_data.user_groups])
-        else:
-            user_groups_json = None
+                uncached_ids.append(ruleset_id)
         
-        # Convert conditions to JSON
-        if ruleset_data.conditions:
-            conditions_data = []
-            for condition in ruleset_data.conditions:
-                if hasattr(condition, 'dict'):
-                    # It's a Condition object - convert to dict and exclude None values
-                    condition_dict = condition.dict(exclude_none=True)
-                    conditions_data.append(condition_dict)
-                else:
-                    # It's already a dictionary
-                    conditions_data.append(condition)
-            conditions_json = json.dumps(conditions_data)
-        else:
-            conditions_json = None
+        return rulesets, uncached_ids
+    
+    def get_rulesets_by_ids(self, ruleset_ids: List[int]) -> Dict[int, RulesetResponse]:
+        """
+        Get the rulesets that exist among a list of IDs.
         
-        # Insert the ruleset
-        query = """
-            INSERT INTO RULESETS (name, description, user_groups, conditions, author)
-            VALUES (:name, :description, :user_groups, :conditions, :author)
+        Cached rulesets are served directly; the rest are fetched in one query.
+        
+        Args:
+            ruleset_ids: List of ruleset IDs
+            
+        Returns:
+            Dictionary of ruleset ID to ruleset, for the IDs that exist
         """
+        rulesets, uncached_ids = self.get_cached_rulesets(ruleset_ids)
         
-        params = {
-            'name': ruleset_data.name,
-            'description': ruleset_data.description,
-            'user_groups': user_groups_json,
-            'conditions': conditions_json,
-            'author': ruleset_data.author
-        }
+        if uncached_ids:
+            query, params = self._build_rulesets_by_ids_query(uncached_ids)
+            self._add_fetched_rulesets(rulesets, self.db.execute_query(query, params))
         
-        # Execute the insert
-        self.db.execute_update(query, params)
+        return rulesets
+    
+    def get_rulesets(self, page: int = 1, per_page: int = 10, author: Optional[str] = None,
+                    keyset: bool = False, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get a list of rulesets with pagination.
         
-        # Get the generated ID by querying the last inserted record
-        # This is a workaround since Oracle's RETURNING clause is tricky with the Python driver
-        id_query = """
-            SELECT id FROM RULESETS 
-            WHERE name = :name AND author = :author 
-            ORDER BY created_at DESC 
-            FETCH FIRST 1 ROWS ONLY
+        Args:
+            page: Page number (1-based, ignored for keyset pagination)
+            per_page: Number of items per page
+            author: Filter by author name (optional)
+            keyset: Use keyset pagination ordered on (created_at, id)
+            cursor: Keyset cursor returned as next_cursor by the previous page
+            
+        Returns:
+            Dictionary containing rulesets list and pagination info
         """
+        query, params = self._build_rulesets_query(page, per_page, author, keyset, cursor)
+        results = self.db.execute_query(query, params)
+        result = self._rulesets_page(results, page, per_page, keyset)
         
-        id_params = {
-            'name': ruleset_data.name,
-            'author': ruleset_data.author
-        }
+        count = self._missing_total_query(result, author, keyset)
+        if count is not None:
+            result['total'] = count_total(self.db.execute_query(*count))
+        
+        return result
+    
+    def update_ruleset(self, ruleset_id: int, ruleset_data: RulesetUpdate) -> RulesetResponse:
+        """
+        Update an existing ruleset.
+        
+        Args:
+            ruleset_id: Ruleset ID
+            ruleset_data: Ruleset update data
+            
+        Returns:
+            Updated ruleset response
+            
+        Raises:
+            Exception: If ruleset not found or update fails
+        """
+        # Check if ruleset exists
+        self.get_ruleset(ruleset_id)
         
-        cursor = self.db.connection.cursor()
-        cursor.execute(id_query, id_params)
-        result = cursor.fetchone()
-        ruleset_id = result[0] if result else None
-        cursor.close()
+        update = self._build_update_query(ruleset_id, ruleset_data)
+        if update is None:
+            return self.get_ruleset(ruleset_id)
         
-        if ruleset_id is None:
-            raise Exception("Failed to get generated ruleset ID")
+        query, params = update
+        self.db.execute_update(query, params, input_sizes=self._json_input_sizes(params))
+        self.cache.invalidate(ruleset_id)
         
-        # Return the created ruleset
         return self.get_ruleset(ruleset_id)
     
-    def get_ruleset(self, ruleset_id: int) -> RulesetResponse:
+    def delete_ruleset(self, ruleset_id: int) -> bool:
         """
-        Get a ruleset by ID.
+        Delete a ruleset.
         
         Args:
             ruleset_id: Ruleset ID
             
         Returns:
-            Ruleset response
+            True if deleted successfully
             
         Raises:
-            Exception: If ruleset not found
-        """
-        query = """
-            SELECT id, name, description, user_groups, conditions, author, created_at, updated_at
-            FROM RULESETS
-            WHERE id = :ruleset_id
+            Exception: If ruleset not found or deletion fails
         """
+        # Existence is decided by the DELETE itself, not by get_ruleset: the
+        # ruleset cache may still hold a ruleset another worker has deleted
+        affected_rows = self.db.execute_update(DELETE_RULESET_QUERY, {'ruleset_id': ruleset_id})
         
-        result = self.db.execute_query(query, {'ruleset_id': ruleset_id})
+        return self._ruleset_deleted(ruleset_id, affected_rows)
+    
+    def _serialize_conditions(self, conditions: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Convert conditions to dictionaries for a native JSON bind.
         
-        if not result:
-            raise Exception(f"Ruleset with ID {ruleset_id} not found")
+        Args:
+            conditions: Condition objects or dictionaries
+            
+        Returns:
+            List of condition dictionaries
+        """
+        conditions_data = []
+        for condition in conditions:
+            if hasattr(condition, 'dict'):
+                # It's a Condition object - convert to dict and exclude None values
+                condition_dict = condition.dict(exclude_none=True)
+                conditions_data.append(condition_dict)
+            else:
+                # It's already a dictionary
+                conditions_data.append(condition)
+        return conditions_data
+    
+    def _json_input_sizes(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get the DB_TYPE_JSON input sizes for the JSON columns bound in a statement.
         
-        ruleset = result[0]
+        Args:
+            params: Statement bind parameters
+            
+        Returns:
+            Bind names mapped to oracledb.DB_TYPE_JSON
+        """
+        return {name: bind_type for name, bind_type in RULESET_JSON_COLUMNS.items() if name in params}
+    
+    def _build_insert_query(self, ruleset_data: RulesetCreate) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build the INSERT statement for a new ruleset.
         
-        # Parse JSON fields - Oracle may return them as already parsed objects or as JSON strings
-        # Handle user_groups - check if it's already a list or needs JSON parsing
-        if isinstance(ruleset['USER_GROUPS'], list):
-            user_groups = ruleset['USER_GROUPS']
+        Args:
+            ruleset_data: Ruleset creation data
+            
+        Returns:
+            Tuple of (query, params)
+        """
+        # JSON fields are bound as Python objects (see RULESET_JSON_COLUMNS)
+        # user_groups should be a list of strings
+        if ruleset_data.user_groups:
+            if isinstance(ruleset_data.user_groups, list):
+                user_groups = ruleset_data.user_groups
+            else:
+                # If it's not a list, wrap it in a list
+                user_groups = [ruleset_data.user_groups]
         else:
-            user_groups = json.loads(ruleset['USER_GROUPS']) if ruleset['USER_GROUPS'] else []
+            user_groups = None
         
-        # Handle conditions - check if it's already a list or needs JSON parsing
-        if isinstance(ruleset['CONDITIONS'], list):
-            conditions_data = ruleset['CONDITIONS']
+        if ruleset_data.conditions:
+            conditions = self._serialize_conditions(ruleset_data.conditions)
         else:
-            conditions_data = json.loads(ruleset['CONDITIONS']) if ruleset['CONDITIONS'] else []
+            conditions = None
         
-        conditions = [Condition(**condition) for condition in conditions_data]
+        # Insert the ruleset, returning the generated values (see RULESET_RETURNING)
+        query = """
+            INSERT INTO RULESETS (name, description, user_groups, conditions, author)
+            VALUES (:name, :description, :user_groups, :conditions, :author)
+            RETURNING id, created_at, updated_at INTO :new_id, :new_created_at, :new_updated_at
+        """
         
-        return RulesetResponse(
-            id=ruleset['ID'],
-            name=ruleset['NAME'],
-            description=ruleset['DESCRIPTION'],
-            user_groups=user_groups,
-            conditions=conditions,
-            author=ruleset['AUTHOR'],
-            created_at=ruleset['CREATED_AT'],
-            updated_at=ruleset['UPDATED_AT']
-        )
+        params = {
+            'name': ruleset_data.name,
+            'description': ruleset_data.description,
+            'user_groups': user_groups,
+            'conditions': conditions,
+            'author': ruleset_data.author
+        }
+        
+        return query, params
     
-    def get_rulesets(self, page: int = 1, per_page: int = 10, author: Optional[str] = None) -> Dict[str, Any]:
+    def _build_rulesets_query(self, page: int, per_page: int, author: Optional[str],
+                              keyset: bool = False, cursor: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
         """
-        Get a list of rulesets with pagination.
+        Build the single-statement page query for a ruleset listing.
+        
+        Offset pages carry the filtered total as a window count. Keyset pages
+        are ordered on (created_at, id), start after the cursor row and fetch
+        one extra row to detect whether another page follows.
         
         Args:
-            page: Page number (1-based)
+            page: Page number (1-based, ignored for keyset pages)
             per_page: Number of items per page
             author: Filter by author name (optional)
+            keyset: Whether to use keyset pagination
+            cursor: Keyset cursor from the previous page (optional)
             
         Returns:
-            Dictionary containing rulesets list and pagination info
+            Tuple of (query, params)
+            
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        offset = (page - 1) * per_page
-        
-        # Build the WHERE clause
-        where_clause = ""
-        params = {'offset': offset, 'per_page': per_page}
+        where_conditions = []
+        params = {}
         
         if author is not None:
-            where_clause = "WHERE author = :author"
+            where_conditions.append("author = :author")
             params['author'] = author
         
-        # Get total count
-        count_query = f"SELECT COUNT(*) as total FROM RULESETS {where_clause}"
-        count_params = {k: v for k, v in params.items() if k != 'offset' and k != 'per_page'}
-        count_result = self.db.execute_query(count_query, count_params)
-        total = count_result[0]['TOTAL'] if count_result else 0
+        if keyset:
+            if cursor is not None:
+                where_conditions.append(keyset_condition(descending=False))
+                params.update(keyset_params(cursor))
+            extra_column = SORT_KEY_COLUMN
+            paging_clause = "FETCH FIRST :fetch_rows ROWS ONLY"
+            params['fetch_rows'] = per_page + 1
+        else:
+            extra_column = TOTAL_COUNT_COLUMN
+            paging_clause = "OFFSET :offset ROWS FETCH NEXT :per_page ROWS ONLY"
+            params['offset'] = (page - 1) * per_page
+            params['per_page'] = per_page
+        
+        where_clause = ""
+        if where_conditions:
+            where_clause = "WHERE " + " AND ".join(where_conditions)
         
-        # Get rulesets
         query = f"""
-            SELECT id, name, description, user_groups, conditions, author, created_at, updated_at
+            SELECT {RULESET_COLUMNS}, {extra_column}
             FROM RULESETS
             {where_clause}
-            ORDER BY id
-            OFFSET :offset ROWS FETCH NEXT :per_page ROWS ONLY
+            ORDER BY created_at, id
+            {paging_clause}
         """
         
-        results = self.db.execute_query(query, params)
+        return query, params
+    
+    def _build_rulesets_by_ids_query(self, ruleset_ids: List[int]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build the query that fetches a list of rulesets by ID.
         
-        rulesets = []
-        for result in results:
-            # Parse JSON fields - Oracle may return them as already parsed objects or as JSON strings
-            if isinstance(result['USER_GROUPS'], list):
-                user_groups = result['USER_GROUPS']
-            else:
-                user_groups = json.loads(result['USER_GROUPS']) if result['USER_GROUPS'] else []
+        Args:
+            ruleset_ids: List of ruleset IDs to fetch
             
-            if isinstance(result['CONDITIONS'], list):
-                conditions_data = result['CONDITIONS']
-            else:
-                conditions_data = json.loads(result['CONDITIONS']) if result['CONDITIONS'] else []
+        Returns:
+            Tuple of (query, params)
+        """
+        condition, params = in_list_condition('id', ruleset_ids, 'id')
+        query = f"""
+            SELECT {RULESET_COLUMNS}
+            FROM RULESETS
+            WHERE {condition}
+        """
+        
+        return query, params
+    
+    def _build_rulesets_count_query(self, author: Optional[str]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build the count query used when an offset page is past the last row.
+        
+        Args:
+            author: Filter by author name (optional)
+            
+        Returns:
+            Tuple of (query, params)
+        """
+        if author is not None:
+            return "SELECT COUNT(*) as total FROM RULESETS WHERE author = :author", {'author': author}
+        return "SELECT COUNT(*) as total FROM RULESETS", {}
+    
+    def _missing_total_query(self, result: Dict[str, Any], author: Optional[str],
+                             keyset: bool) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Get the count query for an offset page that carries no window count.
+        
+        No row carries the window count when the page is past the last row;
+        an empty first page needs no count query and gets a total of 0.
+        
+        Args:
+            result: Listing result built by _rulesets_page
+            author: Filter by author name (optional)
+            keyset: Whether the query used keyset pagination
             
-            conditions = [Condition(**condition) for condition in conditions_data]
+        Returns:
+            Tuple of (query, params), or None if the total is already known
+        """
+        if keyset or result['total'] is not None:
+            return None
+        if result['page'] == 1:
+            result['total'] = 0
+            return None
+        return self._build_rulesets_count_query(author)
+    
+    def _rulesets_page(self, results: List[Dict[str, Any]], page: int, per_page: int, keyset: bool) -> Dict[str, Any]:
+        """
+        Convert the rows of a page query into the listing result.
+        
+        Args:
+            results: Rows returned by the page query
+            page: Page number (1-based)
+            per_page: Number of items per page
+            keyset: Whether the query used keyset pagination
             
-            rulesets.append(RulesetResponse(
-                id=result['ID'],
-                name=result['NAME'],
-                description=result['DESCRIPTION'],
-                user_groups=user_groups,
-                conditions=conditions,
-                author=result['AUTHOR'],
-                created_at=result['CREATED_AT'],
-                updated_at=result['UPDATED_AT']
-            ))
+        Returns:
+            Dictionary containing rulesets list and pagination info
+        """
+        rows, total, next_cursor = paginate_rows(results, per_page, keyset)
         
         return {
-            'rulesets': rulesets,
+            'rulesets': [self._cached_row_to_ruleset(row) for row in rows],
             'total': total,
             'page': page,
-            'per_page': per_page
+            'per_page': per_page,
+            'next_cursor': next_cursor
         }
     
-    def update_ruleset(self, ruleset_id: int, ruleset_data: RulesetUpdate) -> RulesetResponse:
+    def _build_update_query(self, ruleset_id: int, ruleset_data: RulesetUpdate) -> Optional[Tuple[str, Dict[str, Any]]]:
         """
-        Update an existing ruleset.
+        Build the UPDATE statement for the fields set in a ruleset update.
+        
+        The statement text is always UPDATE_RULESET_QUERY; fields that are not
+        set keep their value.
         
         Args:
             ruleset_id: Ruleset ID
             ruleset_data: Ruleset update data
             
         Returns:
-            Updated ruleset response
-            
-        Raises:
-            Exception: If ruleset not found or update fails
+            Tuple of (query, params), or None if there is nothing to update
         """
-        # Check if ruleset exists
-        self.get_ruleset(ruleset_id)
-        
-        # Build update query dynamically
-        update_fields = []
-        params = {'ruleset_id': ruleset_id}
+        values = {}
         
         if ruleset_data.name is not None:
-            update_fields.append("name = :name")
-            params['name'] = ruleset_data.name
+            values['name'] = ruleset_data.name
         
         if ruleset_data.description is not None:
-            update_fields.append("description = :description")
-            params['description'] = ruleset_data.description
+            values['description'] = ruleset_data.description
         
         if ruleset_data.user_groups is not None:
-            user_groups_json = json.dumps(ruleset_data.user_groups)
-            update_fields.append("user_groups = :user_groups")
-            params['user_groups'] = user_groups_json
+            values['user_groups'] = ruleset_data.user_groups
         
         if ruleset_data.conditions is not None:
-            # Convert conditions to JSON - handle both Condition objects and dictionaries
-            conditions_data = []
-            for condition in ruleset_data.conditions:
-                if hasattr(condition, 'dict'):
-                    # It's a Condition object - convert to dict and exclude None values
-                    condition_dict = condition.dict(exclude_none=True)
-                    conditions_data.append(condition_dict)
-                else:
-                    # It's already a dictionary
-                    conditions_data.append(condition)
-            conditions_json = json.dumps(conditions_data)
-            update_fields.append("conditions = :conditions")
-            params['conditions'] = conditions_json
+            # Handle both Condition objects and dictionaries
+            values['conditions'] = self._serialize_conditions(ruleset_data.conditions)
         
         if ruleset_data.author is not None:
-            update_fields.append("author = :author")
-            params['author'] = ruleset_data.author
+            values['author'] = ruleset_data.author
         
-        if not update_fields:
-            return self.get_ruleset(ruleset_id)
+        if not values:
+            return None
         
-        # Add updated_at timestamp
-        update_fields.append("updated_at = CURRENT_TIMESTAMP")
+        params = fixed_update_params(RULESET_UPDATE_COLUMNS, values)
+        params['ruleset_id'] = ruleset_id
         
-        query = f"""
-            UPDATE RULESETS
-            SET {', '.join(update_fields)}
-            WHERE id = :ruleset_id
+        return UPDATE_RULESET_QUERY, params
+    
+    def _inserted_ruleset(self, ruleset_data: RulesetCreate, returned: Dict[str, Any]) -> RulesetResponse:
         """
+        Build the response for a ruleset from its creation data and returned values.
         
-        self.db.execute_update(query, params)
+        Args:
+            ruleset_data: Ruleset creation data
+            returned: Values returned by the INSERT (see RULESET_RETURNING)
+            
+        Returns:
+            Ruleset response
+        """
+        if returned['new_id'] is None:
+            raise Exception("Failed to get generated ruleset ID")
         
-        return self.get_ruleset(ruleset_id)
+        return RulesetResponse(
+            id=int(returned['new_id']),
+            name=ruleset_data.name,
+            description=ruleset_data.description,
+            user_groups=ruleset_data.user_groups,
+            conditions=ruleset_data.conditions,
+            author=ruleset_data.author,
+            created_at=returned['new_created_at'],
+            updated_at=returned['new_updated_at']
+        )
     
-    def delete_ruleset(self, ruleset_id: int) -> bool:
+    def _ruleset_from_result(self, ruleset_id: int, result: List[Dict[str, Any]]) -> RulesetResponse:
         """
-        Delete a ruleset.
+        Convert the result of GET_RULESET_QUERY into a ruleset response.
+        
+        Args:
+            ruleset_id: Ruleset ID
+            result: Rows returned by GET_RULESET_QUERY
+            
+        Returns:
+            Ruleset response
+            
+        Raises:
+            Exception: If ruleset not found
+        """
+        if not result:
+            self.cache.invalidate(ruleset_id)
+            raise Exception(f"Ruleset with ID {ruleset_id} not found")
+        
+        return self._cached_row_to_ruleset(result[0])
+    
+    def _add_fetched_rulesets(self, rulesets: Dict[int, RulesetResponse], rows: List[Dict[str, Any]]) -> None:
+        """
+        Convert fetched RULESETS rows and add them to a dictionary by ID.
+        
+        Args:
+            rulesets: Dictionary of ruleset ID to ruleset to extend
+            rows: Rows returned by the query built by _build_rulesets_by_ids_query
+        """
+        for row in rows:
+            ruleset = self._cached_row_to_ruleset(row)
+            rulesets[ruleset.id] = ruleset
+    
+    def _ruleset_deleted(self, ruleset_id: int, affected_rows: int) -> bool:
+        """
+        Finish a ruleset deletion once DELETE_RULESET_QUERY has run.
         
         Args:
             ruleset_id: Ruleset ID
+            affected_rows: Rows deleted by DELETE_RULESET_QUERY
             
         Returns:
             True if deleted successfully
             
         Raises:
-            Exception: If ruleset not found or deletion fails
+            Exception: If ruleset not found
+        """
+        self.cache.invalidate(ruleset_id)
+        
+        if affected_rows == 0:
+            raise Exception(f"Ruleset with ID {ruleset_id} not found")
+        
+        return True
+    
+    def _cached_row_to_ruleset(self, row: Dict[str, Any]) -> RulesetResponse:
         """
+        Convert a RULESETS row, reusing the cached ruleset if its version matches.
+        
+        Args:
+            row: Row dictionary keyed by upper-case column name
+            
+        Returns:
+            Ruleset response
+        """
+        cached = self.cache.get_version(row['ID'], row['UPDATED_AT'])
+        if cached is not None:
+            return cached
+        
+        ruleset = self._row_to_ruleset(row)
+        self.cache.put(ruleset)
+        return ruleset
+    
+    def _row_to_ruleset(self, row: Dict[str, Any]) -> RulesetResponse:
+        """
+        Convert a RULESETS row into a ruleset response.
+        
+        Args:
+            row: Row dictionary keyed by upper-case column name
+            
+        Returns:
+            Ruleset response
+        """
+        # JSON columns are fetched natively as Python lists (or None)
+        user_groups = row['USER_GROUPS'] or []
+        conditions = [Condition(**condition) for condition in row['CONDITIONS'] or []]
+        
+        return RulesetResponse(
+            id=row['ID'],
+            name=row['NAME'],
+            description=row['DESCRIPTION'],
+            user_groups=user_groups,
+            conditions=conditions,
+            author=row['AUTHOR'],
+            created_at=row['CREATED_AT'],
+            updated_at=row['UPDATED_AT']
+        )
+
+
+class AsyncRulesetService(RulesetService):
+    """
+    Asyncio counterpart of RulesetService.
+    
+    Shares query building and row conversion with RulesetService, but awaits
+    every database call on an AsyncDatabase so the event loop stays free.
+    """
+    
+    def __init__(self, db: AsyncDatabase, cache: Optional[RulesetCache] = None):
+        """
+        Initialize the async ruleset service.
+        
+        Args:
+            db: Async database connection instance
+            cache: Ruleset cache (default: the process-wide cache)
+        """
+        self.db = db
+        self.cache = cache if cache is not None else get_ruleset_cache()
+    
+    async def create_ruleset(self, ruleset_data: RulesetCreate) -> RulesetResponse:
+        """Create a new ruleset (see RulesetService.create_ruleset)."""
+        query, params = self._build_insert_query(ruleset_data)
+        returned = await self.db.execute_returning(
+            query, params, RULESET_RETURNING, input_sizes=self._json_input_sizes(params)
+        )
+        ruleset = self._inserted_ruleset(ruleset_data, returned)
+        self.cache.put(ruleset)
+        
+        return ruleset
+    
+    async def get_ruleset(self, ruleset_id: int) -> RulesetResponse:
+        """Get a ruleset by ID (see RulesetService.get_ruleset)."""
+        cached = self.cache.get(ruleset_id)
+        if cached is not None:
+            return cached
+        
+        result = await self.db.execute_query(GET_RULESET_QUERY, {'ruleset_id': ruleset_id})
+        
+        return self._ruleset_from_result(ruleset_id, result)
+    
+    async def get_rulesets_by_ids(self, ruleset_ids: List[int]) -> Dict[int, RulesetResponse]:
+        """Get the rulesets that exist among a list of IDs (see RulesetService.get_rulesets_by_ids)."""
+        rulesets, uncached_ids = self.get_cached_rulesets(ruleset_ids)
+        
+        if uncached_ids:
+            query, params = self._build_rulesets_by_ids_query(uncached_ids)
+            self._add_fetched_rulesets(rulesets, await self.db.execute_query(query, params))
+        
+        return rulesets
+    
+    async def get_rulesets(self, page: int = 1, per_page: int = 10, author: Optional[str] = None,
+                          keyset: bool = False, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Get a list of rulesets with pagination (see RulesetService.get_rulesets)."""
+        query, params = self._build_rulesets_query(page, per_page, author, keyset, cursor)
+        results = await self.db.execute_query(query, params)
+        result = self._rulesets_page(results, page, per_page, keyset)
+        
+        count = self._missing_total_query(result, author, keyset)
+        if count is not None:
+            result['total'] = count_total(await self.db.execute_query(*count))
+        
+        return result
+    
+    async def update_ruleset(self, ruleset_id: int, ruleset_data: RulesetUpdate) -> RulesetResponse:
+        """Update an existing ruleset (see RulesetService.update_ruleset)."""
         # Check if ruleset exists
-        self.get_ruleset(ruleset_id)
+        await self.get_ruleset(ruleset_id)
         
-        query = "DELETE FROM RULESETS WHERE id = :ruleset_id"
-        affected_rows = self.db.execute_update(query, {'ruleset_id': ruleset_id})
+        update = self._build_update_query(ruleset_id, ruleset_data)
+        if update is None:
+            return await self.get_ruleset(ruleset_id)
         
-        return affected_rows > 0
+        query, params = update
+        await self.db.execute_update(query, params, input_sizes=self._json_input_sizes(params))
+        self.cache.invalidate(ruleset_id)
+        
+        return await self.get_ruleset(ruleset_id)
     
+    async def delete_ruleset(self, ruleset_id: int) -> bool:
+        """Delete a ruleset (see RulesetService.delete_ruleset)."""
+        affected_rows = await self.db.execute_update(DELETE_RULESET_QUERY, {'ruleset_id': ruleset_id})
+        
+        return self._ruleset_deleted(ruleset_id, affected_rows)
@@ -0,0 +1,316 @@
+"""
+Conversion between GeoJSON geometries and Oracle SDO_GEOMETRY objects.
+
+Geometries are bound to statements as MDSYS.SDO_GEOMETRY database objects
+rather than pasted into the SQL text, so statements that write geometries
+stay textually constant and can be reused from the statement cache and
+executed with executemany.
+
+Fetched geometries are decoded by slicing the SDO_ORDINATES list at the
+offsets listed in SDO_ELEM_INFO and pairing ordinates with zip and map,
+so no Python-level loop body runs per vertex. One [x, y] list is still
+built per vertex, since that is the GeoJSON the responses carry.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..models import GeometryBase
+
+
+SDO_GEOMETRY_TYPE_NAME = "MDSYS.SDO_GEOMETRY"
+
+# WGS 84, the SRID registered for every geometry column in db/init.sql
+DEFAULT_SRID = 4326
+
+# SDO_GTYPE values for two-dimensional geometries
+GTYPE_POINT = 2001
+GTYPE_LINESTRING = 2002
+GTYPE_POLYGON = 2003
+GTYPE_MULTIPOINT = 2005
+GTYPE_MULTILINESTRING = 2006
+GTYPE_MULTIPOLYGON = 2007
+
+# SDO_ETYPE values (SDO_INTERPRETATION is always 1: straight line segments)
+ETYPE_POINT = 1
+ETYPE_LINE = 2
+ETYPE_EXTERIOR_RING = 1003
+ETYPE_INTERIOR_RING = 2003
+
+# SDO_INTERPRETATION of a polygon ring stored as its two corners
+INTERPRETATION_RECTANGLE = 3
+
+
+def _ring_area(ring: List[List[float]]) -> float:
+    """
+    Compute the signed area of a ring (positive when counterclockwise).
+
+    Args:
+        ring: Closed list of [x, y] or [x, y, z] positions (z is ignored)
+
+    Returns:
+        Signed area
+    """
+    area = 0.0
+    for start, end in zip(ring, ring[1:]):
+        (x1, y1), (x2, y2) = start[:2], end[:2]
+        area += x1 * y2 - x2 * y1
+    return area / 2.0
+
+
+def _orient_ring(ring: List[List[float]], counterclockwise: bool) -> List[List[float]]:
+    """
+    Return the ring with the requested orientation.
+
+    Oracle requires exterior rings to be counterclockwise and interior rings
+    clockwise; GeoJSON only recommends it.
+
+    Args:
+        ring: Closed list of [x, y] positions
+        counterclockwise: Whether the ring must be counterclockwise
+
+    Returns:
+        The ring, reversed if needed
+    """
+    if (_ring_area(ring) > 0) != counterclockwise:
+        return list(reversed(ring))
+    return ring
+
+
+def _flatten(positions: List[List[float]]) -> List[float]:
+    """Flatten [x, y] positions into an ordinate list."""
+    return [float(ordinate) for position in positions for ordinate in position[:2]]
+
+
+def _polygon_elements(rings: List[List[List[float]]], elem_info: List[int], ordinates: List[float]) -> None:
+    """
+    Append the elements of one polygon (exterior ring then holes).
+
+    Args:
+        rings: GeoJSON polygon rings
+        elem_info: SDO_ELEM_INFO triplets being built
+        ordinates: SDO_ORDINATES being built
+    """
+    for index, ring in enumerate(rings):
+        exterior = index == 0
+        elem_info.extend([
+            len(ordinates) + 1,
+            ETYPE_EXTERIOR_RING if exterior else ETYPE_INTERIOR_RING,
+            1
+        ])
+        ordinates.extend(_flatten(_orient_ring(ring, counterclockwise=exterior)))
+
+
+def geojson_to_sdo_parts(
+    geometry_type: str,
+    coordinates: List[Any]
+) -> Tuple[int, Optional[Tuple[float, float]], Optional[List[int]], Optional[List[float]]]:
+    """
+    Compute the SDO_GEOMETRY attributes for a GeoJSON geometry.
+
+    Args:
+        geometry_type: GeoJSON geometry type
+        coordinates: GeoJSON coordinates
+
+    Returns:
+        Tuple of (SDO_GTYPE, SDO_POINT (x, y) or None, SDO_ELEM_INFO or None,
+        SDO_ORDINATES or None)
+
+    Raises:
+        ValueError: If the geometry type is not supported
+    """
+    if geometry_type == 'Point':
+        return GTYPE_POINT, (float(coordinates[0]), float(coordinates[1])), None, None
+
+    elem_info: List[int] = []
+    ordinates: List[float] = []
+
+    if geometry_type == 'LineString':
+        gtype = GTYPE_LINESTRING
+        elem_info.extend([1, ETYPE_LINE, 1])
+        ordinates.extend(_flatten(coordinates))
+    elif geometry_type == 'Polygon':
+        gtype = GTYPE_POLYGON
+        _polygon_elements(coordinates, elem_info, ordinates)
+    elif geometry_type == 'MultiPoint':
+        gtype = GTYPE_MULTIPOINT
+        elem_info.extend([1, ETYPE_POINT, len(coordinates)])
+        ordinates.extend(_flatten(coordinates))
+    elif geometry_type == 'MultiLineString':
+        gtype = GTYPE_MULTILINESTRING
+        for line in coordinates:
+            elem_info.extend([len(ordinates) + 1, ETYPE_LINE, 1])
+            ordinates.extend(_flatten(line))
+    elif geometry_type == 'MultiPolygon':
+        gtype = GTYPE_MULTIPOLYGON
+        for polygon in coordinates:
+            _polygon_elements(polygon, elem_info, ordinates)
+    else:
+        raise ValueError(f"Unsupported geometry type: {geometry_type}")
+
+    return gtype, None, elem_info, ordinates
+
+
+class SdoGeometryConverter:
+    """
+    Builds MDSYS.SDO_GEOMETRY database objects from GeoJSON geometries.
+
+    The nested SDO_POINT_TYPE, SDO_ELEM_INFO_ARRAY and SDO_ORDINATE_ARRAY
+    types are read from the attributes of the SDO_GEOMETRY type, so a single
+    gettype() call per connection is enough.
+    """
+
+    def __init__(self, geometry_type):
+        """
+        Initialize the converter.
+
+        Args:
+            geometry_type: oracledb DbObjectType for MDSYS.SDO_GEOMETRY
+        """
+        self.geometry_type = geometry_type
+        attribute_types = {attr.name: attr.type for attr in geometry_type.attributes}
+        self.point_type = attribute_types['SDO_POINT']
+        self.elem_info_type = attribute_types['SDO_ELEM_INFO']
+        self.ordinate_type = attribute_types['SDO_ORDINATES']
+
+    def to_sdo(self, geometry: Union[GeometryBase, Dict[str, Any]], srid: int = DEFAULT_SRID):
+        """
+        Convert a GeoJSON geometry to an SDO_GEOMETRY object for binding.
+
+        Args:
+            geometry: GeoJSON geometry model or dictionary
+            srid: Spatial reference ID (default: 4326)
+
+        Returns:
+            oracledb DbObject of type MDSYS.SDO_GEOMETRY
+
+        Raises:
+            ValueError: If the geometry type is not supported
+        """
+        if isinstance(geometry, GeometryBase):
+            geometry_type, coordinates = geometry.type, geometry.coordinates
+        else:
+            geometry_type, coordinates = geometry['type'], geometry['coordinates']
+
+        gtype, point, elem_info, ordinates = geojson_to_sdo_parts(geometry_type, coordinates)
+
+        sdo = self.geometry_type.newobject()
+        sdo.SDO_GTYPE = gtype
+        sdo.SDO_SRID = srid
+
+        if point is not None:
+            sdo_point = self.point_type.newobject()
+            sdo_point.X, sdo_point.Y = point
+            sdo.SDO_POINT = sdo_point
+        else:
+            sdo.SDO_ELEM_INFO = self.elem_info_type.newobject(elem_info)
+            sdo.SDO_ORDINATES = self.ordinate_type.newobject(ordinates)
+
+        return sdo
+
+
+def _positions(ordinates: List[float], dims: int) -> List[List[float]]:
+    """Group a flat ordinate list into positions (one list per vertex) of the given dimension."""
+    return list(map(list, zip(*(ordinates[d::dims] for d in range(dims)))))
+
+
+def _rectangle_ring(corners: List[List[float]], counterclockwise: bool) -> List[List[float]]:
+    """
+    Expand an optimized rectangle (lower-left, upper-right) into a closed ring.
+
+    Args:
+        corners: The two corner positions
+        counterclockwise: Whether the ring must be counterclockwise
+
+    Returns:
+        Closed ring of five [x, y] positions
+    """
+    (x1, y1), (x2, y2) = corners[0][:2], corners[1][:2]
+    ring = [[x1, y1], [x2, y1], [x2, y2], [x1, y2], [x1, y1]]
+    return ring if counterclockwise else ring[::-1]
+
+
+def sdo_parts_to_geojson(
+    gtype: int,
+    point: Optional[Tuple[float, float]],
+    elem_info: Optional[List[int]],
+    ordinates: Optional[List[float]]
+) -> Dict[str, Any]:
+    """
+    Build a GeoJSON geometry from SDO_GEOMETRY attributes.
+
+    Args:
+        gtype: SDO_GTYPE
+        point: SDO_POINT (x, y), or None
+        elem_info: SDO_ELEM_INFO, or None
+        ordinates: SDO_ORDINATES, or None
+
+    Returns:
+        GeoJSON geometry dictionary
+
+    Raises:
+        ValueError: If the geometry or one of its elements is not supported
+    """
+    dims = gtype // 1000 or 2
+    kind = gtype % 100
+
+    if kind == GTYPE_POINT % 100 and point is not None:
+        return {'type': 'Point', 'coordinates': [point[0], point[1]]}
+
+    if not elem_info or ordinates is None:
+        raise ValueError(f"SDO_GEOMETRY with SDO_GTYPE {gtype} has no elements")
+
+    triplets = list(zip(elem_info[0::3], elem_info[1::3], elem_info[2::3]))
+    bounds = [offset - 1 for offset, _, _ in triplets] + [len(ordinates)]
+    elements = [_positions(ordinates[start:end], dims) for start, end in zip(bounds, bounds[1:])]
+
+    if kind == GTYPE_POINT % 100:
+        return {'type': 'Point', 'coordinates': elements[0][0]}
+    if kind == GTYPE_LINESTRING % 100:
+        return {'type': 'LineString', 'coordinates': elements[0]}
+    if kind == GTYPE_MULTIPOINT % 100:
+        return {'type': 'MultiPoint', 'coordinates': _positions(ordinates, dims)}
+    if kind == GTYPE_MULTILINESTRING % 100:
+        return {'type': 'MultiLineString', 'coordinates': elements}
+
+    if kind not in (GTYPE_POLYGON % 100, GTYPE_MULTIPOLYGON % 100):
+        raise ValueError(f"Unsupported SDO_GTYPE: {gtype}")
+
+    polygons: List[List[Any]] = []
+    for (_, etype, interpretation), ring in zip(triplets, elements):
+        exterior = etype == ETYPE_EXTERIOR_RING
+        if etype not in (ETYPE_EXTERIOR_RING, ETYPE_INTERIOR_RING):
+            raise ValueError(f"Unsupported SDO_ETYPE: {etype}")
+        if interpretation == INTERPRETATION_RECTANGLE:
+            ring = _rectangle_ring(ring, counterclockwise=exterior)
+        elif interpretation != 1:
+            raise ValueError(f"Unsupported SDO_INTERPRETATION: {interpretation}")
+        if exterior or not polygons:
+            polygons.append([])
+        polygons[-1].append(ring)
+
+    if kind == GTYPE_POLYGON % 100:
+        return {'type': 'Polygon', 'coordinates': polygons[0]}
+    return {'type': 'MultiPolygon', 'coordinates': polygons}
+
+
+def sdo_to_geojson(sdo) -> Dict[str, Any]:
+    """
+    Decode a fetched SDO_GEOMETRY object into a GeoJSON geometry.
+
+    Args:
+        sdo: oracledb DbObject of type MDSYS.SDO_GEOMETRY
+
+    Returns:
+        GeoJSON geometry dictionary
+
+    Raises:
+        ValueError: If the geometry is not supported
+    """
+    point = None
+    if sdo.SDO_POINT is not None and sdo.SDO_POINT.X is not None:
+        point = (sdo.SDO_POINT.X, sdo.SDO_POINT.Y)
+
+    elem_info = sdo.SDO_ELEM_INFO.aslist() if sdo.SDO_ELEM_INFO is not None else None
+    ordinates = sdo.SDO_ORDINATES.aslist() if sdo.SDO_ORDINATES is not None else None
+
+    return sdo_parts_to_geojson(int(sdo.SDO_GTYPE), point, elem_info, ordinates)
@@ -6,9 +6,63 @@ including image existence, ruleset validation, and other checks.
 """
 
 import os
-import json
-from typing import List, Dict, Any
-from ..database import Database
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple, Optional
+from ..database import Database, AsyncDatabase
+from ..models import RulesetResponse, ReportCreate, GeometryBase
+from .ruleset_service import RulesetService, AsyncRulesetService, RULESET_COLUMNS
+from .sdo_geometry import SDO_GEOMETRY_TYPE_NAME, SdoGeometryConverter
+from .lookup_cache import TTLCache
+from .query_builder import in_list_condition
+from .model_registry import get_model_registry
+
+logger = logging.getLogger(__name__)
+
+
+# Tolerance registered for every geometry column in db/init.sql
+GEOMETRY_TOLERANCE = 0.005
+
+# Runs the object storage check while the database check runs
+_validation_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv('VALIDATION_WORKERS', '8')),
+    thread_name_prefix='validation'
+)
+
+# Only positive image lookups are cached, so a newly uploaded image is
+# found immediately
+_image_exists_cache = TTLCache(float(os.getenv('IMAGE_EXISTS_CACHE_TTL', '300')))
+
+_object_storage = None
+_object_storage_lock = threading.Lock()
+
+
+def _get_object_storage():
+    """Get the shared object storage client, creating it on first use."""
+    global _object_storage
+    
+    if _object_storage is None:
+        with _object_storage_lock:
+            if _object_storage is None:
+                from .object_storage_service import ObjectStorageService
+                _object_storage = ObjectStorageService()
+    
+    return _object_storage
+
+
+def get_lookup_cache_stats() -> Dict[str, Any]:
+    """
+    Get the statistics of the image existence cache and the model registry.
+    
+    Returns:
+        Dictionary of cache name to statistics
+    """
+    return {
+        "image_exists": _image_exists_cache.get_stats(),
+        "model_registry": get_model_registry().get_stats()
+    }
 
 
 class ValidationService:
@@ -33,21 +87,22 @@ class ValidationService:
         Returns:
             True if image exists, False otherwise
         """
+        found, _ = _image_exists_cache.get(image_name)
+        if found:
+            return True
+        
         try:
-            from .object_storage_service import ObjectStorageService
-            
-            # Initialize object storage service
-            object_storage = ObjectStorageService()
-            
             # Check if image exists in bucket with data/ prefix
             object_name = f"data/{image_name}"
-            return object_storage.object_exists(object_name)
+            exists = _get_object_storage().object_exists(object_name)
+            
+            if exists:
+                _image_exists_cache.put(image_name, True)
+            return exists
             
         except Exception as e:
             # Log the error but don't raise it to avoid breaking the flow
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Error validating image existence for '{image_name}': {e}")
+            logger.error("Error validating image existence for '%s': %s", image_name, e)
             return False
     
     def validate_rulesets_exist(self, ruleset_ids: List[int]) -> Dict[str, Any]:
@@ -61,57 +116,236 @@ class ValidationService:
             Dictionary with validation results and existing rulesets
         """
         if not ruleset_ids:
-            return {
-                "valid": False,
-                "existing_rulesets": [],
-                "missing_rulesets": [],
-                "ruleset_details": {},
-                "error": "No ruleset IDs provided"
-            }
+            return self._empty_ruleset_validation()
         
-        # Create placeholders for the IN clause
-        placeholders = ','.join([f':id_{i}' for i in range(len(ruleset_ids))])
-        query = f"""
-            SELECT id, name, description, author, created_at
-            FROM RULESETS
-            WHERE id IN ({placeholders})
+        try:
+            # Served from the ruleset cache where possible
+            rulesets = RulesetService(self.db).get_rulesets_by_ids(ruleset_ids)
+            return self._summarize_ruleset_validation(ruleset_ids, rulesets)
+            
+        except Exception as e:
+            return self._failed_ruleset_validation(ruleset_ids, e)
+    
+    def validate_database_state(self, ruleset_ids: List[int],
+                                area_of_interest: Optional[GeometryBase] = None) -> Tuple[Dict[str, Any], bool]:
+        """
+        Validate the rulesets and the area of interest in at most one round trip.
+        
+        Cached rulesets are not read again; the remaining ones are fetched by
+        the same statement that validates the geometry with
+        SDO_GEOM.VALIDATE_GEOMETRY_WITH_CONTEXT. No statement runs when every
+        ruleset is cached and there is no geometry.
+        
+        Args:
+            ruleset_ids: List of ruleset IDs to validate
+            area_of_interest: Area of interest geometry (optional)
+            
+        Returns:
+            Tuple of (ruleset validation as returned by validate_rulesets_exist,
+            whether the geometry is valid)
         """
+        if not ruleset_ids:
+            return self._empty_ruleset_validation(), True
         
-        # Create parameters dictionary
-        params = {f'id_{i}': ruleset_id for i, ruleset_id in enumerate(ruleset_ids)}
+        ruleset_service = RulesetService(self.db)
+        rulesets, uncached_ids = ruleset_service.get_cached_rulesets(ruleset_ids)
         
+        geometry_valid = True
         try:
-            results = self.db.execute_query(query, params)
-            existing_ids = [row['ID'] for row in results]
-            missing_ids = [rid for rid in ruleset_ids if rid not in existing_ids]
-            
-            # Create ruleset details dictionary
-            ruleset_details = {
-                row['ID']: {
-                    'id': row['ID'],
-                    'name': row['NAME'],
-                    'description': row['DESCRIPTION'],
-                    'author': row['AUTHOR'],
-                    'created_at': row['CREATED_AT']
-                }
-                for row in results
-            }
+            geometry_type = self.db.get_type(SDO_GEOMETRY_TYPE_NAME) if area_of_interest else None
+            geometry_sdo = self._area_of_interest_sdo(area_of_interest, geometry_type)
             
-            return {
-                "valid": len(missing_ids) == 0,
-                "existing_rulesets": existing_ids,
-                "missing_rulesets": missing_ids,
-                "ruleset_details": ruleset_details
-            }
+            if uncached_ids or geometry_sdo is not None:
+                query, params = self._build_database_checks_query(uncached_ids, geometry_sdo)
+                rows = self.db.execute_query(query, params)
+                geometry_valid = self._apply_database_checks(ruleset_service, rows, rulesets, geometry_sdo)
             
         except Exception as e:
-            return {
-                "valid": False,
-                "existing_rulesets": [],
-                "missing_rulesets": ruleset_ids,
-                "ruleset_details": {},
-                "error": f"Database error: {str(e)}"
+            return self._failed_database_state(ruleset_ids, rulesets, e)
+        
+        return self._summarize_ruleset_validation(ruleset_ids, rulesets), geometry_valid
+    
+    def validate_report_creation(self, report_data: ReportCreate) -> Dict[str, Any]:
+        """
+        Run every report creation check, concurrently where they do I/O.
+        
+        The object storage lookup runs on a worker thread while the database
+        check runs on this thread, so the total time is bounded by the slowest
+        check rather than their sum. Model lookups hit the model registry.
+        
+        Args:
+            report_data: Report creation data
+            
+        Returns:
+            Dictionary with image_exists, ruleset_validation, model_exists,
+            author_exists and geometry_valid
+        """
+        image_future = _validation_executor.submit(self.validate_image_exists, report_data.image_name)
+        
+        ruleset_validation, geometry_valid = self.validate_database_state(
+            report_data.ruleset_ids, report_data.area_of_interest
+        )
+        
+        return {
+            "image_exists": image_future.result(),
+            "ruleset_validation": ruleset_validation,
+            "model_exists": self.validate_model_exists(report_data.model_id),
+            "author_exists": self.validate_author_exists(report_data.author_id),
+            "geometry_valid": geometry_valid
+        }
+    
+    def _area_of_interest_sdo(self, area_of_interest: Optional[GeometryBase], geometry_type) -> Optional[Any]:
+        """
+        Convert the area of interest to validate into an SDO_GEOMETRY object.
+        
+        Args:
+            area_of_interest: Area of interest geometry (optional)
+            geometry_type: SDO_GEOMETRY type object (needed only with an area of interest)
+            
+        Returns:
+            SDO_GEOMETRY object, or None if there is no area of interest
+            
+        Raises:
+            ValueError: If the geometry cannot be converted
+        """
+        if not area_of_interest:
+            return None
+        return SdoGeometryConverter(geometry_type).to_sdo(area_of_interest)
+    
+    def _build_database_checks_query(self, ruleset_ids: List[int],
+                                     geometry_sdo: Optional[Any]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build the statement that fetches rulesets and validates a geometry.
+        
+        The single-row validation subquery is outer joined to the requested
+        rulesets, so the statement returns one row per existing ruleset, or
+        one row without ruleset columns if none exists.
+        
+        Args:
+            ruleset_ids: Ruleset IDs to fetch (may be empty)
+            geometry_sdo: SDO_GEOMETRY object to validate, or None
+            
+        Returns:
+            Tuple of (query, params)
+        """
+        join_condition, params = in_list_condition('r.id', ruleset_ids, 'id')
+        
+        if geometry_sdo is not None:
+            validation = f"SDO_GEOM.VALIDATE_GEOMETRY_WITH_CONTEXT(:area_of_interest, {GEOMETRY_TOLERANCE})"
+            params['area_of_interest'] = geometry_sdo
+        else:
+            validation = "CAST(NULL AS VARCHAR2(4000))"
+        
+        ruleset_columns = ", ".join(f"r.{column.strip()}" for column in RULESET_COLUMNS.split(","))
+        query = f"""
+            SELECT checks.geometry_validation, {ruleset_columns}
+            FROM (SELECT {validation} AS geometry_validation FROM DUAL) checks
+            LEFT JOIN RULESETS r ON {join_condition}
+        """
+        
+        return query, params
+    
+    def _apply_database_checks(self, ruleset_service: RulesetService, rows: List[Dict[str, Any]],
+                               rulesets: Dict[int, RulesetResponse], geometry_sdo: Optional[Any]) -> bool:
+        """
+        Collect the rulesets returned by the database checks statement.
+        
+        Args:
+            ruleset_service: Ruleset service whose cache receives the rulesets
+            rows: Rows of the database checks statement
+            rulesets: Rulesets found so far, updated in place
+            geometry_sdo: Geometry that was validated, or None
+            
+        Returns:
+            True if the geometry is valid (or there was none)
+        """
+        for row in rows:
+            if row['ID'] is not None:
+                ruleset = ruleset_service._cached_row_to_ruleset(row)
+                rulesets[ruleset.id] = ruleset
+        
+        if geometry_sdo is None:
+            return True
+        
+        validation = rows[0]['GEOMETRY_VALIDATION'] if rows else None
+        if validation != 'TRUE':
+            logger.warning("Area of interest failed geometry validation: %s", validation)
+            return False
+        return True
+    
+    def _failed_database_state(self, ruleset_ids: List[int], rulesets: Dict[int, RulesetResponse],
+                               error: Exception) -> Tuple[Dict[str, Any], bool]:
+        """
+        Build the validate_database_state result when a check raised.
+        
+        A ValueError comes from converting the area of interest, which is then
+        invalid; any other error fails the ruleset lookup.
+        
+        Args:
+            ruleset_ids: List of ruleset IDs that were requested
+            rulesets: Rulesets found before the error
+            error: Error raised by the checks
+            
+        Returns:
+            Tuple of (ruleset validation, whether the geometry is valid)
+        """
+        if isinstance(error, ValueError):
+            logger.warning("Invalid area of interest geometry: %s", error)
+            return self._summarize_ruleset_validation(ruleset_ids, rulesets), False
+        return self._failed_ruleset_validation(ruleset_ids, error), True
+    
+    def _summarize_ruleset_validation(self, ruleset_ids: List[int], rulesets: Dict[int, RulesetResponse]) -> Dict[str, Any]:
+        """
+        Build the ruleset validation result from the rulesets that were found.
+        
+        Args:
+            ruleset_ids: List of ruleset IDs that were requested
+            rulesets: Existing rulesets keyed by ID
+            
+        Returns:
+            Dictionary with validation results and existing rulesets
+        """
+        existing_ids = [rid for rid in ruleset_ids if rid in rulesets]
+        missing_ids = [rid for rid in ruleset_ids if rid not in rulesets]
+        
+        # Create ruleset details dictionary
+        ruleset_details = {
+            ruleset.id: {
+                'id': ruleset.id,
+                'name': ruleset.name,
+                'description': ruleset.description,
+                'author': ruleset.author,
+                'created_at': ruleset.created_at
             }
+            for ruleset in rulesets.values()
+        }
+        
+        return {
+            "valid": len(missing_ids) == 0,
+            "existing_rulesets": existing_ids,
+            "missing_rulesets": missing_ids,
+            "ruleset_details": ruleset_details
+        }
+    
+    def _empty_ruleset_validation(self) -> Dict[str, Any]:
+        """Validation result for an empty list of ruleset IDs."""
+        return {
+            "valid": False,
+            "existing_rulesets": [],
+            "missing_rulesets": [],
+            "ruleset_details": {},
+            "error": "No ruleset IDs provided"
+        }
+    
+    def _failed_ruleset_validation(self, ruleset_ids: List[int], error: Exception) -> Dict[str, Any]:
+        """Validation result when the ruleset lookup query fails."""
+        return {
+            "valid": False,
+            "existing_rulesets": [],
+            "missing_rulesets": ruleset_ids,
+            "ruleset_details": {},
+            "error": f"Database error: {str(error)}"
+        }
     
     def validate_model_exists(self, model_id: str) -> bool:
         """
@@ -123,37 +357,8 @@ class ValidationService:
         Returns:
             True if model exists and is available, False otherwise
         """
-        try:
-            # Get the models directory path
-            models_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'models')
-            
-            if not os.path.exists(models_dir):
-                return False
-            
-            # Check each model subdirectory for metadata.json
-            for model_folder in os.listdir(models_dir):
-                model_path = os.path.join(models_dir, model_folder)
-                if os.path.isdir(model_path):
-                    metadata_file = os.path.join(model_path, 'metadata.json')
-                    if os.path.exists(metadata_file):
-                        try:
-                            with open(metadata_file, 'r') as f:
-                                metadata = json.load(f)
-                                # Check if the model_id matches either the 'id' or 'name' field
-                                if (str(metadata.get('id')) == str(model_id) or 
-                                    metadata.get('name', '').lower() == model_id.lower()):
-                                    # Also check if the model file exists
-                                    model_file = os.path.join(model_path, 'file.pt')
-                                    return os.path.exists(model_file)
-                        except (json.JSONDecodeError, KeyError):
-                            continue
-            
-            return False
-            
-        except Exception as e:
-            # Log the error but don't raise it
-            print(f"Error validating model {model_id}: {str(e)}")
-            return False
+        model = get_model_registry().find(model_id)
+        return model is not None and model['has_checkpoint']
     
     def validate_author_exists(self, author_id: str) -> bool:
         """
@@ -206,45 +411,118 @@ class ValidationService:
             - has_checkpoint: Whether checkpoint file exists
             - checkpoint_size_mb: Size of checkpoint file in MB
         """
+        return get_model_registry().list_models()
+
+
+class AsyncValidationService(ValidationService):
+    """
+    Asyncio counterpart of ValidationService.
+    
+    Database lookups are awaited on an AsyncDatabase; object storage requests
+    are blocking, so they run in a worker thread. Model lookups are answered
+    by the in-memory model registry.
+    """
+    
+    def __init__(self, db: AsyncDatabase = None):
+        """
+        Initialize the async validation service.
+        
+        Args:
+            db: Async database connection instance (optional for model operations)
+        """
+        self.db = db
+    
+    async def validate_image_exists(self, image_name: str) -> bool:
+        """
+        Validate that the image exists in the object storage bucket.
+        
+        Args:
+            image_name: Name of the image file
+            
+        Returns:
+            True if image exists, False otherwise
+        """
+        return await asyncio.to_thread(super().validate_image_exists, image_name)
+    
+    async def validate_rulesets_exist(self, ruleset_ids: List[int]) -> Dict[str, Any]:
+        """Validate that all ruleset IDs exist (see ValidationService.validate_rulesets_exist)."""
+        if not ruleset_ids:
+            return self._empty_ruleset_validation()
+        
+        try:
+            # Served from the ruleset cache where possible
+            rulesets = await AsyncRulesetService(self.db).get_rulesets_by_ids(ruleset_ids)
+            return self._summarize_ruleset_validation(ruleset_ids, rulesets)
+            
+        except Exception as e:
+            return self._failed_ruleset_validation(ruleset_ids, e)
+    
+    async def validate_database_state(self, ruleset_ids: List[int],
+                                      area_of_interest: Optional[GeometryBase] = None) -> Tuple[Dict[str, Any], bool]:
+        """Validate the rulesets and the area of interest (see ValidationService.validate_database_state)."""
+        if not ruleset_ids:
+            return self._empty_ruleset_validation(), True
+        
+        ruleset_service = AsyncRulesetService(self.db)
+        rulesets, uncached_ids = ruleset_service.get_cached_rulesets(ruleset_ids)
+        
+        geometry_valid = True
         try:
-            models = []
-            models_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'models')
-            
-            if not os.path.exists(models_dir):
-                return models
-            
-            for model_folder in sorted(os.listdir(models_dir)):
-                model_path = os.path.join(models_dir, model_folder)
-                if os.path.isdir(model_path):
-                    metadata_file = os.path.join(model_path, 'metadata.json')
-                    checkpoint_file = os.path.join(model_path, 'file.pt')
-                    
-                    if os.path.exists(metadata_file):
-                        try:
-                            with open(metadata_file, 'r') as f:
-                                metadata = json.load(f)
-                                
-                                # Add additional info
-                                metadata['folder'] = model_folder
-                                metadata['has_checkpoint'] = os.path.exists(checkpoint_file)
-                                
-                                if os.path.exists(checkpoint_file):
-                                    metadata['checkpoint_size_mb'] = round(
-                                        os.path.getsize(checkpoint_file) / 1024 / 1024, 2
-                                    )
-                                else:
-                                    metadata['checkpoint_size_mb'] = 0
-                                
-                                models.append(metadata)
-                        except (json.JSONDecodeError, IOError) as e:
-                            # Log error but continue with other models
-                            print(f"Error reading {metadata_file}: {e}")
-                            continue
-            
-            # Sort by ID
-            models.sort(key=lambda x: x.get('id', 0))
-            return models
+            geometry_type = await self.db.get_type(SDO_GEOMETRY_TYPE_NAME) if area_of_interest else None
+            geometry_sdo = self._area_of_interest_sdo(area_of_interest, geometry_type)
+            
+            if uncached_ids or geometry_sdo is not None:
+                query, params = self._build_database_checks_query(uncached_ids, geometry_sdo)
+                rows = await self.db.execute_query(query, params)
+                geometry_valid = self._apply_database_checks(ruleset_service, rows, rulesets, geometry_sdo)
             
         except Exception as e:
-            print(f"Error getting available models: {str(e)}")
-            return []
+            return self._failed_database_state(ruleset_ids, rulesets, e)
+        
+        return self._summarize_ruleset_validation(ruleset_ids, rulesets), geometry_valid
+    
+    async def validate_report_creation(self, report_data: ReportCreate) -> Dict[str, Any]:
+        """
+        Run every report creation check concurrently.
+        
+        Args:
+            report_data: Report creation data
+            
+        Returns:
+            Dictionary with image_exists, ruleset_validation, model_exists,
+            author_exists and geometry_valid
+        """
+        image_exists, model_exists, (ruleset_validation, geometry_valid) = await asyncio.gather(
+            self.validate_image_exists(report_data.image_name),
+            self.validate_model_exists(report_data.model_id),
+            self.validate_database_state(report_data.ruleset_ids, report_data.area_of_interest)
+        )
+        
+        return {
+            "image_exists": image_exists,
+            "ruleset_validation": ruleset_validation,
+            "model_exists": model_exists,
+            "author_exists": self.validate_author_exists(report_data.author_id),
+            "geometry_valid": geometry_valid
+        }
+    
+    async def validate_model_exists(self, model_id: str) -> bool:
+        """
+        Validate that the ML model exists and is available.
+        
+        Args:
+            model_id: Identifier for the ML model
+            
+        Returns:
+            True if model exists and is available, False otherwise
+        """
+        return super().validate_model_exists(model_id)
+    
+    async def get_available_models(self) -> List[Dict[str, Any]]:
+        """
+        Get list of available ML models from the models directory with full metadata.
+        
+        Returns:
+            List of available models with their complete metadata
+        """
+        return super().get_available_models()
@@ -9,11 +9,13 @@ from typing import List, Dict, Any, Optional
 import logging
 from datetime import datetime
 
+from ..database import Database, get_pool
+from ..services.detection_writer import DetectionBulkWriter
+
 # TODO: Add proper imports for image processing and ML
 # import rasterio
 # import numpy as np
 # from celery import Celery
-# from ..database import Database
 # from ..services.notification_service import NotificationService
 
 logger = logging.getLogger(__name__)
@@ -44,7 +46,7 @@ class ReportProcessingTask:
         TODO: Implement complete async processing pipeline
         """
         try:
-            logger.info(f"Starting report processing for report_id: {report_id}")
+            logger.info("Starting report processing for report_id: %s", report_id)
             
             # Step 1: Initialize and update status
             self._initialize_processing(report_id)
@@ -56,15 +58,15 @@ class ReportProcessingTask:
             detections = self._process_image_tiles(report_id, model_id, confidence_threshold, image_metadata)
             
             # Step 4: Store detections and check rules
-            self._store_detections_and_check_rules(report_id, detections, ruleset_ids)
+            self._store_detections_and_check_rules(report_id, detections, ruleset_ids, model_id)
             
             # Step 5: Complete processing
             self._complete_processing(report_id)
             
-            logger.info(f"Report processing completed for report_id: {report_id}")
+            logger.info("Report processing completed for report_id: %s", report_id)
             
         except Exception as e:
-            logger.error(f"Error processing report {report_id}: {str(e)}")
+            logger.error("Error processing report %s: %s", report_id, e)
             self._fail_processing(report_id, str(e))
     
     def _initialize_processing(self, report_id: int):
@@ -85,7 +87,7 @@ class ReportProcessingTask:
         #         "UPDATE REPORTS SET status = 'processing', updated_at = CURRENT_TIMESTAMP WHERE id = :report_id",
         #         {'report_id': report_id}
         #     )
-        logger.info(f"Initializing processing for report_id: {report_id}")
+        logger.info("Initializing processing for report_id: %s", report_id)
     
     def _extract_image_metadata(self, report_id: int) -> Dict[str, Any]:
         """
@@ -112,7 +114,7 @@ class ReportProcessingTask:
         # 4. Convert to SDO_GEOMETRY
         # 5. Update REPORTS table with image_footprint
         
-        logger.info(f"Extracting image metadata for report_id: {report_id}")
+        logger.info("Extracting image metadata for report_id: %s", report_id)
         
         # Placeholder return
         return {
@@ -153,43 +155,39 @@ class ReportProcessingTask:
         # 5. Filter by confidence threshold
         # 6. Convert coordinates to geographic
         
-        logger.info(f"Processing image tiles for report_id: {report_id}")
+        logger.info("Processing image tiles for report_id: %s", report_id)
         
         # Placeholder return
         return []
     
     def _store_detections_and_check_rules(self, report_id: int, detections: List[Dict[str, Any]], 
-                                        ruleset_ids: List[int]):
+                                        ruleset_ids: List[int], model_id: Optional[str] = None):
         """
         Store detections in database and check against rulesets.
         
+        Detections are written in batches with DetectionBulkWriter (array DML)
+        rather than one INSERT per detection.
+        
         Args:
             report_id: ID of the report
             detections: List of detections to store
             ruleset_ids: List of ruleset IDs to check against
+            model_id: ML model identifier stored with each detection
             
-        TODO: Implement detection storage and rule checking
-        - Store each detection in DETECTIONS table
-        - For each detection, check against all rulesets
+        TODO: Implement rule checking
+        - Check the stored detections against all rulesets
         - Create notifications for matching rulesets
         - Send real-time notifications via SSE
         """
-        # TODO: Implement detection storage and rule checking
-        # 1. For each detection:
-        #    - Insert into DETECTIONS table
-        #    - Get detection footprint
-        #    - Query RULESETS for spatial intersection
-        #    - Create NOTIFICATIONS for matches
-        #    - Send SSE notification
+        logger.info("Storing %s detections for report_id: %s", len(detections), report_id)
         
-        logger.info(f"Storing {len(detections)} detections for report_id: {report_id}")
+        with Database(pool=get_pool()) as db:
+            with DetectionBulkWriter(db, report_id, model_id) as writer:
+                writer.add_many(detections)
         
-        for detection in detections:
-            # TODO: Store detection in database
-            # TODO: Check against rulesets
-            # TODO: Create notifications
-            # TODO: Send SSE notification
-            pass
+        # TODO: Check writer.detection_ids against rulesets in one spatial query
+        # TODO: Create notifications
+        # TODO: Send SSE notification
     
     def _complete_processing(self, report_id: int):
         """
@@ -209,7 +207,7 @@ class ReportProcessingTask:
         #         "UPDATE REPORTS SET status = 'completed', updated_at = CURRENT_TIMESTAMP WHERE id = :report_id",
         #         {'report_id': report_id}
         #     )
-        logger.info(f"Processing completed for report_id: {report_id}")
+        logger.info("Processing completed for report_id: %s", report_id)
     
     def _fail_processing(self, report_id: int, error_message: str):
         """
@@ -230,7 +228,7 @@ class ReportProcessingTask:
         #         "UPDATE REPORTS SET status = 'failed', updated_at = CURRENT_TIMESTAMP WHERE id = :report_id",
         #         {'report_id': report_id}
         #     )
-        logger.error(f"Processing failed for report_id: {report_id}, error: {error_message}")
+        logger.error("Processing failed for report_id: %s, error: %s", report_id, error_message)
 
 
 # TODO: Create Celery task decorator
@@ -39,6 +39,15 @@ CREATE TABLE RULESETS (
 );
 
 -- DETECTIONS: Stores every individual object found during processing.
+-- List-partitioned by report: the detection writers add a report's partition
+-- before its first detection is written (ADD_DETECTIONS_PARTITION_BLOCK in
+-- app/services/detection_writer.py), and deleting a report drops it once the
+-- report and its rows are deleted (see ReportService.delete_report).
+-- Partitions are not AUTOMATIC because Oracle only allows a global domain
+-- index on an automatic list-partitioned table, and the spatial index below
+-- must be LOCAL for partition drops and exchanges.
+-- P_INITIAL only exists because a partitioned table needs one partition;
+-- report IDs start at 1, so it stays empty and is never dropped.
 CREATE TABLE DETECTIONS (
     id INTEGER GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
     report_id INTEGER NOT NULL REFERENCES REPORTS(id) ON DELETE CASCADE,
@@ -54,18 +63,25 @@ CREATE TABLE DETECTIONS (
 
     -- The geographic footprint (polygon) of the detection's bounding box.
     footprint SDO_GEOMETRY
+)
+PARTITION BY LIST (report_id) (
+    PARTITION P_INITIAL VALUES (0)
 );
 
 -- NOTIFICATIONS: Records triggered events when a detection matches a ruleset.
+-- Reference-partitioned on DETECTIONS, so each notification lives in the
+-- partition of its detection's report and is dropped together with it.
 CREATE TABLE NOTIFICATIONS (
     id INTEGER GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
     status VARCHAR2(50 CHAR) DEFAULT 'new',
     ruleset_id INTEGER NOT NULL REFERENCES RULESETS(id),
-    detection_id INTEGER NOT NULL REFERENCES DETECTIONS(id),
+    detection_id INTEGER NOT NULL,
     priority INTEGER,
     summary CLOB,
-    timestamp TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-);
+    timestamp TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT NOTIFICATIONS_DETECTION_FK FOREIGN KEY (detection_id) REFERENCES DETECTIONS(id) ON DELETE CASCADE
+)
+PARTITION BY REFERENCE (NOTIFICATIONS_DETECTION_FK);
 
 
 -- =============================================================================
@@ -93,13 +109,23 @@ COMMIT;
 -- Spatial indexes for fast geographic queries
 CREATE INDEX REPORTS_IMAGE_FOOTPRINT_IDX ON REPORTS(image_footprint) INDEXTYPE IS MDSYS.SPATIAL_INDEX_V2;
 CREATE INDEX REPORTS_AREA_OF_INTEREST_IDX ON REPORTS(area_of_interest) INDEXTYPE IS MDSYS.SPATIAL_INDEX_V2;
-CREATE INDEX DETECTIONS_FOOTPRINT_IDX ON DETECTIONS(footprint) INDEXTYPE IS MDSYS.SPATIAL_INDEX_V2;
+
+-- Local spatial index: one index partition per report partition, so dropping a
+-- report's partition drops its index partition instead of maintaining the index
+CREATE INDEX DETECTIONS_FOOTPRINT_IDX ON DETECTIONS(footprint) INDEXTYPE IS MDSYS.SPATIAL_INDEX_V2 LOCAL;
 
 -- Standard B-Tree indexes for fast queries
-CREATE INDEX DETECTIONS_REPORT_ID_FK_IDX ON DETECTIONS(report_id);
-CREATE INDEX REPORTS_STATUS_IDX ON REPORTS(status);
+CREATE INDEX DETECTIONS_REPORT_ID_FK_IDX ON DETECTIONS(report_id) LOCAL;
+-- status is nullable (new reports start without one); the constant second key
+-- keeps NULL-status rows in the index, so GROUP BY status in the dashboard
+-- stats can be answered from it instead of a full scan
+CREATE INDEX REPORTS_STATUS_IDX ON REPORTS(status, 0);
 CREATE INDEX REPORTS_AUTHOR_IDX ON REPORTS(author);
 
+-- Composite indexes backing keyset pagination ordered on (created_at, id)
+CREATE INDEX REPORTS_CREATED_AT_ID_IDX ON REPORTS(created_at, id);
+CREATE INDEX RULESETS_CREATED_AT_ID_IDX ON RULESETS(created_at, id);
+
 -- =============================================================================
 -- END OF SCRIPT
 -- =============================================================================
\ No newline at end of file
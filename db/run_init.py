@@ -9,10 +9,10 @@ and set up the Oracle Spatial database schema.
 import sys
 import os
 
-# Add the app directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from database import Database
+from app.database import Database
 
 
 def split_sql_statements(sql_content):
@@ -219,18 +219,37 @@ def run_init_script():
                 for meta in spatial_metadata:
                     print(f"      - {meta['TABLE_NAME']}.{meta['COLUMN_NAME']} (SRID: {meta['SRID']})")
             
+            # Check partitioning (DETECTIONS by report, NOTIFICATIONS by reference)
+            partitioned = db.execute_query("""
+                SELECT table_name, partitioning_type, autolist
+                FROM user_part_tables
+                WHERE table_name IN ('DETECTIONS', 'NOTIFICATIONS')
+                ORDER BY table_name
+            """)
+            
+            if partitioned:
+                print("   ✓ Partitioned tables:")
+                for table in partitioned:
+                    automatic = " AUTOMATIC" if table['AUTOLIST'] == 'YES' else ""
+                    print(f"      - {table['TABLE_NAME']} ({table['PARTITIONING_TYPE']}{automatic})")
+            
+            if len(partitioned) < 2:
+                print("   ⚠ DETECTIONS/NOTIFICATIONS are not partitioned; report deletes will cascade row by row")
+            
             # Check indexes
             indexes = db.execute_query("""
-                SELECT index_name, table_name, index_type
-                FROM user_indexes
-                WHERE table_name IN ('REPORTS', 'RULESETS', 'DETECTIONS')
-                ORDER BY table_name, index_name
+                SELECT i.index_name, i.table_name, i.index_type, p.locality
+                FROM user_indexes i
+                LEFT JOIN user_part_indexes p ON p.index_name = i.index_name
+                WHERE i.table_name IN ('REPORTS', 'RULESETS', 'DETECTIONS', 'NOTIFICATIONS')
+                ORDER BY i.table_name, i.index_name
             """)
             
             if indexes:
                 print("   ✓ Created indexes:")
                 for idx in indexes:
-                    print(f"      - {idx['INDEX_NAME']} on {idx['TABLE_NAME']} ({idx['INDEX_TYPE']})")
+                    locality = f", {idx['LOCALITY']}" if idx['LOCALITY'] else ""
+                    print(f"      - {idx['INDEX_NAME']} on {idx['TABLE_NAME']} ({idx['INDEX_TYPE']}{locality})")
             
         except Exception as e:
             print(f"   ⚠ Error verifying schema: {e}")
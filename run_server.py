@@ -12,6 +12,8 @@ import sys
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(__file__))
 
+from app.logging_config import configure_logging
+
 if __name__ == "__main__":
     # Get configuration from environment variables
     host = os.getenv("HOST", "0.0.0.0")
@@ -27,10 +29,16 @@ if __name__ == "__main__":
     print(f"API Documentation: http://{host}:{port}/docs")
     print(f"ReDoc Documentation: http://{host}:{port}/redoc")
     
+    # Route all logging, including uvicorn's, through the queue listener.
+    # log_config=None keeps uvicorn from installing its own blocking handlers;
+    # worker processes configure themselves again when importing app.main.
+    configure_logging(level=log_level)
+    
     uvicorn.run(
         "app.main:app",
         host=host,
         port=port,
         reload=reload,
-        log_level=log_level
+        log_level=log_level,
+        log_config=None
     )
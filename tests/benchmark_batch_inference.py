@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark for batched model inference.
+
+Runs ModelInferenceService.predict_batch on the same set of tiles with batch
+sizes 1, 4, 8 and 16 and reports images per second for each, followed by the
+batch size chosen by calibrate_batch_size. Tiles are cut from the test image
+(tests/images/test.png) or read from a directory of images.
+
+Inference runs on CPU unless --gpu is given. The model must be downloaded
+into the models directory.
+
+Usage:
+    python tests/benchmark_batch_inference.py --model yolov11n-coco [--tiles 32] [--tile-size 640]
+    python tests/benchmark_batch_inference.py --model 28 --images /path/to/tiles
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+TEST_IMAGE = Path(__file__).parent / "images" / "test.png"
+BATCH_SIZES = (1, 4, 8, 16)
+
+
+def make_tiles(image_path: Path, count: int, tile_size: int) -> list:
+    """
+    Cut tiles from an image, wrapping around it until count tiles are made.
+    """
+    import cv2
+    import numpy as np
+
+    image = cv2.imread(str(image_path))
+    if image is None:
+        raise SystemExit(f"Failed to read image: {image_path}")
+
+    # Pad small images so every tile has the full size
+    height, width = image.shape[:2]
+    if height < tile_size or width < tile_size:
+        image = cv2.copyMakeBorder(
+            image, 0, max(0, tile_size - height), 0, max(0, tile_size - width), cv2.BORDER_CONSTANT
+        )
+        height, width = image.shape[:2]
+
+    origins = [
+        (y, x)
+        for y in range(0, height - tile_size + 1, tile_size)
+        for x in range(0, width - tile_size + 1, tile_size)
+    ]
+    return [
+        np.ascontiguousarray(image[y:y + tile_size, x:x + tile_size])
+        for y, x in (origins[i % len(origins)] for i in range(count))
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched model inference")
+    parser.add_argument('--model', required=True, help="Model ID or name")
+    parser.add_argument('--images', help="Directory of images to use instead of tiles of the test image")
+    parser.add_argument('--tiles', type=int, default=32, help="Number of tiles cut from the test image")
+    parser.add_argument('--tile-size', type=int, default=640, help="Tile side in pixels")
+    parser.add_argument('--confidence', type=float, default=0.25, help="Confidence threshold")
+    parser.add_argument('--gpu', action='store_true', help="Use the GPU if available")
+    args = parser.parse_args()
+
+    if not args.gpu:
+        os.environ['CUDA_VISIBLE_DEVICES'] = ''
+
+    from app.services.model_inference_service import ModelInferenceService
+    from app.services.model_registry import get_model_registry
+
+    metadata = get_model_registry().find(args.model)
+    if metadata is None:
+        raise SystemExit(f"Model not found: {args.model}")
+
+    if args.images:
+        images = sorted(
+            str(path) for path in Path(args.images).iterdir()
+            if path.suffix.lower() in ('.png', '.jpg', '.jpeg', '.tif', '.tiff')
+        )
+    else:
+        images = make_tiles(TEST_IMAGE, args.tiles, args.tile_size)
+    if not images:
+        raise SystemExit("No images to run")
+
+    service = ModelInferenceService()
+    print("Batch Inference Benchmark")
+    print("=" * 70)
+    print(f"Model: {metadata['name']} (ID: {metadata['id']})")
+    print(f"Images: {len(images)}, device: {'gpu' if args.gpu else 'cpu'}")
+
+    if not service.load_model(metadata['id']):
+        raise SystemExit(f"Failed to load model {metadata['id']}")
+
+    # One untimed pass so the first measured batch size does not pay for initialization
+    service.predict_batch(metadata['id'], images[:1], confidence=args.confidence, batch_size=1)
+
+    print(f"   {'batch':>5} {'images/s':>10} {'detections':>11}")
+    for batch_size in BATCH_SIZES:
+        result = service.predict_batch(
+            metadata['id'], images, confidence=args.confidence, batch_size=batch_size
+        )
+        if not result['success']:
+            print(f"   {batch_size:>5} failed: {result['error']}")
+            continue
+        detections = sum(image.get('detection_count', 0) for image in result['results'])
+        print(f"   {batch_size:>5} {result['images_per_second']:>10.2f} {detections:>11}")
+
+    sample = service._load_image(images[0])
+    chosen = service.calibrate_batch_size(metadata['id'], sample, confidence=args.confidence)
+    print(f"Calibrated batch size: {chosen}")
+
+    service.unload_model(metadata['id'])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark for loading detections into the partitioned DETECTIONS table.
+
+Compares two ways of storing the detections of one report:
+
+- row:   one INSERT round trip per detection (DetectionBulkWriter with a
+         batch size of 1), with the spatial index maintained per row
+- batch: array DML with DetectionBulkWriter, index maintained per batch
+
+A staged partition-exchange load is not included until it has been run
+against an Oracle instance.
+
+Each run creates a throwaway report, loads synthetic detections with small
+polygon footprints and deletes the report and its partition again. The
+row-at-a-time method is skipped above --row-limit detections.
+
+This script needs the database credentials in .env and the wallet, like
+tests/test_real_db.py.
+
+Usage:
+    python tests/benchmark_detection_ingest.py [--sizes 10000,100000,1000000] [--row-limit 100000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import oracledb
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.database import Database
+from app.services.detection_writer import DetectionBulkWriter
+from app.services.report_service import ReportService
+
+
+CREATE_REPORT_QUERY = """
+    INSERT INTO REPORTS (name, status, bucket_img_path, author)
+    VALUES (:name, 'benchmark', 'benchmark/none.tif', 'benchmark')
+    RETURNING id INTO :new_id
+"""
+
+
+def make_detections(count: int, seed: int = 42) -> list:
+    """
+    Build synthetic detections scattered over a 1x1 degree scene.
+    """
+    rng = random.Random(seed)
+    detections = []
+    for _ in range(count):
+        x, y = rng.uniform(12.0, 13.0), rng.uniform(41.0, 42.0)
+        size = rng.uniform(0.00005, 0.0005)
+        px, py = rng.randint(0, 20000), rng.randint(0, 20000)
+        detections.append({
+            'class_name': rng.choice(['vehicle', 'ship', 'building', 'aircraft']),
+            'confidence': round(rng.uniform(0.25, 0.99), 4),
+            'pixel_bbox': [px, py, px + 32, py + 32],
+            'footprint': {
+                'type': 'Polygon',
+                'coordinates': [[[x, y], [x + size, y], [x + size, y + size], [x, y + size], [x, y]]]
+            }
+        })
+    return detections
+
+
+def run(db: Database, method: str, detections: list) -> dict:
+    """
+    Load detections into a fresh report with one method and time it end to end.
+    """
+    report_id = int(db.execute_returning(
+        CREATE_REPORT_QUERY,
+        {'name': f"ingest benchmark ({method}, {len(detections)})"},
+        {'new_id': oracledb.DB_TYPE_NUMBER}
+    )['new_id'])
+
+    batch_size = 1 if method == 'row' else None
+    writer = DetectionBulkWriter(db, report_id, 'benchmark', batch_size=batch_size)
+
+    try:
+        start = time.perf_counter()
+        with writer:
+            writer.add_many(detections)
+        elapsed = time.perf_counter() - start
+    finally:
+        ReportService(db).delete_report(report_id)
+
+    stats = writer.get_stats()
+    stats['total_seconds'] = elapsed
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark detection ingest methods")
+    parser.add_argument('--sizes', default='10000,100000,1000000', help="Comma-separated detection counts")
+    parser.add_argument('--methods', default='row,batch', help="Comma-separated methods to run")
+    parser.add_argument('--row-limit', type=int, default=100000, help="Largest size run row at a time")
+    parser.add_argument('--wallet', default=os.path.join(os.path.dirname(__file__), '..', 'db', 'wallet_oro.zip'))
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    methods = args.methods.split(',')
+
+    print("Detection Ingest Benchmark")
+    print("=" * 70)
+    print("1. Connecting to Oracle Autonomous Database...")
+    db = Database(wallet_path=args.wallet)
+    db.connect()
+
+    try:
+        print("2. Loading detections:")
+        print(f"   {'size':>9} {'method':<9} {'total s':>9} {'rows/s':>10} {'failed':>8}")
+        for size in sizes:
+            detections = make_detections(size)
+            for method in methods:
+                if method == 'row' and size > args.row_limit:
+                    print(f"   {size:>9} {method:<9} {'skipped (--row-limit)':>30}")
+                    continue
+
+                stats = run(db, method, detections)
+                print(
+                    f"   {size:>9} {method:<9} {stats['total_seconds']:>9.2f} "
+                    f"{stats['rows_written'] / stats['total_seconds']:>10.0f} {stats['rows_failed']:>8}"
+                )
+    finally:
+        db.disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the logging setup.
+
+Compares the time request threads spend in logging calls with:
+
+- basic: logging.basicConfig, the previous setup; every call formats the
+         message and writes it to the stream while holding the handler lock
+- queue: app.logging_config.configure_logging; calls only enqueue the
+         record, and a listener thread formats it as JSON and writes it
+
+The output stream simulates a terminal or journal with a fixed write latency
+(--write-us), which is what request threads wait on in the basic setup.
+Several threads log concurrently, like request handlers; a share of the
+records comes from app.query_metrics at DEBUG, which the queue setup samples.
+
+No database or network access is needed. Each setup runs in its own process
+because both install process-wide root handlers.
+
+Usage:
+    python tests/benchmark_logging.py [--threads 8] [--records 5000] [--write-us 50]
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+class SlowStream:
+    """Write-only stream that takes a fixed time per write."""
+
+    def __init__(self, write_seconds: float):
+        self.write_seconds = write_seconds
+        self.lines = 0
+
+    def write(self, text: str) -> int:
+        deadline = time.perf_counter() + self.write_seconds
+        while time.perf_counter() < deadline:
+            pass
+        self.lines += text.count("\n")
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def worker(records: int, latencies: list) -> None:
+    """
+    Log like a request handler: an INFO line, then per-statement DEBUG lines.
+    """
+    app_logger = logging.getLogger("app.services.report_service")
+    query_logger = logging.getLogger("app.query_metrics")
+    spent = 0.0
+    for i in range(records):
+        start = time.perf_counter()
+        if i % 4 == 0:
+            app_logger.info("Report %s status changed to %s", i, "processing")
+        else:
+            query_logger.debug("Query [%s] %.1f ms, %d rows", "3f2a9c1b7d10", 1.25, i)
+        spent += time.perf_counter() - start
+    latencies.append(spent)
+
+
+def run_setup(setup: str, threads: int, records: int, write_us: float) -> dict:
+    """
+    Run one setup in this process and return its timings.
+    """
+    stream = SlowStream(write_us / 1e6)
+    if setup == 'basic':
+        logging.basicConfig(level=logging.DEBUG, stream=stream)
+        listener = None
+    else:
+        from app.logging_config import configure_logging
+        listener = configure_logging(level='debug', log_format='json', stream=stream)
+
+    latencies = []
+    workers = [threading.Thread(target=worker, args=(records, latencies)) for _ in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    callers_done = time.perf_counter() - start
+
+    if listener is not None:
+        listener.stop()
+    drained = time.perf_counter() - start
+
+    total_records = threads * records
+    return {
+        'setup': setup,
+        'records': total_records,
+        'written': stream.lines,
+        'caller_us_per_record': sum(latencies) / total_records * 1e6,
+        'callers_seconds': callers_done,
+        'drained_seconds': drained
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the logging setup")
+    parser.add_argument('--threads', type=int, default=8, help="Concurrent logging threads")
+    parser.add_argument('--records', type=int, default=5000, help="Records per thread")
+    parser.add_argument('--write-us', type=float, default=50, help="Simulated stream write latency in microseconds")
+    parser.add_argument('--setup', choices=['basic', 'queue'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.setup:
+        print(json.dumps(run_setup(args.setup, args.threads, args.records, args.write_us)))
+        return
+
+    print("Logging Benchmark")
+    print("=" * 70)
+    print(f"{args.threads} threads x {args.records} records, {args.write_us:.0f} us per stream write")
+    print(f"   {'setup':<7} {'written':>9} {'caller us/rec':>14} {'callers s':>10} {'drained s':>10}")
+    for setup in ('basic', 'queue'):
+        output = subprocess.run(
+            [sys.executable, __file__, '--setup', setup, '--threads', str(args.threads),
+             '--records', str(args.records), '--write-us', str(args.write_us)],
+            capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"   {result['setup']:<7} {result['written']:>9} {result['caller_us_per_record']:>14.1f} "
+            f"{result['callers_seconds']:>10.2f} {result['drained_seconds']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark for SDO_GEOMETRY to GeoJSON decoding on the report read path.
+
+Decodes a page of 100 reports, each carrying a 1,000-vertex area_of_interest,
+with the slicing decoder used by ReportService and, for comparison, with:
+
+- numpy:        SDO_ORDINATES read into one array, reshaped to positions and
+                split at the SDO_ELEM_INFO offsets
+- geojson text: json.loads of the text SDO_UTIL.TO_GEOJSON returns (only the
+                client-side parse; the server-side conversion and the larger
+                transfer are not included)
+- python loop:  one vertex at a time
+
+The geometries are built in memory with the same attribute layout oracledb
+exposes for MDSYS.SDO_GEOMETRY, so no database connection is needed.
+
+Usage:
+    python tests/benchmark_sdo_decoding.py [--reports 100] [--vertices 1000] [--repeat 20]
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.models import GeometryBase
+from app.services.sdo_geometry import geojson_to_sdo_parts, sdo_to_geojson
+
+
+class _Collection:
+    """Stand-in for an oracledb collection object."""
+
+    def __init__(self, values):
+        self._values = values
+
+    def aslist(self):
+        return list(self._values)
+
+
+class _Geometry:
+    """Stand-in for an oracledb MDSYS.SDO_GEOMETRY object."""
+
+    def __init__(self, geometry):
+        gtype, _, elem_info, ordinates = geojson_to_sdo_parts(geometry['type'], geometry['coordinates'])
+        self.SDO_GTYPE = gtype
+        self.SDO_SRID = 4326
+        self.SDO_POINT = None
+        self.SDO_ELEM_INFO = _Collection(elem_info)
+        self.SDO_ORDINATES = _Collection(ordinates)
+        # What SDO_UTIL.TO_GEOJSON would return for this geometry
+        self.geojson = json.dumps(geometry)
+
+
+def make_polygon(vertices: int, offset: float) -> dict:
+    """
+    Build a closed polygon with the given number of vertices.
+    """
+    ring = [
+        [offset + math.cos(2 * math.pi * i / vertices), offset + math.sin(2 * math.pi * i / vertices)]
+        for i in range(vertices)
+    ]
+    ring.append(ring[0])
+    return {'type': 'Polygon', 'coordinates': [ring]}
+
+
+def decode_loop(sdo) -> dict:
+    """
+    Decode a single-ring polygon one vertex at a time, for comparison.
+    """
+    ordinates = sdo.SDO_ORDINATES.aslist()
+    ring = []
+    for i in range(0, len(ordinates), 2):
+        ring.append([float(ordinates[i]), float(ordinates[i + 1])])
+    return {'type': 'Polygon', 'coordinates': [ring]}
+
+
+def decode_numpy(sdo) -> dict:
+    """
+    Decode a polygon through a NumPy reshape split by SDO_ELEM_INFO, for comparison.
+    """
+    positions = np.asarray(sdo.SDO_ORDINATES.aslist(), dtype=np.float64).reshape(-1, 2)
+    starts = [(offset - 1) // 2 for offset in sdo.SDO_ELEM_INFO.aslist()[0::3]]
+    return {'type': 'Polygon', 'coordinates': [ring.tolist() for ring in np.split(positions, starts[1:])]}
+
+
+def decode_geojson_text(sdo) -> dict:
+    """
+    Parse the GeoJSON text a server-side SDO_UTIL.TO_GEOJSON returns, for comparison.
+    """
+    return json.loads(sdo.geojson)
+
+
+def run(label: str, decode, page, repeat: int) -> float:
+    """
+    Time decoding of a page, including the GeometryBase the response builds.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for sdo in page:
+            GeometryBase(**decode(sdo))
+        best = min(best, time.perf_counter() - start)
+    print(f"   {label:<12} {best * 1000:8.2f} ms/page")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SDO_GEOMETRY decoding")
+    parser.add_argument('--reports', type=int, default=100, help="Reports per page")
+    parser.add_argument('--vertices', type=int, default=1000, help="Vertices per area_of_interest")
+    parser.add_argument('--repeat', type=int, default=20, help="Timed repetitions (best is reported)")
+    args = parser.parse_args()
+
+    print("SDO_GEOMETRY Decoding Benchmark")
+    print("=" * 50)
+    print(f"1. Building {args.reports} geometries with {args.vertices} vertices each...")
+    page = [_Geometry(make_polygon(args.vertices, i)) for i in range(args.reports)]
+
+    print("2. Checking decoders agree...")
+    assert sdo_to_geojson(page[0]) == decode_loop(page[0]) == decode_numpy(page[0])
+    assert sdo_to_geojson(page[0]) == decode_geojson_text(page[0])
+
+    print(f"3. Decoding (best of {args.repeat}):")
+    slicing_time = run("slicing", sdo_to_geojson, page, args.repeat)
+    run("numpy", decode_numpy, page, args.repeat)
+    run("geojson text", decode_geojson_text, page, args.repeat)
+    loop_time = run("python loop", decode_loop, page, args.repeat)
+    print(f"   speedup      {loop_time / slicing_time:8.2f}x over the loop")
+
+
+if __name__ == "__main__":
+    main()
@@ -169,20 +169,9 @@ def find_model_by_folder_pattern(service, pattern):
     Returns:
         Model ID or None if not found
     """
-    models_dir = service.models_dir
-    if not models_dir.exists():
-        return None
-    
-    for model_folder in sorted(models_dir.iterdir()):
-        if model_folder.is_dir() and pattern in model_folder.name.lower():
-            metadata_file = model_folder / "metadata.json"
-            if metadata_file.exists():
-                try:
-                    with open(metadata_file, 'r') as f:
-                        metadata = json.load(f)
-                        return metadata.get('id')
-                except:
-                    continue
+    for model in sorted(service.registry.list_models(), key=lambda model: model['folder']):
+        if pattern in model['folder'].lower():
+            return model['id']
     return None
 
 
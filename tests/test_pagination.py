@@ -0,0 +1,117 @@
+"""
+Tests for the cursor pagination helpers in app/services/pagination.py.
+
+No database is needed.
+"""
+
+import base64
+import json
+from datetime import datetime
+
+import pytest
+
+from app.services.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+    keyset_params,
+    paginate_rows,
+)
+
+
+CREATED_AT = datetime(2025, 3, 14, 9, 26, 53, 589793)
+
+
+def make_rows(count, total=None):
+    """Rows shaped like the paginated list queries return them."""
+    rows = []
+    for i in range(count):
+        row = {'ID': 100 - i, 'SORT_CREATED_AT': datetime(2025, 3, 14, 9, 0, 59 - i, 1000 * i)}
+        if total is not None:
+            row['TOTAL_COUNT'] = total
+        rows.append(row)
+    return rows
+
+
+def test_cursor_round_trip():
+    token = encode_cursor(CREATED_AT, 42)
+
+    assert '=' not in token
+    assert decode_cursor(token) == ('2025-03-14 09:26:53.589793', 42)
+
+
+def test_cursor_is_url_safe():
+    for row_id in range(200):
+        token = encode_cursor(CREATED_AT, row_id)
+        assert all(c.isalnum() or c in '-_' for c in token)
+        assert decode_cursor(token)[1] == row_id
+
+
+@pytest.mark.parametrize('token', [
+    '',
+    'not a cursor',
+    '!!!!',
+    base64.urlsafe_b64encode(b'{"a": 1}').decode(),
+    base64.urlsafe_b64encode(json.dumps(['yesterday', 1]).encode()).decode(),
+    base64.urlsafe_b64encode(json.dumps(['2025-03-14 09:26:53.589793', 'x']).encode()).decode(),
+    base64.urlsafe_b64encode(json.dumps(['2025-03-14 09:26:53.589793', 1, 2]).encode()).decode(),
+])
+def test_decode_cursor_rejects_garbage(token):
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        decode_cursor(token)
+
+
+def test_decode_cursor_rejects_tampered_token():
+    token = encode_cursor(CREATED_AT, 42)
+
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        decode_cursor(token[:-3])
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        decode_cursor('x' + token)
+
+
+def test_keyset_params():
+    token = encode_cursor(CREATED_AT, 7)
+
+    assert keyset_params(None) == {}
+    assert keyset_params(token) == {
+        'cursor_created_at': '2025-03-14 09:26:53.589793',
+        'cursor_id': 7,
+    }
+    with pytest.raises(ValueError):
+        keyset_params('garbage')
+
+
+def test_keyset_condition_follows_direction():
+    descending = keyset_condition(True)
+    ascending = keyset_condition(False)
+
+    assert 'created_at <= ' in descending and 'id < :cursor_id' in descending
+    assert 'created_at >= ' in ascending and 'id > :cursor_id' in ascending
+    assert ':cursor_created_at' in descending
+
+
+def test_paginate_rows_keyset_with_next_page():
+    rows = make_rows(4)
+    page, total, next_cursor = paginate_rows(rows, per_page=3, keyset=True)
+
+    assert page == rows[:3]
+    assert total is None
+    # The cursor points at the last row of the page, not the extra row
+    assert decode_cursor(next_cursor) == (
+        rows[2]['SORT_CREATED_AT'].strftime('%Y-%m-%d %H:%M:%S.%f'), rows[2]['ID']
+    )
+
+
+def test_paginate_rows_keyset_last_page():
+    rows = make_rows(3)
+
+    assert paginate_rows(rows, per_page=3, keyset=True) == (rows, None, None)
+    assert paginate_rows([], per_page=3, keyset=True) == ([], None, None)
+
+
+def test_paginate_rows_offset():
+    rows = make_rows(3, total=57)
+
+    assert paginate_rows(rows, per_page=3, keyset=False) == (rows, 57, None)
+    assert paginate_rows([], per_page=3, keyset=False) == ([], None, None)
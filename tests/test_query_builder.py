@@ -0,0 +1,140 @@
+"""
+Tests for the statement builders in app/services/query_builder.py and the
+statement fingerprint in app/query_metrics.py.
+
+No database is needed.
+"""
+
+import re
+
+from app.query_metrics import fingerprint
+from app.services.query_builder import (
+    IN_LIST_BUCKETS,
+    MAX_IN_LIST_SIZE,
+    fixed_update,
+    fixed_update_params,
+    in_list_bucket,
+    in_list_condition,
+)
+
+
+def bind_names(condition):
+    """Bind names of a condition, in order."""
+    return re.findall(r":(\w+)", condition)
+
+
+def test_in_list_bucket_picks_smallest_bucket():
+    assert in_list_bucket(1) == 1
+    assert in_list_bucket(3) == 4
+    assert in_list_bucket(64) == 64
+    assert in_list_bucket(65) == 128
+    assert in_list_bucket(513) == 1000
+    assert in_list_bucket(MAX_IN_LIST_SIZE) == MAX_IN_LIST_SIZE
+
+
+def test_in_list_condition_pads_to_bucket_with_last_value():
+    condition, params = in_list_condition("r.id", [5, 6, 7], "rid")
+
+    assert condition == "r.id IN (:rid_0,:rid_1,:rid_2,:rid_3)"
+    assert params == {"rid_0": 5, "rid_1": 6, "rid_2": 7, "rid_3": 7}
+
+
+def test_in_list_condition_deduplicates_before_padding():
+    condition, params = in_list_condition("id", [3, 3, 1, 3, 1], "p")
+
+    assert condition == "id IN (:p_0,:p_1)"
+    assert params == {"p_0": 3, "p_1": 1}
+
+
+def test_in_list_condition_text_only_depends_on_bucket():
+    texts = {in_list_condition("id", list(range(count)), "p")[0] for count in range(5, 9)}
+
+    assert len(texts) == 1
+
+
+def test_in_list_condition_every_size_uses_a_bucket():
+    shapes = set()
+    for count in range(1, MAX_IN_LIST_SIZE + 1):
+        condition, params = in_list_condition("id", list(range(count)), "p")
+        assert len(params) in IN_LIST_BUCKETS
+        assert set(params.values()) == set(range(count))
+        shapes.add(condition)
+
+    assert len(shapes) == len(IN_LIST_BUCKETS)
+
+
+def test_in_list_condition_splits_above_max_size():
+    values = list(range(MAX_IN_LIST_SIZE + 3))
+    condition, params = in_list_condition("id", values, "p")
+
+    assert condition.startswith("(") and condition.endswith(")")
+    lists = condition[1:-1].split(" OR ")
+    assert len(lists) == 2
+    assert len(bind_names(lists[0])) == MAX_IN_LIST_SIZE
+    # The remaining 3 values are padded to the bucket of 4
+    assert len(bind_names(lists[1])) == 4
+    assert params[bind_names(lists[1])[-1]] == values[-1]
+
+    # Bind names are unique across the OR-ed lists
+    assert len(set(bind_names(condition))) == len(params)
+    assert set(params.values()) == set(values)
+
+
+def test_in_list_condition_empty_is_never_true():
+    assert in_list_condition("id", [], "p") == ("1 = 0", {})
+
+
+def test_fixed_update_sets_every_column_through_a_flag():
+    query = fixed_update("REPORTS", ["name", "status"], "id = :report_id")
+
+    assert "UPDATE REPORTS" in query
+    assert "name = CASE WHEN :set_name = 1 THEN :name ELSE name END" in query
+    assert "status = CASE WHEN :set_status = 1 THEN :status ELSE status END" in query
+    assert "updated_at = CURRENT_TIMESTAMP" in query
+    assert query.strip().endswith("WHERE id = :report_id")
+
+
+def test_fixed_update_params_flags_supplied_columns():
+    params = fixed_update_params(["name", "status", "author"], {"status": "completed", "author": None})
+
+    assert params == {
+        "set_name": 0, "name": None,
+        "set_status": 1, "status": "completed",
+        # A column supplied as None is set to NULL, not kept
+        "set_author": 1, "author": None,
+    }
+
+
+def test_fixed_update_params_bind_every_statement_bind():
+    columns = ["name", "status"]
+    query = fixed_update("REPORTS", columns, "id = :report_id")
+    params = fixed_update_params(columns, {"name": "x"})
+
+    assert set(bind_names(query)) - {"report_id"} == set(params)
+
+
+def test_fingerprint_replaces_literals():
+    assert (
+        fingerprint("SELECT * FROM REPORTS WHERE status = 'completed' AND id = 42")
+        == "SELECT * FROM REPORTS WHERE status = ? AND id = ?"
+    )
+    assert fingerprint("SELECT 'it''s', 1.5 FROM DUAL") == "SELECT ?, ? FROM DUAL"
+
+
+def test_fingerprint_keeps_binds_and_identifiers():
+    assert (
+        fingerprint("SELECT id FROM T1 WHERE id = :report_id2")
+        == "SELECT id FROM T1 WHERE id = :report_id2"
+    )
+
+
+def test_fingerprint_collapses_bind_and_literal_lists():
+    short = fingerprint("SELECT id FROM RULESETS WHERE id IN (:p_0,:p_1)")
+    long = fingerprint("SELECT id FROM RULESETS WHERE id IN (:p_0, :p_1, :p_2, :p_3)")
+    literals = fingerprint("SELECT id FROM RULESETS WHERE id IN (1, 2, 3)")
+
+    assert short == long == literals == "SELECT id FROM RULESETS WHERE id IN (...)"
+
+
+def test_fingerprint_collapses_whitespace():
+    assert fingerprint("\n  SELECT id\n\tFROM   REPORTS  \n") == "SELECT id FROM REPORTS"
@@ -9,10 +9,10 @@ from the .env file.
 import sys
 import os
 
-# Add the app directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from database import Database
+from app.database import Database
 
 
 def test_real_connection():
@@ -0,0 +1,55 @@
+"""
+Tests for the GeoJSON <-> SDO_GEOMETRY conversion in app/services/sdo_geometry.py.
+
+No database is needed.
+"""
+
+from app.services.sdo_geometry import (
+    ETYPE_EXTERIOR_RING,
+    ETYPE_INTERIOR_RING,
+    GTYPE_POLYGON,
+    geojson_to_sdo_parts,
+    sdo_parts_to_geojson,
+)
+
+
+SQUARE = [[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]
+HOLE = [[0.25, 0.25], [0.25, 0.75], [0.75, 0.75], [0.75, 0.25], [0.25, 0.25]]
+
+
+def test_polygon_round_trip():
+    gtype, point, elem_info, ordinates = geojson_to_sdo_parts('Polygon', [SQUARE, HOLE])
+
+    assert (gtype, point) == (GTYPE_POLYGON, None)
+    assert elem_info == [1, ETYPE_EXTERIOR_RING, 1, 11, ETYPE_INTERIOR_RING, 1]
+    assert sdo_parts_to_geojson(gtype, point, elem_info, ordinates) == {
+        'type': 'Polygon', 'coordinates': [SQUARE, HOLE]
+    }
+
+
+def test_rings_are_oriented_for_oracle():
+    clockwise_exterior = SQUARE[::-1]
+    counterclockwise_hole = HOLE[::-1]
+
+    parts = geojson_to_sdo_parts('Polygon', [clockwise_exterior, counterclockwise_hole])
+
+    assert sdo_parts_to_geojson(*parts)['coordinates'] == [SQUARE, HOLE]
+
+
+def test_positions_with_elevation_are_stored_in_two_dimensions():
+    ring = [[0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 0, 1]]
+
+    gtype, point, elem_info, ordinates = geojson_to_sdo_parts('Polygon', [ring])
+
+    assert gtype == GTYPE_POLYGON
+    assert ordinates == [0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 0.0]
+    # Clockwise with elevation: reversed like a 2D ring would be
+    ring = ring[::-1]
+    parts = geojson_to_sdo_parts('MultiPolygon', [[ring]])
+    assert parts[3] == [0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 0.0]
+
+
+def test_optimized_rectangle_is_expanded():
+    geometry = sdo_parts_to_geojson(GTYPE_POLYGON, None, [1, ETYPE_EXTERIOR_RING, 3], [0, 0, 2, 1])
+
+    assert geometry == {'type': 'Polygon', 'coordinates': [[[0, 0], [2, 0], [2, 1], [0, 1], [0, 0]]]}